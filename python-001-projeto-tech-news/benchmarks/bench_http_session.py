@@ -0,0 +1,79 @@
+"""
+Compara o GET por chamada (`requests.get`, uma conexão nova a cada
+requisição) com a sessão compartilhada de `tech_news.http_session`,
+usando um servidor HTTP local no lugar do blog.
+
+    python -m benchmarks.bench_http_session --requests 500 --workers 8
+"""
+
+import argparse
+import gzip
+import pathlib
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.local_server import serve
+from tech_news import http_session
+
+PAGE = gzip.compress(
+    pathlib.Path("tests/assets/trybe_pages/novidades.html").read_bytes()
+)
+HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "Content-Encoding": "gzip",
+}
+
+
+def _respond(path, headers):
+    return 200, HEADERS, PAGE
+
+
+def _per_call_get(url):
+    return requests.get(url, timeout=3)
+
+
+def _run(get, base_url, total, workers):
+    urls = [f"{base_url}/noticia/{index}" for index in range(total)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for response in executor.map(get, urls):
+            assert response.status_code == 200
+    return time.perf_counter() - start
+
+
+def _report(name, elapsed, total):
+    print(f"{name:<14} {total / elapsed:9.1f} req/s  ({elapsed:.3f}s)")
+
+
+def _report_timings():
+    timings = http_session.get_timings()
+    for field in ("connect", "ttfb", "transfer"):
+        values = [getattr(timing, field) * 1000 for timing in timings]
+        print(f"  {field:<9} mean {statistics.mean(values):.3f} ms")
+    reused = sum(1 for timing in timings if timing.connect == 0)
+    print(f"  conexões reaproveitadas: {reused}/{len(timings)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    http_session.configure_pool(args.workers)
+    with serve(_respond) as base_url:
+        for name, get in (
+            ("requests.get", _per_call_get),
+            ("http_session", http_session.get),
+        ):
+            http_session.clear_timings()
+            elapsed = _run(get, base_url, args.requests, args.workers)
+            _report(name, elapsed, args.requests)
+        _report_timings()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compara número de grupos e tempo das estratégias de
+`tech_news.analyzer.packing` e do encaixe linear anterior do
+`ReadingPlanService`, com tempos de leitura sintéticos.
+
+    python -m benchmarks.bench_packing --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+
+from tech_news.analyzer import packing
+from tech_news.analyzer.reading_plan import ReadingPlanService
+
+
+def _legacy(sizes, capacity):
+    """O agrupamento O(n²) de antes, via `_fit_to_existing_group`."""
+    result = {"readable": [], "unreadable": []}
+    for index, size in enumerate(sizes):
+        new = {"title": index, "reading_time": size}
+        if not ReadingPlanService._fit_to_existing_group(result, new):
+            ReadingPlanService._register_readable(capacity, result, new)
+    return result["readable"]
+
+
+def _measure(pack, sizes, capacity):
+    start = time.perf_counter()
+    groups = pack(sizes, capacity)
+    return len(groups), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--available-time", type=int, default=30)
+    parser.add_argument("--max-reading-time", type=int, default=15)
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=20_000,
+        help="maior entrada medida com o encaixe quadrático anterior",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    strategies = {"anterior": _legacy, **packing.STRATEGIES}
+    print(
+        f"{'notícias':>9} {'estratégia':<22} {'grupos':>9} {'tempo (s)':>10}"
+    )
+    for amount in args.sizes:
+        sizes = [rng.randint(1, args.max_reading_time) for _ in range(amount)]
+        for name, pack in strategies.items():
+            if name == "anterior" and amount > args.legacy_limit:
+                continue
+            groups, seconds = _measure(pack, sizes, args.available_time)
+            print(f"{amount:>9} {name:<22} {groups:>9} {seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Mede quantas páginas por segundo cada backend de `tech_news.parsing`
+raspa, usando os HTMLs de `tests/assets/trybe_pages`.
+
+    python -m benchmarks.bench_parsers --rounds 5
+"""
+
+import argparse
+import pathlib
+import time
+
+from tech_news import parsing, scraper
+
+PAGES_PATH = pathlib.Path("tests/assets/trybe_pages")
+ARTICLES = [path.read_text() for path in PAGES_PATH.glob("noticias/*.html")]
+LISTINGS = [path.read_text() for path in PAGES_PATH.glob("novidades*.html")]
+
+
+def _pages_per_second(extract, pages, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html_content in pages:
+            extract(html_content)
+    return len(pages) * rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'backend':<12} {'notícias/s':>12} {'listagens/s':>12}")
+    for backend in parsing.BACKENDS:
+        parsing.DEFAULT_BACKEND = backend
+        articles = _pages_per_second(
+            scraper.scrape_news, ARTICLES, args.rounds
+        )
+        listings = _pages_per_second(
+            scraper._scrape_listing_page, LISTINGS, args.rounds
+        )
+        print(f"{backend:<12} {articles:12.1f} {listings:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
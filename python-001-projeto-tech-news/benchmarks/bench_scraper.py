@@ -0,0 +1,294 @@
+"""
+Mede a vazão de `get_tech_news` de ponta a ponta (download, raspagem e
+gravação) contra um blog falso servido localmente a partir dos HTMLs de
+`tests/assets/trybe_pages`, com paginação sintética, latência e erros
+injetados. O servidor roda em outro processo para não pesar na CPU
+medida. O resultado é salvo em JSON; `--compare` mostra a variação em
+relação a uma execução anterior.
+
+    python -m benchmarks.bench_scraper --news 500 --latency-ms 20
+    python -m benchmarks.bench_scraper --compare benchmarks/results/x.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import pathlib
+import platform
+import random
+import re
+import resource
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime
+
+from benchmarks.local_server import serve
+from tech_news import database, http_session, scraper
+
+PAGES_PATH = pathlib.Path("tests/assets/trybe_pages")
+RESULTS_PATH = pathlib.Path("benchmarks/results")
+HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+
+ARTICLE_LINK = re.compile(r'href="[^"]*"(?= class="cs-overlay-link")')
+NEXT_LINK = re.compile(r'class="next page-numbers" href="[^"]*"')
+CANONICAL = re.compile(r'(<link rel="canonical" href=")[^"]*"')
+TITLE = re.compile(r'<h1 class="entry-title">')
+PAGE_PATH = re.compile(r"^/(?:page/(\d+)/)?$")
+
+LISTING = (PAGES_PATH / "novidades.html").read_text()
+LINKS_PER_PAGE = len(ARTICLE_LINK.findall(LISTING))
+
+# métricas comparadas com `--compare` (maior é melhor?)
+METRICS = {
+    "pages_per_second": True,
+    "bytes_per_second": True,
+    "cpu_ms_per_page": False,
+    "peak_rss_mb": False,
+}
+
+
+class FakeBlog:
+    """
+    Responde como o blog: `/` e `/page/<n>/` são listagens feitas a
+    partir de `novidades.html`, cada uma com links para notícias únicas,
+    e cada notícia é um dos HTMLs de `noticias/` com a URL trocada.
+    """
+
+    def __init__(self, pages, latency, jitter, error_rate, seed):
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.listing = LISTING
+        self.articles = [
+            path.read_text()
+            for path in sorted(PAGES_PATH.glob("noticias/*.html"))
+        ]
+        self.served = {"pages": 0, "bytes": 0, "errors": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, path, headers):
+        base_url = f"http://{headers['Host']}"
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            failed = self._rng.random() < self.error_rate
+        time.sleep(delay)
+        if failed:
+            return self._count(503, b"")
+
+        page = PAGE_PATH.match(path)
+        if page:
+            body = self._listing(base_url, int(page.group(1) or 1))
+        else:
+            body = self._article(base_url + path)
+        return self._count(200 if body else 404, body.encode())
+
+    def _count(self, status, body):
+        with self._lock:
+            if status == 200:
+                self.served["pages"] += 1
+                self.served["bytes"] += len(body)
+            else:
+                self.served["errors"] += 1
+        return status, HEADERS, body
+
+    def _listing(self, base_url, number):
+        if number > self.pages:
+            return ""
+        links = iter(range(LINKS_PER_PAGE))
+        html_content = ARTICLE_LINK.sub(
+            lambda _: f'href="{base_url}/noticias/p{number}-{next(links)}/"',
+            self.listing,
+        )
+        # a última página fica sem o link para a próxima
+        next_link = (
+            'class="page-numbers" href="#"'
+            if number == self.pages
+            else f'class="next page-numbers" href="{base_url}/page/'
+            f'{number + 1}/"'
+        )
+        return NEXT_LINK.sub(next_link, html_content)
+
+    def _article(self, url):
+        # crc32, e não hash(), para a escolha não variar entre execuções
+        template = self.articles[zlib.crc32(url.encode()) % len(self.articles)]
+        html_content = CANONICAL.sub(rf'\g<1>{url}"', template)
+        # título único: cópias idênticas seriam puladas pela deduplicação
+        return TITLE.sub(
+            lambda match: f"{match.group(0)}{url} ", html_content, count=1
+        )
+
+
+def _run_server(blog_options, connection):
+    blog = FakeBlog(*blog_options)
+    with serve(blog) as base_url:
+        connection.send(base_url)
+        connection.recv()
+    connection.send(blog.served)
+
+
+def _cpu_seconds():
+    usage = [
+        resource.getrusage(who)
+        for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)
+    ]
+    return sum(item.ru_utime + item.ru_stime for item in usage)
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # o Linux informa em KiB, o macOS em bytes
+    return peak / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def _crawl(args, base_url):
+    scraper.BASE_URL = base_url
+    scraper.configure_rate_limiter(args.max_rate, burst=args.workers)
+    scraper.fetch_stats.reset()
+    http_session.configure_pool(args.workers)
+
+    cpu, start = _cpu_seconds(), time.perf_counter()
+    news = scraper.get_tech_news(
+        args.news, workers=args.workers, processes=args.processes
+    )
+    return {
+        "news": len(news),
+        "seconds": time.perf_counter() - start,
+        "cpu_seconds": _cpu_seconds() - cpu,
+        "fetch_stats": scraper.fetch_stats.snapshot(),
+    }
+
+
+def _measure(args):
+    blog_options = (
+        args.pages or -(-args.news // LINKS_PER_PAGE) + 1,
+        args.latency_ms / 1000,
+        args.jitter_ms / 1000,
+        args.error_rate,
+        args.seed,
+    )
+    connection, server_connection = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=_run_server, args=(blog_options, server_connection), daemon=True
+    )
+    server.start()
+    try:
+        run = _crawl(args, connection.recv())
+    finally:
+        connection.send("stop")
+        served = connection.recv()
+        server.join()
+    return run, served
+
+
+def _results(run, served):
+    seconds = run["seconds"]
+    pages = served["pages"]
+    return {
+        **run,
+        "pages": pages,
+        "bytes": served["bytes"],
+        "server_errors": served["errors"],
+        "pages_per_second": pages / seconds,
+        "bytes_per_second": served["bytes"] / seconds,
+        "cpu_ms_per_page": run["cpu_seconds"] * 1000 / max(pages, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _verdict(change, higher_is_better):
+    if abs(change) < 0.05:
+        return "igual"
+    return "melhor" if (change > 0) == higher_is_better else "pior"
+
+
+def _report(results, previous=None):
+    for metric, higher_is_better in METRICS.items():
+        line = f"{metric:<18} {results[metric]:14.2f}"
+        if previous:
+            old = previous["results"][metric]
+            change = (results[metric] - old) / old * 100 if old else 0.0
+            line += f"  {change:+7.1f}% {_verdict(change, higher_is_better)}"
+        print(line)
+    print(f"{results['news']} notícias em {results['seconds']:.2f}s")
+
+
+def _save(args, results):
+    output = args.output or RESULTS_PATH / (
+        f"bench_scraper-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output = pathlib.Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    parameters = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "compare")
+    }
+    document = {
+        "benchmark": "bench_scraper",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "parameters": parameters,
+        "results": results,
+    }
+    output.write_text(json.dumps(document, indent=2) + "\n")
+    return output
+
+
+def _parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--news", type=int, default=200)
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=0,
+        help="páginas de listagem (0: o bastante para --news)",
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=0)
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=1000,
+        help="requisições por segundo permitidas pelo limitador",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0,
+        help="fração das respostas que viram 503",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--backend",
+        choices=sorted(database.CLIENT_BACKENDS),
+        default="memory",
+    )
+    parser.add_argument("--database", default="tech_news_bench")
+    parser.add_argument("--output", help="arquivo JSON do resultado")
+    parser.add_argument("--compare", help="JSON de uma execução anterior")
+    return parser
+
+
+def main():
+    args = _parser().parse_args()
+    database.configure(args.backend, args.database)
+    database.get_client().drop_database(args.database)
+
+    results = _results(*_measure(args))
+    database.get_client().drop_database(args.database)
+
+    previous = None
+    if args.compare:
+        previous = json.loads(pathlib.Path(args.compare).read_text())
+    _report(results, previous)
+    print(f"resultado salvo em {_save(args, results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compara a latência (p50/p99) das buscas por título e por categoria com
+regex (varredura da coleção) e com os índices do título e de collation,
+sobre notícias sintéticas num banco separado do MongoDB.
+
+    python -m benchmarks.bench_search --documents 100000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from tech_news import database
+from tech_news.analyzer import search_engine
+
+WORDS = [
+    "python",
+    "dados",
+    "carreira",
+    "javascript",
+    "mercado",
+    "programação",
+    "segurança",
+    "nuvem",
+    "algoritmos",
+    "frontend",
+    "backend",
+    "testes",
+]
+CATEGORIES = [
+    "Tecnologia",
+    "Ferramentas",
+    "Novidades",
+    "Desenvolvimento web",
+    "Linguagem de programação",
+    "Carreira",
+]
+
+
+def _synthetic_news(index, rng):
+    return {
+        "url": f"https://blog.betrybe.com/bench/{index}/",
+        "title": " ".join(rng.sample(WORDS, 4)) + f" {index}",
+        "timestamp": "04/04/2021",
+        "writer": "Bench",
+        "reading_time": rng.randint(1, 15),
+        "summary": "Notícia sintética para o benchmark de busca.",
+        "category": rng.choice(CATEGORIES),
+    }
+
+
+def _seed(collection, documents, rng, batch_size=10_000):
+    collection.drop()
+    for start in range(0, documents, batch_size):
+        end = min(start + batch_size, documents)
+        collection.insert_many(
+            [_synthetic_news(index, rng) for index in range(start, end)]
+        )
+
+
+def _latencies(search, terms):
+    latencies = []
+    for term in terms:
+        start = time.perf_counter()
+        search(term)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(name, latencies):
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<28} {percentiles[49]:10.2f} {percentiles[98]:10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--database", default="tech_news_bench")
+    parser.add_argument(
+        "--backend",
+        choices=sorted(database.CLIENT_BACKENDS),
+        default=database.DB_BACKEND,
+        help="'memory' roda sem MongoDB (e sem índices: tudo vira regex)",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # as buscas e os índices passam a usar o banco do benchmark
+    database.configure(args.backend, args.database)
+    _seed(database.db.news, args.documents, rng)
+
+    titles = [rng.choice(WORDS) for _ in range(args.queries)]
+    categories = [rng.choice(CATEGORIES).upper() for _ in range(args.queries)]
+
+    print(f"{'busca':<28} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    _report(
+        "título, regex",
+        _latencies(
+            lambda title: search_engine._regex_search("title", title), titles
+        ),
+    )
+    _report(
+        "categoria, regex",
+        _latencies(
+            lambda category: list(
+                search_engine._stream(
+                    {"category": search_engine._whole_regex_query(category)}
+                )
+            ),
+            categories,
+        ),
+    )
+
+    database.ensure_search_indexes()
+    _report(
+        "título, regex no índice",
+        _latencies(search_engine.search_by_title, titles),
+    )
+    _report(
+        "categoria, índice collation",
+        _latencies(search_engine.search_by_category, categories),
+    )
+    database.get_client().drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import threading
+from contextlib import contextmanager
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+# recebe o path e os cabeçalhos de um GET e devolve (status, headers, body)
+Responder = Callable[[str, Message], tuple[int, dict, bytes]]
+
+
+def _handler_for(responder: Responder):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 mantém a conexão aberta entre requisições (keep-alive)
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            status, headers, body = responder(self.path, self.headers)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def serve(responder: Responder) -> Iterator[str]:
+    """
+    Sobe um servidor HTTP local numa porta livre enquanto o bloco
+    `with` estiver ativo, devolvendo a URL base dele.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(responder))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -15,6 +15,11 @@ setup(
         "console_scripts": [
             "tech-news-collector=tech_news.menu:collector_menu",
             "tech-news-analyzer=tech_news.menu:analyzer_menu",
+            "tech-news-analyzer-batch=tech_news.menu:analyzer_batch",
+            "tech-news-reconcile=tech_news.menu:reconcile_menu",
+            "tech-news-migrate=tech_news.menu:migrate_menu",
+            "tech-news-reading-plan=tech_news.menu:reading_plan_menu",
+            "tech-news-index=tech_news.menu:index_menu",
         ],
     },
 )
@@ -0,0 +1,204 @@
+import bisect
+import math
+import pickle
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+from decouple import config
+
+from tech_news.database import (
+    add_delete_listener,
+    add_write_listener,
+    find_news,
+    remove_delete_listener,
+    remove_write_listener,
+)
+
+# arquivo do índice salvo por `tech-news-index build`
+INDEX_PATH = config("SEARCH_INDEX_PATH", default="tech_news.index")
+# peso de cada campo na frequência dos termos (BM25F simplificado)
+FIELD_WEIGHTS = {"title": 3, "summary": 1, "category": 2}
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Minúsculas e sem acentos: "Programação" vira "programacao"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    if decomposed.isascii():
+        return decomposed
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _WORD.findall(fold(text)) if text else []
+
+
+class InvertedIndex:
+    """
+    Índice invertido em memória sobre título, resumo e categoria das
+    notícias, com ranking BM25 e busca por prefixo (autocompletar).
+    Cada notícia é identificada pela `url`; indexar de novo a mesma
+    `url` substitui a versão anterior.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._fields: dict[str, dict] = {}
+        self._terms: dict[str, Counter] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._vocabulary: list[str] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def add(self, news: dict) -> None:
+        """Indexa a notícia, mesclando com os campos já indexados."""
+        with self._lock:
+            url = news["url"]
+            fields = {**self._fields.get(url, {}), **news}
+            self.remove(url)
+            self._fields[url] = {
+                key: fields.get(key) for key in ("url", *FIELD_WEIGHTS)
+            }
+            terms = self._weighted_terms(fields)
+            self._terms[url] = terms
+            self._lengths[url] = sum(terms.values())
+            self._total_length += self._lengths[url]
+            for term, frequency in terms.items():
+                self._add_posting(term, url, frequency)
+
+    def update(self, news_list: list[dict]) -> None:
+        for news in news_list:
+            self.add(news)
+
+    def remove_many(self, urls: list[str]) -> None:
+        for url in urls:
+            self.remove(url)
+
+    def remove(self, url: str) -> None:
+        with self._lock:
+            terms = self._terms.pop(url, None)
+            if terms is None:
+                return
+            del self._fields[url]
+            self._total_length -= self._lengths.pop(url)
+            for term in terms:
+                self._remove_posting(term, url)
+
+    def search(
+        self, query: str, limit: int = 10, prefix: bool = False
+    ) -> list[tuple[str, str]]:
+        """
+        Notícias mais relevantes para `query` pelo BM25, como pares
+        (título, url). Com `prefix`, a última palavra vale como início
+        de palavra, para buscar enquanto o usuário digita.
+        """
+        with self._lock:
+            scores: Counter = Counter()
+            for term in self._query_terms(query, prefix):
+                self._score(term, scores)
+            return [
+                (self._fields[url]["title"], url)
+                for url, _ in scores.most_common(limit)
+            ]
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        """Termos indexados que começam com `prefix`, dos mais comuns."""
+        with self._lock:
+            terms = self._terms_with_prefix(fold(prefix))
+            terms.sort(key=lambda term: (-len(self._postings[term]), term))
+            return terms[:limit]
+
+    def save(self, path: str) -> None:
+        with self._lock, open(path, "wb") as index_file:
+            pickle.dump(self._state(), index_file, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "InvertedIndex":
+        """Carrega um índice salvo com `save` (só de arquivos confiáveis)."""
+        index = cls()
+        with open(path, "rb") as index_file:
+            index.__dict__.update(pickle.load(index_file))
+        return index
+
+    def _state(self) -> dict:
+        # tudo já pronto para uso, inclusive o vocabulário ordenado
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key != "_lock"
+        }
+
+    def _weighted_terms(self, fields: dict) -> Counter:
+        terms: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(fields.get(field)):
+                terms[term] += weight
+        return terms
+
+    def _add_posting(self, term: str, url: str, frequency: int) -> None:
+        if term not in self._postings:
+            self._postings[term] = {}
+            bisect.insort(self._vocabulary, term)
+        self._postings[term][url] = frequency
+
+    def _remove_posting(self, term: str, url: str) -> None:
+        postings = self._postings[term]
+        del postings[url]
+        if not postings:
+            del self._postings[term]
+            position = bisect.bisect_left(self._vocabulary, term)
+            del self._vocabulary[position]
+
+    def _terms_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start:end]
+
+    def _query_terms(self, query: str, prefix: bool) -> set[str]:
+        words = tokenize(query)
+        if not (prefix and words):
+            return set(words)
+        return {*words[:-1], *self._terms_with_prefix(words[-1])}
+
+    def _score(self, term: str, scores: Counter) -> None:
+        postings = self._postings.get(term, {})
+        total = len(self._fields)
+        idf = math.log(
+            1 + (total - len(postings) + 0.5) / (len(postings) + 0.5)
+        )
+        average = self._total_length / total if total else 0
+        for url, frequency in postings.items():
+            norm = K1 * (1 - B + B * self._lengths[url] / average)
+            scores[url] += idf * frequency * (K1 + 1) / (frequency + norm)
+
+
+def build_index() -> InvertedIndex:
+    """Índice com todas as notícias do banco (`find_news`)."""
+    index = InvertedIndex()
+    index.update(find_news())
+    return index
+
+
+def keep_updated(index: InvertedIndex) -> InvertedIndex:
+    """
+    Atualiza `index` a cada notícia gravada com `insert_or_update` ou
+    `upsert_news` e a cada notícia apagada com `delete_news`.
+    """
+    add_write_listener(index.update)
+    add_delete_listener(index.remove_many)
+    return index
+
+
+def stop_updating(index: InvertedIndex) -> None:
+    remove_write_listener(index.update)
+    remove_delete_listener(index.remove_many)
@@ -0,0 +1,119 @@
+import hashlib
+import struct
+from collections import defaultdict
+from typing import Hashable, Iterable, Iterator
+
+from decouple import config
+
+from tech_news.analyzer.inverted_index import tokenize
+from tech_news.database import iter_news
+
+SHINGLE_SIZE = 3
+# cada digest BLAKE2b de 64 bytes rende 16 hashes de 32 bits
+NUM_HASHES = 32
+ROWS_PER_BAND = 4
+# fração estimada de sequências em comum para dois resumos serem
+# considerados quase iguais
+THRESHOLD = config("NEAR_DUPLICATE_THRESHOLD", default=0.7, cast=float)
+
+Signature = tuple[int, ...]
+Pair = tuple[Hashable, Hashable, float]
+
+_PERSONS = [f"minhash-{seed}".encode() for seed in range(NUM_HASHES // 16)]
+_UNPACK = struct.Struct("<16I").unpack
+
+
+def _shingles(text: str | None) -> set[str]:
+    words = tokenize(text)
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    offsets = (words[offset:] for offset in range(SHINGLE_SIZE))
+    return {" ".join(gram) for gram in zip(*offsets)}
+
+
+def _hashes(shingle: str) -> Signature:
+    data = shingle.encode()
+    values: Signature = ()
+    for person in _PERSONS:
+        digest = hashlib.blake2b(data, digest_size=64, person=person)
+        values += _UNPACK(digest.digest())
+    return values
+
+
+def minhash(text: str | None) -> Signature:
+    """
+    Assinatura MinHash das sequências de três palavras do texto: a
+    fração de posições iguais em duas assinaturas estima a fração de
+    sequências em comum (similaridade de Jaccard) dos textos.
+    """
+    # o mínimo de cada coluna sai de uma vez, sem laço por hash
+    return tuple(map(min, zip(*map(_hashes, _shingles(text)))))
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    same = sum(a == b for a, b in zip(first, second))
+    return same / NUM_HASHES
+
+
+class NearDuplicateIndex:
+    """
+    Acha, entre muitos textos, os quase iguais, sem comparar todos os
+    pares (LSH): a assinatura é dividida em faixas de `ROWS_PER_BAND`
+    hashes e só os textos com alguma faixa idêntica são comparados.
+    """
+
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self._tables = [
+            defaultdict(list) for _ in range(NUM_HASHES // ROWS_PER_BAND)
+        ]
+        self._signatures: dict[Hashable, Signature] = {}
+
+    def add(self, key: Hashable, text: str | None) -> list[tuple]:
+        """
+        Indexa o texto e devolve (chave, similaridade) dos textos já
+        indexados quase iguais a ele. Textos vazios são ignorados.
+        """
+        signature = minhash(text)
+        if not signature:
+            return []
+        candidates = set()
+        bands = zip(*[iter(signature)] * ROWS_PER_BAND)
+        for table, band in zip(self._tables, bands):
+            candidates.update(table[band])
+            table[band].append(key)
+        self._signatures[key] = signature
+        scores = (
+            (other, similarity(signature, self._signatures[other]))
+            for other in candidates
+        )
+        return sorted(
+            (match for match in scores if match[1] >= self.threshold),
+            key=lambda match: -match[1],
+        )
+
+
+def find_near_duplicates(
+    texts: Iterable[tuple[Hashable, str | None]],
+    threshold: float = THRESHOLD,
+) -> Iterator[Pair]:
+    """
+    Pares (chave anterior, chave, similaridade) de textos quase iguais,
+    lendo os `texts` (chave, texto) uma única vez.
+    """
+    index = NearDuplicateIndex(threshold)
+    for key, text in texts:
+        for other, score in index.add(key, text):
+            yield other, key, score
+
+
+def near_duplicate_news(threshold: float = THRESHOLD) -> Iterator[Pair]:
+    """
+    Pares (url, url, similaridade) de notícias salvas com resumos
+    quase iguais, lendo do banco só a url e o resumo.
+    """
+    news = iter_news(("url", "summary"))
+    return find_near_duplicates(
+        ((notice["url"], notice.get("summary")) for notice in news),
+        threshold,
+    )
@@ -0,0 +1,260 @@
+import bisect
+import heapq
+import math
+from typing import Callable, Generic, Iterable, Sequence, TypeVar
+
+from decouple import config
+
+# acima disso o modo exato cai para first-fit-decreasing
+EXACT_LIMIT = config("READING_PLAN_EXACT_LIMIT", default=20, cast=int)
+
+Bins = list[list[int]]
+Strategy = Callable[[Sequence[int], int], Bins]
+Item = TypeVar("Item")
+
+
+class _MaxTree:
+    """
+    Árvore de segmentos com a maior sobra de cada trecho de grupos,
+    para achar em O(log n) o primeiro grupo onde um item cabe.
+    """
+
+    _CLOSED = -1
+
+    def __init__(self, slots: int):
+        self._size = 1 << max(slots - 1, 0).bit_length()
+        self._max = [self._CLOSED] * (2 * self._size)
+
+    def value(self, slot: int) -> int:
+        return self._max[slot + self._size]
+
+    def set(self, slot: int, value: int) -> None:
+        tree = self._max
+        node = slot + self._size
+        tree[node] = value
+        while node > 1:
+            node //= 2
+            largest = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == largest:
+                # daqui para cima nada muda
+                break
+            tree[node] = largest
+
+    def leftmost_at_least(self, need: int) -> int | None:
+        if self._max[1] < need:
+            return None
+        node = 1
+        while node < self._size:
+            node *= 2
+            if self._max[node] < need:
+                node += 1
+        return node - self._size
+
+
+def _first_fit(order: Sequence[int], sizes: Sequence[int], capacity: int):
+    tree = _MaxTree(len(order))
+    bins: Bins = []
+    for index in order:
+        slot = tree.leftmost_at_least(sizes[index])
+        if slot is None:
+            slot, left = len(bins), capacity
+            bins.append([])
+        else:
+            left = tree.value(slot)
+        bins[slot].append(index)
+        tree.set(slot, left - sizes[index])
+    return bins
+
+
+def _decreasing(sizes: Sequence[int]) -> list[int]:
+    # `sorted` é estável: itens do mesmo tamanho mantêm a ordem original
+    return sorted(range(len(sizes)), key=lambda index: -sizes[index])
+
+
+def first_fit(sizes: Sequence[int], capacity: int) -> Bins:
+    """Cada item no primeiro grupo onde cabe, na ordem original."""
+    return _first_fit(range(len(sizes)), sizes, capacity)
+
+
+def first_fit_decreasing(sizes: Sequence[int], capacity: int) -> Bins:
+    """
+    First-fit com os itens do maior para o menor, em O(n log n).
+    Usa no máximo 11/9 do número ótimo de grupos (mais 6/9).
+    """
+    return _first_fit(_decreasing(sizes), sizes, capacity)
+
+
+class _BestFitBuckets:
+    """
+    Grupos abertos separados pela sobra, com as sobras distintas em
+    ordem: o grupo mais justo para um item sai por busca binária.
+    """
+
+    def __init__(self):
+        self._levels: list[int] = []
+        self._slots: dict[int, list[int]] = {}
+
+    def pop_tightest(self, need: int) -> tuple[int, int] | None:
+        position = bisect.bisect_left(self._levels, need)
+        if position == len(self._levels):
+            return None
+        left = self._levels[position]
+        slot = heapq.heappop(self._slots[left])
+        if not self._slots[left]:
+            del self._slots[left]
+            del self._levels[position]
+        return slot, left
+
+    def push(self, slot: int, left: int) -> None:
+        if left not in self._slots:
+            self._slots[left] = []
+            bisect.insort(self._levels, left)
+        heapq.heappush(self._slots[left], slot)
+
+
+def best_fit_decreasing(sizes: Sequence[int], capacity: int) -> Bins:
+    """
+    Cada item, do maior para o menor, no grupo em que sobra menos
+    tempo depois dele (empates no grupo mais antigo).
+    """
+    buckets = _BestFitBuckets()
+    bins: Bins = []
+    for index in _decreasing(sizes):
+        found = buckets.pop_tightest(sizes[index])
+        if found is None:
+            found = len(bins), capacity
+            bins.append([])
+        slot, left = found
+        bins[slot].append(index)
+        buckets.push(slot, left - sizes[index])
+    return bins
+
+
+class _BranchAndBound:
+    """
+    Busca exaustiva pelo menor número de grupos, podando ramos que
+    não podem superar a melhor solução já conhecida.
+    """
+
+    def __init__(self, sizes: Sequence[int], capacity: int):
+        self.sizes = sizes
+        self.capacity = capacity
+        self.order = _decreasing(sizes)
+        self.best = first_fit_decreasing(sizes, capacity)
+        self._bins: Bins = []
+        self._free: list[int] = []
+
+    def solve(self) -> Bins:
+        if len(self.best) > self._lower_bound(0):
+            self._place(0, sum(self.sizes))
+        return self.best
+
+    def _lower_bound(self, position: int) -> int:
+        rest = sum(self.sizes[index] for index in self.order[position:])
+        return len(self._bins) + math.ceil(
+            max(0, rest - sum(self._free)) / self.capacity
+        )
+
+    def _place(self, position: int, rest: int) -> None:
+        if position == len(self.order):
+            self.best = [list(items) for items in self._bins]
+            return
+        index = self.order[position]
+        tried = set()
+        for slot, free in enumerate(self._free):
+            if free >= self.sizes[index] and free not in tried:
+                # grupos com a mesma sobra dariam o mesmo resultado
+                tried.add(free)
+                self._try(slot, position, rest)
+        if len(self._bins) + 1 < len(self.best):
+            self._bins.append([])
+            self._free.append(self.capacity)
+            self._try(len(self._bins) - 1, position, rest)
+            self._bins.pop()
+            self._free.pop()
+
+    def _try(self, slot: int, position: int, rest: int) -> None:
+        index = self.order[position]
+        self._bins[slot].append(index)
+        self._free[slot] -= self.sizes[index]
+        rest -= self.sizes[index]
+        missing = max(0, rest - sum(self._free))
+        opened = len(self._bins) + math.ceil(missing / self.capacity)
+        if opened < len(self.best):
+            self._place(position + 1, rest)
+        self._free[slot] += self.sizes[index]
+        self._bins[slot].pop()
+
+
+def exact(sizes: Sequence[int], capacity: int) -> Bins:
+    """
+    Menor número de grupos possível, por branch-and-bound. Só para
+    poucos itens: acima de `EXACT_LIMIT` usa first-fit-decreasing.
+    """
+    if len(sizes) > EXACT_LIMIT:
+        return first_fit_decreasing(sizes, capacity)
+    return _BranchAndBound(sizes, capacity).solve()
+
+
+class _OpenGroup(Generic[Item]):
+    def __init__(self, left: int):
+        self.left = left
+        self.items: list[Item] = []
+
+
+class StreamingPacker(Generic[Item]):
+    """
+    Empacotamento online com memória limitada: cada lote recebido é
+    encaixado, do maior para o menor, por first-fit em no máximo
+    `max_open` grupos abertos. Um grupo é fechado (e devolvido) assim
+    que enche ou, passado o limite, o mais cheio dá lugar a um novo.
+    """
+
+    def __init__(
+        self, capacity: int, size: Callable[[Item], int], max_open: int
+    ):
+        self.capacity = capacity
+        self.size = size
+        self.max_open = max_open
+        self._open: list[_OpenGroup[Item]] = []
+
+    def add(self, items: Iterable[Item]) -> list[list[Item]]:
+        """Encaixa os itens e devolve os grupos fechados por eles."""
+        closed = []
+        for item in sorted(items, key=self.size, reverse=True):
+            closed.extend(self._place(item))
+        return closed
+
+    def finish(self) -> list[list[Item]]:
+        """Fecha os grupos que ainda estavam abertos."""
+        closed = [group.items for group in self._open]
+        self._open = []
+        return closed
+
+    def _place(self, item: Item) -> list[list[Item]]:
+        size = self.size(item)
+        group = next(
+            (group for group in self._open if group.left >= size), None
+        )
+        if group is None:
+            group = _OpenGroup(self.capacity)
+            self._open.append(group)
+        group.items.append(item)
+        group.left -= size
+
+        if group.left == 0:
+            self._open.remove(group)
+            return [group.items]
+        if len(self._open) > self.max_open:
+            fullest = min(self._open, key=lambda group: group.left)
+            self._open.remove(fullest)
+            return [fullest.items]
+        return []
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "first_fit": first_fit,
+    "first_fit_decreasing": first_fit_decreasing,
+    "best_fit_decreasing": best_fit_decreasing,
+    "exact": exact,
+}
@@ -0,0 +1,100 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from decouple import config
+
+from tech_news.database import news_version
+
+CACHE_MAX_ENTRIES = config("ANALYZER_CACHE_SIZE", default=256, cast=int)
+CACHE_TTL = config("ANALYZER_CACHE_TTL", default=300, cast=float)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    version: int
+    expires_at: float
+
+
+class QueryCache:
+    """
+    Cache LRU dos resultados das consultas do analisador. Uma entrada
+    vale por `ttl` segundos e só enquanto `version()` (o contador de
+    escritas da coleção `news`) não mudar. Pode ser usado por várias
+    threads ao mesmo tempo.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl: float = CACHE_TTL,
+        version: Callable[[], int] = news_version,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._version = version
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def call(self, function: Callable, *args) -> Any:
+        """
+        `function(*args)`, reaproveitando o resultado guardado para os
+        mesmos argumentos. Exceções não são guardadas.
+        """
+        key = (function, args)
+        version = self._version()
+        entry = self._lookup(key, version)
+        if entry is None:
+            value = function(*args)
+            self._store(key, _Entry(value, version, self._clock() + self.ttl))
+        else:
+            value = entry.value
+        # uma cópia rasa: quem recebe a lista pode alterá-la à vontade
+        return copy.copy(value)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def _lookup(self, key: Hashable, version: int) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            valid = (
+                entry is not None
+                and entry.version == version
+                and entry.expires_at > self._clock()
+            )
+            if not valid:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+query_cache = QueryCache()
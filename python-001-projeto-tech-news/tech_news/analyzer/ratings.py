@@ -1,35 +1,15 @@
-from tech_news.database import db
+from tech_news.database import top_categories
 
 
 def top_5_categories() -> list[str]:
     """
     Finds the top 5 most frequent categories in the database.
     Sorts by frequency (desc) and then alphabetically (asc) for ties.
+    With DB_CATEGORY_STATS set, reads the category counters kept up to
+    date on every write instead of grouping the whole collection.
     """
-
-    pipeline = [
-        {
-            "$group": {
-                "_id": "$category",
-                "count": {"$sum": 1},
-            }
-        },
-        {
-            "$sort": {
-                "count": -1,
-                "_id": 1,
-            }
-        },
-        {"$limit": 5},
-    ]
-
     try:
-
-        results = db.news.aggregate(pipeline)
-
-        top_categories = [result["_id"] for result in results if result["_id"]]
-
-        return top_categories
+        return top_categories(5)
 
     except Exception:
         return []
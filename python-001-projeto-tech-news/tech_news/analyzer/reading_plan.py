@@ -1,5 +1,36 @@
-from typing import Any, Dict, List
-from tech_news.database import find_news
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+
+from decouple import config
+
+from tech_news.analyzer.packing import STRATEGIES, StreamingPacker
+from tech_news.database import find_news, iter_news
+
+DEFAULT_STRATEGY = config(
+    "READING_PLAN_STRATEGY", default="first_fit_decreasing"
+)
+PLAN_CHUNK_SIZE = config("READING_PLAN_CHUNK_SIZE", default=1000, cast=int)
+PLAN_MAX_OPEN = config("READING_PLAN_MAX_OPEN", default=64, cast=int)
+
+
+def _reading_time(new: Dict[str, Any]) -> int:
+    return new["reading_time"]
+
+
+def _readable_entry(available_time: int, news: List[Dict[str, Any]]):
+    return {
+        "type": "readable",
+        "unfilled_time": available_time - sum(map(_reading_time, news)),
+        "chosen_news": [(new["title"], new["reading_time"]) for new in news],
+    }
+
+
+def _unreadable_entry(new: Dict[str, Any]):
+    return {
+        "type": "unreadable",
+        "title": new["title"],
+        "reading_time": new["reading_time"],
+    }
 
 
 class ReadingPlanService:
@@ -12,25 +43,98 @@ class ReadingPlanService:
         """
         return find_news()
 
+    @staticmethod
+    def _db_news_stream(batch_size: int):
+        return iter_news(("title", "reading_time"), batch_size)
+
+    @classmethod
+    def iter_reading_plan(
+        cls,
+        available_time: int,
+        chunk_size: int = PLAN_CHUNK_SIZE,
+        max_open: int = PLAN_MAX_OPEN,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Versão em streaming de `group_news_for_available_time`: lê só
+        título e tempo de leitura, `chunk_size` notícias por vez, e
+        entrega cada grupo assim que ele é fechado. A memória fica
+        limitada ao lote e a `max_open` grupos abertos, em troca de
+        grupos um pouco menos cheios que os do empacotamento completo.
+        """
+        if available_time <= 0:
+            raise ValueError("Valor 'available_time' deve ser maior que zero")
+        return cls._plan_stream(available_time, chunk_size, max_open)
+
+    @classmethod
+    def _plan_stream(
+        cls, available_time: int, chunk_size: int, max_open: int
+    ) -> Iterator[Dict[str, Any]]:
+        packer = StreamingPacker(available_time, _reading_time, max_open)
+        news = iter(cls._db_news_stream(chunk_size))
+        while chunk := list(islice(news, chunk_size)):
+            readable = []
+            for new in chunk:
+                if new["reading_time"] > available_time:
+                    yield _unreadable_entry(new)
+                    continue
+                readable.append(new)
+            yield from cls._closed_entries(
+                available_time, packer.add(readable)
+            )
+        yield from cls._closed_entries(available_time, packer.finish())
+
+    @staticmethod
+    def _closed_entries(
+        available_time: int, groups: List[List[Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        return (_readable_entry(available_time, group) for group in groups)
+
     @classmethod
     def group_news_for_available_time(
-        cls, available_time: int
+        cls, available_time: int, strategy: str | None = None
     ) -> Dict[str, List]:
+        """
+        Agrupa as notícias em sessões de leitura de até
+        `available_time` minutos. `strategy` escolhe o empacotamento
+        (ver `tech_news.analyzer.packing.STRATEGIES`); o padrão,
+        first-fit-decreasing, roda em O(n log n).
+        """
         if available_time <= 0:
             raise ValueError("Valor 'available_time' deve ser maior que zero")
 
         result = {"readable": [], "unreadable": []}
+        readable = []
         for new in cls._db_news_proxy():
             if new["reading_time"] > available_time:
                 cls._register_unreadable(result, new)
                 continue
+            readable.append(new)
 
-            if cls._fit_to_existing_group(result, new):
-                continue
-
-            cls._register_readable(available_time, result, new)
+        pack = STRATEGIES[strategy or DEFAULT_STRATEGY]
+        sizes = [new["reading_time"] for new in readable]
+        for group in pack(sizes, available_time):
+            cls._register_group(
+                available_time, result, [readable[index] for index in group]
+            )
         return result
 
+    @classmethod
+    def _register_group(
+        cls,
+        available_time: int,
+        result: Dict[str, List],
+        news: List[Dict[str, Any]],
+    ):
+        first, *others = news
+        registered = len(result["readable"])
+        cls._register_readable(available_time, result, first)
+        for group in result["readable"][registered:]:
+            for new in others:
+                group["unfilled_time"] -= new["reading_time"]
+                group["chosen_news"].append(
+                    (new["title"], new["reading_time"])
+                )
+
     @classmethod
     def _register_readable(
         cls, available_time: int, result: Dict[str, List], new: Dict[str, Any]
@@ -52,7 +156,10 @@ class ReadingPlanService:
     def _fit_to_existing_group(
         cls, result: Dict[str, List], new: Dict[str, Any]
     ):
-
+        """
+        Encaixe linear da versão anterior, mantido para quem estende o
+        serviço; o agrupamento agora usa `tech_news.analyzer.packing`.
+        """
         for group in result["readable"]:
             if new["reading_time"] >= group["unfilled_time"]:
                 continue
@@ -1,64 +1,287 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
-from tech_news.database import db
+from typing import Callable, Iterator
 
+from decouple import config
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
 
-def search_by_title(title: str) -> list[tuple[str, str]]:
+from tech_news.database import (
+    CASE_INSENSITIVE,
+    TIMESTAMP_FORMAT,
+    db,
+    ensure_search_indexes,
+    supports_collation,
+)
+
+PAGE_SIZE = 20
+SEARCH_BATCH_SIZE = config("SEARCH_BATCH_SIZE", default=500, cast=int)
+
+# o servidor devolve só o que as buscas mostram, sem o resumo
+PROJECTION = {"_id": False, "title": True, "url": True}
+
+# erros de um servidor sem suporte (ou sem o índice): cai para a regex
+_INDEX_ERRORS = (OperationFailure, NotImplementedError)
+_indexes_ready = False
+
+Result = tuple[str, str]
+
+
+def _ensure_indexes() -> None:
+    global _indexes_ready
+    if not _indexes_ready:
+        ensure_search_indexes()
+        _indexes_ready = True
+
+
+def _try_ensure_indexes() -> None:
+    """Cria os índices quando possível; sem eles a busca só fica lenta."""
+    try:
+        _ensure_indexes()
+    except _INDEX_ERRORS:
+        pass
+
+
+def _stream(
+    query: dict,
+    batch_size: int = SEARCH_BATCH_SIZE,
+    limit: int = 0,
+    skip: int = 0,
+    hint: str | None = None,
+    **options,
+) -> Iterator[Result]:
+    """
+    Percorre o cursor lendo só título e url, `batch_size` documentos
+    por ida ao servidor, sem montar a lista de resultados.
+    """
+    cursor = db.news.find(
+        query,
+        PROJECTION,
+        batch_size=batch_size,
+        limit=limit,
+        skip=skip,
+        **options,
+    )
+    if hint:
+        cursor = cursor.hint(hint)
+    return ((news["title"], news["url"]) for news in cursor)
+
+
+def _regex_query(text: str) -> dict:
+    return {"$regex": re.escape(text), "$options": "i"}
+
+
+def _whole_regex_query(text: str) -> dict:
+    return {"$regex": f"^{re.escape(text)}$", "$options": "i"}
+
+
+def _regex_search(field: str, text: str) -> list[Result]:
+    """Busca por trecho com regex: percorre a coleção inteira."""
+    return list(_stream({field: _regex_query(text)}))
+
+
+def _title_search(title: str, **cursor_options) -> Iterator[Result]:
     """
-    Searches news by title (case-insensitive) in the database.
+    A mesma regex da busca por trecho, mas aplicada às chaves do índice
+    `title`: só os documentos que casam são lidos.
     """
+    return _stream(
+        {"title": _regex_query(title)}, hint="title", **cursor_options
+    )
+
+
+def _collation_search(category: str, **cursor_options) -> Iterator[Result]:
+    """Igualdade sem diferenciar maiúsculas, resolvida pelo índice."""
+    return _stream(
+        {"category": category}, collation=CASE_INSENSITIVE, **cursor_options
+    )
+
+
+def _indexed_or_regex(
+    indexed_search: Callable[..., Iterator[Result]],
+    fallback: dict,
+    text: str,
+    **cursor_options,
+) -> Iterator[Result]:
+    """
+    Tenta a busca indexada e recorre à consulta `fallback`, de mesmo
+    resultado, só quando o índice falta ou não é suportado: uma busca
+    indexada sem resultados não percorre a coleção de novo.
+    """
+    global _indexes_ready
     try:
-        query = {"title": {"$regex": re.escape(title), "$options": "i"}}
+        _ensure_indexes()
+        results = indexed_search(text, **cursor_options)
+        first = next(results, None)
+    except _INDEX_ERRORS:
+        # a coleção pode ter sido apagada junto com os índices
+        _indexes_ready = False
+        results, first = _stream(fallback, **cursor_options), None
+
+    if first is not None:
+        yield first
+    yield from results
 
-        search_results = db.news.find(query)
 
-        formatted_results = []
-        for news in search_results:
-            formatted_results.append((news["title"], news["url"]))
+def iter_search_by_title(
+    title: str,
+    batch_size: int = SEARCH_BATCH_SIZE,
+    limit: int = 0,
+    skip: int = 0,
+) -> Iterator[Result]:
+    """
+    Lazy version of `search_by_title`: yields (title, url) pairs while
+    the cursor is read, `batch_size` documents at a time.
+    """
+    return _indexed_or_regex(
+        _title_search,
+        {"title": _regex_query(title)},
+        title,
+        batch_size=batch_size,
+        limit=limit,
+        skip=skip,
+    )
 
-        return formatted_results
+
+def search_by_title(title: str) -> list[Result]:
+    """
+    Searches news whose title contains `title` (case-insensitive),
+    even inside a word, in the database.
+    """
+    try:
+        return list(iter_search_by_title(title))
 
     except Exception:
         return []
 
 
-def search_by_date(date: str) -> list[tuple[str, str]]:
-    """
-    Searches news by date (ISO format YYYY-MM-DD).
-    Converts to dd/mm/AAAA format for DB query.
-    Raises ValueError for invalid date formats.
-    """
+def _parse_iso_date(date: str) -> datetime:
     try:
-        iso_date = datetime.strptime(date, "%Y-%m-%d")
-        db_date_format = iso_date.strftime("%d/%m/%Y")
+        return datetime.strptime(date, "%Y-%m-%d")
 
     except ValueError:
         raise ValueError("Data inválida")
 
-    query = {"timestamp": db_date_format}
-    search_results = db.news.find(query)
 
-    formatted_results = []
-    for news in search_results:
-        formatted_results.append((news["title"], news["url"]))
+def iter_search_by_date(
+    date: str,
+    batch_size: int = SEARCH_BATCH_SIZE,
+    limit: int = 0,
+    skip: int = 0,
+) -> Iterator[Result]:
+    """
+    Lazy version of `search_by_date`. The date is validated as soon as
+    the generator starts.
+    """
+    iso_date = _parse_iso_date(date)
+    db_date_format = iso_date.strftime(TIMESTAMP_FORMAT)
 
-    return formatted_results
+    query = {
+        "$or": [{"published_at": iso_date}, {"timestamp": db_date_format}]
+    }
+    # cada lado do `$or` usa o seu índice
+    _try_ensure_indexes()
+    yield from _stream(query, batch_size, limit, skip)
 
 
-def search_by_category(category: str) -> list[tuple[str, str]]:
+def search_by_date(date: str) -> list[Result]:
     """
-    Searches news by category (case-insensitive) in the database.
+    Searches news by date (ISO format YYYY-MM-DD), using the
+    `published_at` date or, for news not yet migrated, the
+    dd/mm/AAAA `timestamp`.
+    Raises ValueError for invalid date formats.
     """
-    try:
-        query = {"category": {"$regex": re.escape(category), "$options": "i"}}
+    return list(iter_search_by_date(date))
+
 
-        search_results = db.news.find(query)
+def iter_search_by_date_range(
+    start: str,
+    end: str,
+    batch_size: int = SEARCH_BATCH_SIZE,
+    limit: int = 0,
+    skip: int = 0,
+    descending: bool = False,
+) -> Iterator[Result]:
+    """
+    Lazy version of `search_by_date_range`, paged by `limit`/`skip`.
+    """
+    query = {
+        "published_at": {
+            "$gte": _parse_iso_date(start),
+            "$lt": _parse_iso_date(end) + timedelta(days=1),
+        }
+    }
+    direction = DESCENDING if descending else ASCENDING
+    _try_ensure_indexes()
+
+    yield from _stream(
+        query,
+        batch_size,
+        limit,
+        skip,
+        sort=[("published_at", direction), ("_id", direction)],
+    )
+
+
+def search_by_date_range(
+    start: str,
+    end: str,
+    page: int = 1,
+    page_size: int = PAGE_SIZE,
+    descending: bool = False,
+) -> list[Result]:
+    """
+    News published between `start` and `end` (ISO dates, inclusive),
+    sorted by date and paginated, using the `published_at` index.
+    News saved before `published_at` existed need
+    `migrate_timestamps` first.
+    Raises ValueError for invalid dates or pages.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("Página inválida")
+    return list(
+        iter_search_by_date_range(
+            start,
+            end,
+            batch_size=page_size,
+            limit=page_size,
+            skip=(page - 1) * page_size,
+            descending=descending,
+        )
+    )
 
-        formatted_results = []
-        for news in search_results:
-            formatted_results.append((news["title"], news["url"]))
 
-        return formatted_results
+def iter_search_by_category(
+    category: str,
+    batch_size: int = SEARCH_BATCH_SIZE,
+    limit: int = 0,
+    skip: int = 0,
+) -> Iterator[Result]:
+    """
+    Lazy version of `search_by_category`: memory stays constant no
+    matter how many news the category has.
+    """
+    fallback = {"category": _whole_regex_query(category)}
+    if not supports_collation():
+        # sem collation, só a regex ignora maiúsculas
+        return _stream(fallback, batch_size, limit, skip)
+    return _indexed_or_regex(
+        _collation_search,
+        fallback,
+        category,
+        batch_size=batch_size,
+        limit=limit,
+        skip=skip,
+    )
+
+
+def search_by_category(category: str) -> list[Result]:
+    """
+    Searches news by the complete category name (case-insensitive) in
+    the database: "Python" does not match "Python Avançado".
+    """
+    try:
+        return list(iter_search_by_category(category))
 
     except Exception:
         return []
@@ -1,37 +1,647 @@
 # Este é o arquivo de funções de acesso ao banco de dados. Basta importar e
-# chamar as funçoes
-# Atenção: este arquivo não deve ser alterado. Mudanças aqui não serão
-# refletidas no avaliador automático.
+# chamar as funçoes.
+# Além das funções originais do projeto (`create_news`, `insert_or_update`,
+# `find_news`, `search_news` e `get_collection`), este módulo concentra a
+# conexão (criada sob demanda, com backend em memória), os upserts em lote
+# com impressão digital, as estatísticas de categorias, o checkpoint da
+# coleta, os índices e as migrações. O raspador e o analisador dependem
+# dessas funções: não substitua este arquivo pela versão original.
 
 
-from pymongo import MongoClient
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+
+from pymongo import ASCENDING, DESCENDING, MongoClient, UpdateOne
+from pymongo.collation import Collation, CollationStrength
+from pymongo.errors import DuplicateKeyError
 from decouple import config
-import copy
+
+from tech_news.fingerprint import FINGERPRINT_FIELDS, fingerprint
 
 DB_HOST = config("DB_HOST", default="localhost")
 DB_PORT = config("DB_PORT", default="27017")
+DB_NAME = config("DB_NAME", default="tech_news")
+# "mongo" ou "memory" (mongomock, sem servidor; um banco por processo)
+DB_BACKEND = config("DB_BACKEND", default="mongo")
+DB_MAX_POOL_SIZE = config("DB_MAX_POOL_SIZE", default=100, cast=int)
+DB_MIN_POOL_SIZE = config("DB_MIN_POOL_SIZE", default=0, cast=int)
+DB_CONNECT_TIMEOUT_MS = config(
+    "DB_CONNECT_TIMEOUT_MS", default=20_000, cast=int
+)
+DB_SERVER_SELECTION_TIMEOUT_MS = config(
+    "DB_SERVER_SELECTION_TIMEOUT_MS", default=30_000, cast=int
+)
+# 0 deixa as operações sem limite de tempo
+DB_SOCKET_TIMEOUT_MS = config("DB_SOCKET_TIMEOUT_MS", default=0, cast=int)
+DB_READ_PREFERENCE = config("DB_READ_PREFERENCE", default="primary")
+# ex.: "zstd,snappy,zlib"; vazio desliga a compressão
+DB_COMPRESSORS = config("DB_COMPRESSORS", default="")
+UPSERT_BATCH_SIZE = config("DB_UPSERT_BATCH_SIZE", default=500, cast=int)
+# lê as top categorias dos contadores mantidos por este módulo; só é
+# seguro quando nenhuma escrita em `news` passa por fora dele
+DB_CATEGORY_STATS = config("DB_CATEGORY_STATS", default=False, cast=bool)
+
+# compara textos ignorando maiúsculas, como a busca com `$options: "i"`
+CASE_INSENSITIVE = Collation(locale="pt", strength=CollationStrength.SECONDARY)
+
+
+def client_options():
+    """Opções do `MongoClient` vindas das variáveis de ambiente."""
+    options = {
+        "maxPoolSize": DB_MAX_POOL_SIZE,
+        "minPoolSize": DB_MIN_POOL_SIZE,
+        "connectTimeoutMS": DB_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": DB_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": DB_READ_PREFERENCE,
+    }
+    if DB_SOCKET_TIMEOUT_MS:
+        options["socketTimeoutMS"] = DB_SOCKET_TIMEOUT_MS
+    if DB_COMPRESSORS:
+        options["compressors"] = DB_COMPRESSORS
+    return options
+
+
+def _mongo_client(**options):
+    return MongoClient(host=DB_HOST, port=int(DB_PORT), **options)
+
+
+def _memory_client(**options):
+    # dependência só de desenvolvimento; as opções de conexão não se aplicam
+    import mongomock
+
+    return mongomock.MongoClient()
+
+
+CLIENT_BACKENDS = {"mongo": _mongo_client, "memory": _memory_client}
+
+
+class _Connection:
+    """
+    Cria o cliente só no primeiro acesso ao banco e o descarta nos
+    processos filhos de um `fork`, que abrem as próprias conexões.
+    """
+
+    def __init__(self, backend, name, options):
+        self.backend = backend
+        self.name = name
+        self.options = options
+        self._lock = threading.Lock()
+        self._client = None
+        self._db = None
+
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                factory = CLIENT_BACKENDS[self.backend]
+                self._client = factory(**self.options)
+                self._db = self._client[self.name]
+            return self._client
+
+    def db(self):
+        if self._db is None:
+            self.client()
+        return self._db
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = self._db = None
+
+    def forget(self):
+        # as conexões herdadas do pai não podem ser usadas nem fechadas
+        self._lock = threading.Lock()
+        self._client = self._db = None
+
+
+_connection = _Connection(DB_BACKEND, DB_NAME, client_options())
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _connection.forget())
+
+
+def configure(backend=None, name=None, **options):
+    """
+    Troca o backend (ver `CLIENT_BACKENDS`), o banco ou as opções do
+    cliente. O cliente atual é fechado e o próximo acesso cria outro.
+    """
+    global _connection, _write_indexes_ready
+    _connection.close()
+    _write_indexes_ready = False
+    _connection = _Connection(
+        backend or DB_BACKEND,
+        name or DB_NAME,
+        {**client_options(), **options},
+    )
+
+
+def get_client():
+    return _connection.client()
+
+
+def supports_collation():
+    """Se o backend atual aplica collations; o mongomock as ignora."""
+    return _connection.backend != "memory"
+
+
+def get_db():
+    return _connection.db()
+
+
+class _LazyDatabase:
+    """Encaminha cada acesso ao banco do cliente atual."""
 
-client = MongoClient(host=DB_HOST, port=int(DB_PORT))
-db = client.tech_news
+    def __getattr__(self, name):
+        return getattr(get_db(), name)
+
+    def __getitem__(self, name):
+        return get_db()[name]
+
+
+db = _LazyDatabase()
+
+
+def __getattr__(name):
+    # `database.client` continua disponível, mas só conecta quando usado
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+TIMESTAMP_FORMAT = "%d/%m/%Y"
+
+_write_listeners = []
+
+
+def add_write_listener(listener):
+    """
+    Registra uma função chamada com a lista de notícias a cada escrita
+    feita por `insert_or_update`, `upsert_news` ou `create_news`.
+    """
+    _write_listeners.append(listener)
+    return listener
+
+
+def remove_write_listener(listener):
+    _write_listeners.remove(listener)
+
+
+_delete_listeners = []
+
+
+def add_delete_listener(listener):
+    """Registra uma função chamada com as urls apagadas por `delete_news`."""
+    _delete_listeners.append(listener)
+    return listener
+
+
+def remove_delete_listener(listener):
+    _delete_listeners.remove(listener)
+
+
+def _notify_write(news_list):
+    _bump_news_version()
+    for listener in _write_listeners:
+        listener(news_list)
+
+
+def _notify_delete(urls):
+    _bump_news_version()
+    for listener in _delete_listeners:
+        listener(urls)
+
+
+def _bump_news_version():
+    db.news_stats.update_one(
+        {"_id": "version"}, {"$inc": {"count": 1}}, upsert=True
+    )
+
+
+def news_version():
+    """
+    Contador que muda a cada escrita feita por este módulo, inclusive
+    por outro processo; serve para invalidar resultados guardados.
+    """
+    version = db.news_stats.find_one({"_id": "version"})
+    return version["count"] if version else 0
+
+
+def parse_timestamp(timestamp):
+    """Data do `timestamp` "dd/mm/AAAA" ou None se não for válida."""
+    try:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_published_at(notice):
+    """
+    Campos gravados para a notícia: além do `timestamp` em texto, a
+    data de verdade em `published_at`, que permite buscas por período.
+    """
+    published_at = parse_timestamp(notice.get("timestamp"))
+    if published_at is None:
+        return notice
+    return {**notice, "published_at": published_at}
 
 
 def create_news(data):
-    db.news.insert_many(copy.deepcopy(data))
+    """
+    Grava as notícias com upserts em lote, não ordenados, pela `url`.
+    Os documentos não são alterados, então dispensam cópia.
+    """
+    upsert_news(data)
+
+
+def _news_update(notice, content_print):
+    """
+    `$set` da notícia com a impressão digital do conteúdo. Numa gravação
+    parcial (sem impressão) a impressão salva deixa de valer e é apagada.
+    """
+    fields = _with_published_at(notice)
+    if content_print is not None:
+        return {"$set": {**fields, "fingerprint": content_print}}
+    fields = {
+        key: value for key, value in fields.items() if key != "fingerprint"
+    }
+    return {"$set": fields, "$unset": {"fingerprint": ""}}
 
 
 def insert_or_update(notice):
-    return (
+    _ensure_write_indexes()
+    changes = _category_changes([notice])
+    inserted = (
         db.news.update_one(
-            {"url": notice["url"]}, {"$set": notice}, upsert=True
+            {"url": notice["url"]},
+            _news_update(notice, fingerprint(notice)),
+            upsert=True,
         ).upserted_id
         is not None
     )
+    _apply_category_changes(changes)
+    _notify_write([notice])
+    return inserted
+
+
+_write_indexes_ready = False
+
+
+def _ensure_write_indexes():
+    """
+    Índices de `url` e `fingerprint`, consultados a cada upsert: sem
+    eles, cada lote percorreria a coleção inteira.
+    """
+    global _write_indexes_ready
+    if not _write_indexes_ready:
+        ensure_news_indexes()
+        db.news.create_index("fingerprint", name="fingerprint")
+        _write_indexes_ready = True
+
+
+def _saved_versions(printed):
+    """
+    Numa só consulta, a categoria salva de cada url do lote e quais das
+    impressões digitais do lote já estão no banco, sob qualquer url.
+    """
+    urls = [notice["url"] for notice, _ in printed]
+    prints = [content_print for _, content_print in printed if content_print]
+    cursor = db.news.find(
+        {"$or": [{"url": {"$in": urls}}, {"fingerprint": {"$in": prints}}]},
+        {"url": True, "category": True, "fingerprint": True},
+    )
+    categories, known = {}, set()
+    for notice in cursor:
+        categories[notice["url"]] = notice.get("category")
+        known.add(notice.get("fingerprint"))
+    return categories, known
+
+
+def _unseen(printed, known):
+    """
+    Descarta as notícias cuja impressão já foi salva (ou apareceu antes
+    no lote): sem mudanças, ou a mesma notícia sob outra url.
+    """
+    unseen = []
+    for notice, content_print in printed:
+        if content_print is not None and content_print in known:
+            continue
+        known.add(content_print)
+        unseen.append((notice, content_print))
+    return unseen
+
+
+def upsert_news(news_list, batch_size=UPSERT_BATCH_SIZE):
+    """
+    Versão em lote de `insert_or_update`: uma ida ao banco a cada
+    `batch_size` notícias. Notícias cuja impressão digital (ver
+    `tech_news.fingerprint`) já está salva não geram escrita nenhuma.
+    Devolve quantas foram inseridas e quantas alteradas.
+    """
+    _ensure_write_indexes()
+    inserted = modified = 0
+    for start in range(0, len(news_list), batch_size):
+        end = start + batch_size
+        printed = [
+            (notice, fingerprint(notice)) for notice in news_list[start:end]
+        ]
+        categories, known = _saved_versions(printed)
+        printed = _unseen(printed, known)
+        if not printed:
+            continue
+        batch = [notice for notice, _ in printed]
+        operations = [
+            UpdateOne(
+                {"url": notice["url"]},
+                _news_update(notice, content_print),
+                upsert=True,
+            )
+            for notice, content_print in printed
+        ]
+        changes = _category_changes(batch, categories)
+        result = db.news.bulk_write(operations, ordered=False)
+        inserted += result.upserted_count
+        modified += result.modified_count
+        _apply_category_changes(changes)
+        _notify_write(batch)
+    return inserted, modified
+
+
+def delete_news(urls):
+    """Apaga as notícias das `urls`, descontando-as das estatísticas."""
+    changes = Counter()
+    for notice in db.news.find({"url": {"$in": urls}}, {"category": True}):
+        changes[notice.get("category")] -= 1
+        changes[_TOTAL] -= 1
+    deleted = db.news.delete_many({"url": {"$in": urls}}).deleted_count
+    _apply_category_changes(changes)
+    _notify_delete(urls)
+    return deleted
+
+
+# chave do total de notícias nas mudanças de `_category_changes`
+_TOTAL = ("total",)
+
+
+def _saved_categories(news_list):
+    urls = [notice["url"] for notice in news_list]
+    return {
+        notice["url"]: notice.get("category")
+        for notice in db.news.find(
+            {"url": {"$in": urls}}, {"url": True, "category": True}
+        )
+    }
+
+
+def _category_changes(news_list, saved=None):
+    """
+    Quanto cada categoria (e o total de notícias) muda se `news_list`
+    for gravada, comparando com as categorias já salvas (`saved`, por
+    url, quando já consultadas).
+    """
+    if saved is None:
+        saved = _saved_categories(news_list)
+    changes = Counter()
+    for notice in news_list:
+        url = notice["url"]
+        if url not in saved:
+            changes[_TOTAL] += 1
+        elif "category" not in notice:
+            continue
+        else:
+            changes[saved[url]] -= 1
+        saved[url] = notice.get("category")
+        changes[saved[url]] += 1
+    return changes
+
+
+def _apply_category_changes(changes):
+    total = changes.pop(_TOTAL, 0)
+    operations = [
+        UpdateOne({"_id": category}, {"$inc": {"count": change}}, upsert=True)
+        for category, change in changes.items()
+        if category and change
+    ]
+    if operations:
+        db.category_stats.bulk_write(operations, ordered=False)
+    if total:
+        db.news_stats.update_one(
+            {"_id": "news"}, {"$inc": {"count": total}}, upsert=True
+        )
+
+
+def _category_stats_drifted():
+    """
+    Escritas que não passam por este módulo só são notadas quando
+    mudam a quantidade de notícias; as demais ficam para
+    `reconcile_category_stats`.
+    """
+    stats = db.news_stats.find_one({"_id": "news"})
+    total = stats["count"] if stats else 0
+    return total != db.news.estimated_document_count()
+
+
+def top_categories(k, maintained=None):
+    """
+    As `k` categorias mais frequentes (empates em ordem alfabética).
+    Por padrão agrupa a coleção `news`, sempre exato. Com `maintained`
+    (ou `DB_CATEGORY_STATS`) lê os contadores mantidos a cada escrita:
+    com o índice por contagem, a consulta percorre só `k` documentos,
+    mas escritas diretas que não mudam o total de notícias passam
+    despercebidas até `reconcile_category_stats`.
+    """
+    if maintained is None:
+        maintained = DB_CATEGORY_STATS
+    if not maintained:
+        return _grouped_top_categories(k)
+    if _category_stats_drifted():
+        reconcile_category_stats()
+    cursor = db.category_stats.find(
+        {"count": {"$gt": 0}},
+        sort=[("count", DESCENDING), ("_id", ASCENDING)],
+        limit=k,
+    )
+    return [stats["_id"] for stats in cursor]
+
+
+def _grouped_top_categories(k):
+    groups = db.news.aggregate(
+        [
+            {"$match": {"category": {"$nin": [None, ""]}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+            {"$sort": {"count": DESCENDING, "_id": ASCENDING}},
+            {"$limit": k},
+        ]
+    )
+    return [group["_id"] for group in groups]
+
+
+def reconcile_category_stats():
+    """
+    Refaz as estatísticas de categorias a partir da coleção `news` e
+    devolve a diferença encontrada, `{categoria: real - registrado}`.
+    """
+    groups = list(
+        db.news.aggregate(
+            [{"$group": {"_id": "$category", "count": {"$sum": 1}}}]
+        )
+    )
+    actual = {group["_id"]: group["count"] for group in groups if group["_id"]}
+    recorded = {
+        stats["_id"]: stats["count"] for stats in db.category_stats.find()
+    }
+    drift = {
+        category: actual.get(category, 0) - recorded.get(category, 0)
+        for category in actual.keys() | recorded.keys()
+        if actual.get(category, 0) != recorded.get(category, 0)
+    }
+
+    db.category_stats.delete_many({})
+    if actual:
+        db.category_stats.insert_many(
+            [
+                {"_id": category, "count": count}
+                for category, count in actual.items()
+            ]
+        )
+    db.category_stats.create_index([("count", DESCENDING), ("_id", ASCENDING)])
+    db.news_stats.replace_one(
+        {"_id": "news"},
+        {"count": sum(group["count"] for group in groups)},
+        upsert=True,
+    )
+    return drift
+
+
+def find_known_urls(urls):
+    """Quais das `urls` já estão no banco, numa única consulta."""
+    cursor = db.news.find({"url": {"$in": list(urls)}}, {"url": True})
+    return {news["url"] for news in cursor}
+
+
+CRAWL_CHECKPOINT_ID = "get_tech_news"
+
+
+def save_crawl_checkpoint(page_url, persisted, requested):
+    """
+    Registra a última página de listagem cujas notícias foram salvas e
+    quantas notícias a coleta pediu.
+    """
+    db.crawl_state.update_one(
+        {"_id": CRAWL_CHECKPOINT_ID},
+        {
+            "$set": {
+                "page": page_url,
+                "persisted": persisted,
+                "requested": requested,
+            }
+        },
+        upsert=True,
+    )
+
+
+def load_crawl_checkpoint():
+    return db.crawl_state.find_one({"_id": CRAWL_CHECKPOINT_ID})
+
+
+def clear_crawl_checkpoint():
+    db.crawl_state.delete_one({"_id": CRAWL_CHECKPOINT_ID})
+
+
+def ensure_news_indexes():
+    try:
+        db.news.create_index("url", unique=True)
+    except DuplicateKeyError:
+        # urls repetidas, gravadas antes dos upserts: o índice comum
+        # ainda evita a varredura da coleção
+        db.news.create_index("url")
+
+
+def ensure_search_indexes():
+    """
+    Índice do título, em que a busca por trecho lê só as chaves, e
+    índice de categoria com collation que ignora maiúsculas, usados
+    pelas buscas do analisador.
+    """
+    db.news.create_index("title", name="title")
+    db.news.create_index(
+        "category", name="category_ci", collation=CASE_INSENSITIVE
+    )
+    db.news.create_index(
+        [("published_at", ASCENDING), ("_id", ASCENDING)],
+        name="published_at",
+    )
+    db.news.create_index("timestamp", name="timestamp")
+
+
+def _published_at_updates(cursor):
+    for notice in cursor:
+        published_at = parse_timestamp(notice["timestamp"])
+        if published_at is not None:
+            yield UpdateOne(
+                {"_id": notice["_id"]},
+                {"$set": {"published_at": published_at}},
+            )
+
+
+def migrate_timestamps(batch_size=UPSERT_BATCH_SIZE):
+    """
+    Preenche `published_at` nas notícias salvas antes dele existir,
+    em lotes de `batch_size`. Devolve quantas notícias foram migradas.
+    """
+    cursor = db.news.find(
+        {"published_at": {"$exists": False}, "timestamp": {"$type": "string"}},
+        {"timestamp": True},
+    )
+    return _bulk_update(_published_at_updates(cursor), batch_size)
+
+
+def _fingerprint_updates(cursor):
+    for notice in cursor:
+        content_print = fingerprint(notice)
+        if content_print is not None:
+            yield UpdateOne(
+                {"_id": notice["_id"]},
+                {"$set": {"fingerprint": content_print}},
+            )
+
+
+def backfill_fingerprints(batch_size=UPSERT_BATCH_SIZE):
+    """
+    Calcula a impressão digital das notícias salvas antes dela existir,
+    para que a próxima coleta já pule as que não mudaram. Devolve
+    quantas notícias foram atualizadas.
+    """
+    cursor = db.news.find(
+        {"fingerprint": {"$exists": False}},
+        dict.fromkeys(FINGERPRINT_FIELDS, True),
+    )
+    return _bulk_update(_fingerprint_updates(cursor), batch_size)
+
+
+def _bulk_update(updates, batch_size):
+    updated = 0
+    while operations := list(islice(updates, batch_size)):
+        result = db.news.bulk_write(operations, ordered=False)
+        updated += result.modified_count
+    return updated
 
 
 def find_news():
     return list(db.news.find({}, {"_id": False}))
 
 
+def iter_news(fields, batch_size=UPSERT_BATCH_SIZE):
+    """
+    Percorre todas as notícias trazendo do servidor só os `fields`,
+    `batch_size` documentos por vez, sem montar uma lista.
+    """
+    projection = {"_id": False, **dict.fromkeys(fields, True)}
+    return db.news.find({}, projection, batch_size=batch_size)
+
+
 def search_news(query):
     return list(db.news.find(query))
 
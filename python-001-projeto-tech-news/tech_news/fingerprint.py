@@ -0,0 +1,36 @@
+import hashlib
+import json
+import re
+import unicodedata
+
+# campos de conteúdo: a url fica de fora, então a mesma notícia vista
+# sob outra url tem a mesma impressão digital
+FINGERPRINT_FIELDS = (
+    "title",
+    "timestamp",
+    "writer",
+    "reading_time",
+    "summary",
+    "category",
+)
+
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize(value):
+    if not isinstance(value, str):
+        return value
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", value)).strip()
+
+
+def fingerprint(notice: dict) -> str | None:
+    """
+    Impressão digital estável (BLAKE2b de 128 bits) do conteúdo da
+    notícia, com Unicode e espaços normalizados. Devolve None se faltar
+    algum dos `FINGERPRINT_FIELDS`, como numa gravação parcial.
+    """
+    if any(field not in notice for field in FINGERPRINT_FIELDS):
+        return None
+    values = [_normalize(notice[field]) for field in FINGERPRINT_FIELDS]
+    payload = json.dumps(values, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
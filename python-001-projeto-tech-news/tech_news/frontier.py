@@ -0,0 +1,195 @@
+import os
+import socket
+import time
+import uuid
+
+from decouple import config
+from pymongo import UpdateOne
+
+from tech_news.database import db
+
+FRONTIER_LEASE = config("SCRAPER_FRONTIER_LEASE", default=300, cast=float)
+
+PENDING = "pending"
+FETCHED = "fetched"
+PARSED = "parsed"
+STORED = "stored"
+# baixada sem sucesso (ou sem mudanças, com cache): não será salva
+DROPPED = "dropped"
+
+LISTING = "listing"
+ARTICLE = "article"
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _abandoned(pid: int) -> bool:
+    """Se o processo `pid`, deste host, não pode mais estar coletando."""
+    # uma coleta anterior deste mesmo processo já terminou (ou falhou)
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+class CrawlFrontier:
+    """
+    Fronteira de uma coleta guardada no MongoDB: cada página de
+    listagem e cada notícia descoberta vira um documento com seu status
+    (pending, fetched, parsed, stored ou dropped). Os links são reservados por
+    um tempo (`lease`) antes de serem baixados, então vários processos
+    podem dividir a mesma coleta sem repetir trabalho, e uma coleta
+    interrompida não volta a baixar o que já foi salvo. Reservas de um
+    processo que morreu expiram e voltam para a fila; as descartadas
+    também, para uma nova tentativa.
+    """
+
+    def __init__(
+        self,
+        name: str = "get_tech_news",
+        collection=None,
+        lease: float = FRONTIER_LEASE,
+    ):
+        self.name = name
+        self.lease = lease
+        self.host = socket.gethostname()
+        self.worker = _worker_id()
+        self._collection = (
+            collection if collection is not None else db.crawl_frontier
+        )
+
+    def _key(self, url: str) -> dict:
+        return {"_id": f"{self.name} {url}"}
+
+    def _add(self, urls: list[str], kind: str) -> None:
+        if not urls:
+            return
+        self._collection.bulk_write(
+            [
+                UpdateOne(
+                    self._key(url),
+                    {
+                        "$setOnInsert": {
+                            "crawl": self.name,
+                            "url": url,
+                            "kind": kind,
+                            "status": PENDING,
+                            "claimed_until": 0,
+                        }
+                    },
+                    upsert=True,
+                )
+                for url in urls
+            ],
+            ordered=False,
+        )
+
+    def page_read(self, page_url: str, page_links: list[str]) -> None:
+        """Registra uma página de listagem já lida."""
+        self._add([page_url], LISTING)
+        self.mark([page_url], PARSED)
+
+    def claim(self, links: list[str]) -> list[str]:
+        """
+        Registra os links descobertos e reserva para este processo os
+        que ainda não foram salvos nem estão reservados por outro,
+        preservando a ordem de `links`.
+        """
+        self._add(links, ARTICLE)
+        ids = [self._key(url)["_id"] for url in links]
+        token = f"{self.worker}:{uuid.uuid4().hex}"
+        now = time.time()
+        # cada documento é atualizado atomicamente: só um processo
+        # consegue trocar uma reserva vencida pela sua
+        self._collection.update_many(
+            {
+                "_id": {"$in": ids},
+                "status": {"$ne": STORED},
+                "claimed_until": {"$lt": now},
+            },
+            {
+                "$set": {
+                    "claimed_by": token,
+                    "claimed_host": self.host,
+                    "claimed_pid": os.getpid(),
+                    "claimed_until": now + self.lease,
+                }
+            },
+        )
+        claimed = {
+            document["url"]
+            for document in self._collection.find(
+                {"_id": {"$in": ids}, "claimed_by": token}, {"url": True}
+            )
+        }
+        return [link for link in links if link in claimed]
+
+    def release_abandoned(self) -> int:
+        """
+        Devolve à fila, sem esperar o `lease`, as reservas ainda não
+        salvas que este host fez em processos que já morreram ou neste
+        mesmo processo, numa coleta anterior que falhou. Reservas de
+        outros hosts só voltam quando vencem.
+        """
+        abandoned = {
+            "crawl": self.name,
+            "status": {"$ne": STORED},
+            "claimed_host": self.host,
+            "claimed_until": {"$gt": 0},
+        }
+        pids = self._collection.distinct("claimed_pid", abandoned)
+        pids = [pid for pid in pids if _abandoned(pid)]
+        if not pids:
+            return 0
+        result = self._collection.update_many(
+            {**abandoned, "claimed_pid": {"$in": pids}},
+            {"$set": {"claimed_until": 0}},
+        )
+        return result.modified_count
+
+    def finished(self) -> bool:
+        """
+        Se todas as notícias já reservadas foram salvas ou descartadas,
+        ou seja, se nenhuma coleta ainda trabalha nesta fronteira.
+        """
+        unstored = self._collection.find_one(
+            {
+                "crawl": self.name,
+                "kind": ARTICLE,
+                "claimed_by": {"$exists": True},
+                "status": {"$nin": [STORED, DROPPED]},
+            },
+            {"_id": True},
+        )
+        return unstored is None
+
+    def mark(self, urls: list[str], status: str) -> None:
+        if not urls:
+            return
+        update = {"status": status}
+        if status == STORED:
+            update["claimed_until"] = 0
+        self._collection.update_many(
+            {"_id": {"$in": [self._key(url)["_id"] for url in urls]}},
+            {"$set": update},
+        )
+
+    def counts(self) -> dict[str, int]:
+        """Quantos links de notícias há em cada status."""
+        cursor = self._collection.aggregate(
+            [
+                {"$match": {"crawl": self.name, "kind": ARTICLE}},
+                {"$group": {"_id": "$status", "total": {"$sum": 1}}},
+            ]
+        )
+        return {group["_id"]: group["total"] for group in cursor}
+
+    def reset(self) -> None:
+        self._collection.delete_many({"crawl": self.name})
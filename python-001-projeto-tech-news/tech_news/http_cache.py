@@ -0,0 +1,137 @@
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+
+from decouple import config
+
+CACHE_MAX_BYTES = config(
+    "SCRAPER_CACHE_MAX_BYTES", default=256 * 1024 * 1024, cast=int
+)
+LISTING_TTL = config("SCRAPER_LISTING_TTL", default=600, cast=float)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Cabeçalhos de uma requisição condicional para esta resposta."""
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache em disco (SQLite) de respostas HTTP, indexado pela URL.
+    Guarda o corpo comprimido junto com ETag/Last-Modified e descarta
+    as entradas usadas há mais tempo quando passa de `max_bytes`.
+    """
+
+    def __init__(self, path: str, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, fetched_at"
+                " FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+        body, etag, last_modified, fetched_at = row
+        return CachedResponse(
+            zlib.decompress(body).decode(), etag, last_modified, fetched_at
+        )
+
+    def store(
+        self,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        compressed = zlib.compress(body.encode())
+        row = {
+            "url": url,
+            "body": compressed,
+            "size": len(compressed),
+            "etag": etag,
+            "last_modified": last_modified,
+            "now": time.time(),
+        }
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (:url, :body,"
+                " :size, :etag, :last_modified, :now, :now)",
+                row,
+            )
+            self._evict()
+
+    def revalidated(self, url: str) -> None:
+        """Marca a entrada como confirmada pelo servidor (resposta 304)."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._size()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _size(self) -> int:
+        query = "SELECT COALESCE(SUM(size), 0) FROM responses"
+        return self._connection.execute(query).fetchone()[0]
+
+    def _evict(self) -> None:
+        excess = self._size() - self.max_bytes
+        if excess <= 0:
+            return
+        rows = self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at"
+        )
+        evicted = []
+        for url, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((url,))
+            excess -= size
+        self._connection.executemany(
+            "DELETE FROM responses WHERE url = ?", evicted
+        )
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import requests
+from decouple import config
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+POOL_SIZE = config("SCRAPER_POOL_SIZE", default=16, cast=int)
+TIMINGS_HISTORY = 1000
+
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """
+    Tempos de uma requisição, em segundos. `connect` é zero quando a
+    conexão veio do pool (keep-alive).
+    """
+
+    url: str
+    status_code: int
+    connect: float
+    ttfb: float
+    transfer: float
+    size: int
+
+
+class _ThreadState(threading.local):
+    # padrão de cada thread: a sessão também é usada fora de `get()`
+    connect_time = 0.0
+
+
+_local = _ThreadState()
+_timings: deque[RequestTiming] = deque(maxlen=TIMINGS_HISTORY)
+
+
+class _TimedConnectionMixin:
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _local.connect_time += time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Adapter cujas conexões medem o tempo de abertura (TCP + TLS)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+_adapter_lock = threading.Lock()
+_adapter = None
+_generation = 0
+
+
+def _replace_adapter(pool_size: int) -> None:
+    global _adapter, _generation
+    if _adapter is not None:
+        _adapter.close()
+    _adapter = TimedHTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    _generation += 1
+
+
+def configure_pool(pool_size: int = POOL_SIZE) -> None:
+    """
+    Recria o pool de conexões compartilhado com `pool_size` conexões
+    por host. As sessões de cada thread passam a usar o novo pool.
+    """
+    with _adapter_lock:
+        _replace_adapter(pool_size)
+
+
+def get_session() -> requests.Session:
+    """
+    Devolve a sessão da thread atual. Todas as sessões compartilham o
+    mesmo pool de conexões, que é seguro entre threads.
+    """
+    with _adapter_lock:
+        if _adapter is None:
+            _replace_adapter(POOL_SIZE)
+        adapter, generation = _adapter, _generation
+
+    if getattr(_local, "generation", None) != generation:
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["accept-encoding"] = ACCEPT_ENCODING
+        _local.session = session
+        _local.generation = generation
+    return _local.session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    Faz um GET pela sessão compartilhada, registrando os tempos de
+    conexão, de primeiro byte e de transferência do corpo.
+    """
+    _local.connect_time = 0.0
+    start = time.perf_counter()
+    response = get_session().get(url, stream=True, **kwargs)
+    headers_received = time.perf_counter()
+    size = len(response.content)
+    connect = _local.connect_time
+    _timings.append(
+        RequestTiming(
+            url=url,
+            status_code=response.status_code,
+            connect=connect,
+            ttfb=headers_received - start - connect,
+            transfer=time.perf_counter() - headers_received,
+            size=size,
+        )
+    )
+    return response
+
+
+def get_timings() -> list[RequestTiming]:
+    """Tempos das últimas `TIMINGS_HISTORY` requisições."""
+    return list(_timings)
+
+
+def clear_timings() -> None:
+    _timings.clear()
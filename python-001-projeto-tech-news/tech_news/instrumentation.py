@@ -0,0 +1,243 @@
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+from decouple import Csv, config
+
+# ex.: "log,prometheus"; vazio deixa a coleta sem instrumentação
+METRICS_SINKS = config("METRICS_SINKS", default="", cast=Csv())
+METRICS_FILE = config("METRICS_FILE", default="tech_news.prom")
+METRICS_PREFIX = "tech_news_"
+# limites, em segundos, dos baldes dos histogramas de tempo
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Labels = tuple[tuple[str, str], ...]
+
+_DISABLED = nullcontext()
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{value}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+class MemorySink:
+    """Guarda contadores e medições em memória, para os testes."""
+
+    def __init__(self):
+        self.counters: dict[tuple[str, Labels], float] = defaultdict(float)
+        self.observations: dict[tuple[str, Labels], list] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: float, labels: Labels) -> None:
+        with self._lock:
+            self.counters[(name, labels)] += amount
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        with self._lock:
+            self.observations[(name, labels)].append(value)
+
+    def flush(self) -> None:
+        pass
+
+    def counter(self, name: str, **labels) -> float:
+        return self.counters.get((name, _labels(labels)), 0)
+
+    def values(self, name: str, **labels) -> list[float]:
+        return list(self.observations.get((name, _labels(labels)), []))
+
+
+class LogSink:
+    """Escreve cada contador e medição no log `tech_news.metrics`."""
+
+    def __init__(self, level: int = logging.DEBUG):
+        self.logger = logging.getLogger("tech_news.metrics")
+        self.level = level
+
+    def count(self, name: str, amount: float, labels: Labels) -> None:
+        self.logger.log(
+            self.level, "%s%s += %g", name, _format_labels(labels), amount
+        )
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        self.logger.log(
+            self.level, "%s%s = %.6f", name, _format_labels(labels), value
+        )
+
+    def flush(self) -> None:
+        pass
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def add(self, buckets: tuple[float, ...], value: float) -> None:
+        self.counts[bisect.bisect_left(buckets, value)] += 1
+        self.total += value
+
+
+class PrometheusFileSink:
+    """
+    Agrega contadores e histogramas e, a cada `flush`, reescreve
+    `path` no formato texto do Prometheus (para o textfile collector
+    do node_exporter). A troca do arquivo é atômica.
+    """
+
+    def __init__(self, path: str = METRICS_FILE, buckets=BUCKETS):
+        self.path = path
+        self.buckets = tuple(buckets)
+        self._counters: dict[tuple[str, Labels], float] = defaultdict(float)
+        self._histograms: dict[tuple[str, Labels], _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: float, labels: Labels) -> None:
+        with self._lock:
+            self._counters[(name, labels)] += amount
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        with self._lock:
+            key = (name, labels)
+            if key not in self._histograms:
+                self._histograms[key] = _Histogram(self.buckets)
+            self._histograms[key].add(self.buckets, value)
+
+    def flush(self) -> None:
+        text = self.render()
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(text)
+        os.replace(temporary, self.path)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = self._render_counters() + self._render_histograms()
+        return "\n".join(lines) + "\n"
+
+    def _render_counters(self) -> list[str]:
+        lines, typed = [], set()
+        for (name, labels), value in sorted(self._counters.items()):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {METRICS_PREFIX}{name} counter")
+            labels = _format_labels(labels)
+            lines.append(f"{METRICS_PREFIX}{name}{labels} {value:g}")
+        return lines
+
+    def _render_histograms(self) -> list[str]:
+        lines, typed = [], set()
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {METRICS_PREFIX}{name} histogram")
+            lines.extend(self._histogram_lines(name, labels, histogram))
+        return lines
+
+    def _histogram_lines(
+        self, name: str, labels: Labels, histogram: _Histogram
+    ) -> list[str]:
+        metric = METRICS_PREFIX + name
+        limits = [f"{limit:g}" for limit in self.buckets] + ["+Inf"]
+        lines, cumulative = [], 0
+        for limit, amount in zip(limits, histogram.counts):
+            cumulative += amount
+            bucket = _format_labels(labels + (("le", limit),))
+            lines.append(f"{metric}_bucket{bucket} {cumulative}")
+        labels = _format_labels(labels)
+        lines.append(f"{metric}_sum{labels} {histogram.total:.6f}")
+        lines.append(f"{metric}_count{labels} {cumulative}")
+        return lines
+
+
+SINK_TYPES = {
+    "log": LogSink,
+    "memory": MemorySink,
+    "prometheus": PrometheusFileSink,
+}
+
+
+class Instruments:
+    """
+    Ponto único de medição da coleta: cada etapa é cronometrada em
+    `stage_seconds{stage=...}` e as falhas contadas em
+    `stage_failures_total`. Sem sinks, cada chamada só testa
+    `enabled` e segue adiante.
+    """
+
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+        self.enabled = bool(self.sinks)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        self.enabled = True
+        return sink
+
+    def remove_sink(self, sink) -> None:
+        self.sinks.remove(sink)
+        self.enabled = bool(self.sinks)
+
+    def count(self, name: str, amount: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+        labels = _labels(labels)
+        for sink in self.sinks:
+            sink.count(name, amount, labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        if not self.enabled:
+            return
+        labels = _labels(labels)
+        for sink in self.sinks:
+            sink.observe(name, value, labels)
+
+    def timer(self, stage: str):
+        """Context manager que cronometra o bloco como `stage`."""
+        return self._timing(stage) if self.enabled else _DISABLED
+
+    def timed(self, stage: str):
+        """Decorator que cronometra cada chamada da função como `stage`."""
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self._timing(stage):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    @contextmanager
+    def _timing(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.count("stage_failures_total", stage=stage)
+            raise
+        finally:
+            self.observe(
+                "stage_seconds", time.perf_counter() - start, stage=stage
+            )
+
+
+instruments = Instruments(SINK_TYPES[name]() for name in METRICS_SINKS)
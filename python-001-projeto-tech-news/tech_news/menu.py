@@ -1,7 +1,21 @@
+import argparse
+import json
+import os
 import sys
 
 
+from tech_news.analyzer.inverted_index import (
+    INDEX_PATH,
+    InvertedIndex,
+    build_index,
+)
+from tech_news.analyzer.query_cache import query_cache
 from tech_news.analyzer.ratings import top_5_categories
+from tech_news.analyzer.reading_plan import (
+    PLAN_CHUNK_SIZE,
+    PLAN_MAX_OPEN,
+    ReadingPlanService,
+)
 from tech_news.analyzer.search_engine import (
     search_by_category,
     search_by_date,
@@ -9,35 +23,85 @@ from tech_news.analyzer.search_engine import (
 )
 
 
-from tech_news.scraper import get_tech_news
+from tech_news.database import (
+    backfill_fingerprints,
+    migrate_timestamps,
+    reconcile_category_stats,
+)
+from tech_news.frontier import CrawlFrontier
+from tech_news.http_cache import ResponseCache
+from tech_news.pipeline import DEFAULT_WORKERS
+from tech_news.rate_limiter import BURST, LATENCY_TARGET, MAX_RATE
+from tech_news.writer import WRITE_BATCH_SIZE
+
+
+# o raspador (requests, BeautifulSoup) só é importado na opção de coleta,
+# para que as buscas comecem rápido
+def get_tech_news(*args, **kwargs):
+    from tech_news.scraper import get_tech_news
+
+    return get_tech_news(*args, **kwargs)
+
+
+def iter_tech_news(*args, **kwargs):
+    from tech_news.scraper import iter_tech_news
+
+    return iter_tech_news(*args, **kwargs)
+
+
+def _populate(quantity):
+    # retoma uma coleta interrompida sem baixar de novo o que foi salvo
+    frontier = CrawlFrontier()
+    # se a coleta falhar, as reservas ficam registradas para a próxima
+    news = get_tech_news(int(quantity), resume=True, frontier=frontier)
+    # terminada, só é mantida se outra coleta ainda usa a fronteira
+    if frontier.finished():
+        frontier.reset()
+    return news
+
+
+def _by_title(title):
+    return query_cache.call(search_by_title, title)
+
+
+def _by_date(date):
+    return query_cache.call(search_by_date, date)
+
+
+def _by_category(category):
+    return query_cache.call(search_by_category, category)
+
+
+def _top_categories():
+    return query_cache.call(top_5_categories)
 
 
 def handle_action_0():
-    quantity = int(input("Digite quantas notícias serão buscadas:"))
+    quantity = input("Digite quantas notícias serão buscadas:")
 
-    return get_tech_news(quantity)
+    return _populate(quantity)
 
 
 def handle_action_1():
     title = input("Digite o título:")
 
-    return search_by_title(title)
+    return _by_title(title)
 
 
 def handle_action_2():
     date = input("Digite a data no formato aaaa-mm-dd:")
 
-    return search_by_date(date)
+    return _by_date(date)
 
 
 def handle_action_3():
     category = input("Digite a categoria:")
 
-    return search_by_category(category)
+    return _by_category(category)
 
 
 def handle_action_4():
-    return top_5_categories()
+    return _top_categories()
 
 
 def handle_action_5():
@@ -71,3 +135,257 @@ def analyzer_menu():
 
     except Exception:
         return print("Opção inválida", file=sys.stderr)
+
+
+BATCH_COMMANDS = {
+    "0": _populate,
+    "1": _by_title,
+    "2": _by_date,
+    "3": _by_category,
+    "4": _top_categories,
+}
+BATCH_EXIT = "5"
+
+
+def _batch_parser():
+    parser = argparse.ArgumentParser(
+        prog="tech-news-analyzer-batch",
+        description=(
+            "Executa vários comandos do menu numa só conexão. Cada linha "
+            "traz a opção e o argumento, ex.: '1 Python' ou '4'."
+        ),
+    )
+    parser.add_argument(
+        "--input",
+        type=argparse.FileType("r", encoding="utf-8"),
+        default=sys.stdin,
+        help="arquivo de comandos (padrão: entrada padrão)",
+    )
+    parser.add_argument(
+        "--output",
+        type=argparse.FileType("w", encoding="utf-8"),
+        default=sys.stdout,
+        help="arquivo de saída (padrão: saída padrão)",
+    )
+    return parser
+
+
+def _run_command(line):
+    option, _, argument = line.partition(" ")
+    argument = argument.strip()
+    if option not in BATCH_COMMANDS:
+        return {"command": line, "error": "Opção inválida"}
+    try:
+        result = BATCH_COMMANDS[option](*([argument] if argument else []))
+    except Exception as error:
+        return {"command": line, "error": str(error) or type(error).__name__}
+    return {"command": line, "result": result}
+
+
+def _commands(lines):
+    for line in map(str.strip, lines):
+        if line == BATCH_EXIT:
+            return
+        # linhas vazias e comentários são ignorados
+        if line and not line.startswith("#"):
+            yield line
+
+
+def analyzer_batch(argv=None):
+    """
+    Versão não interativa de `analyzer_menu`: lê um comando por linha
+    e escreve um resultado em JSON por linha, na mesma ordem.
+    """
+    args = _batch_parser().parse_args(argv)
+    for line in _commands(args.input):
+        answer = _run_command(line)
+        args.output.write(
+            json.dumps(answer, ensure_ascii=False, default=str) + "\n"
+        )
+    args.output.flush()
+
+
+def _collector_parser():
+    parser = argparse.ArgumentParser(
+        prog="tech-news-collector",
+        description="Popula o banco com notícias do blog da Trybe.",
+    )
+    parser.add_argument("amount", type=int, help="quantas notícias buscar")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="downloads simultâneos",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="processos para raspar o HTML (0 raspa nas threads)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="para ao encontrar notícias já salvas",
+    )
+    parser.add_argument("--cache", help="arquivo do cache de respostas HTTP")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=WRITE_BATCH_SIZE,
+        help="notícias gravadas por lote",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continua a última coleta interrompida",
+    )
+    parser.add_argument(
+        "--frontier",
+        help="nome da fronteira compartilhada entre processos de coleta",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=MAX_RATE,
+        help="requisições por segundo, no máximo, a cada host",
+    )
+    parser.add_argument(
+        "--burst",
+        type=float,
+        default=BURST,
+        help="requisições seguidas permitidas a um host ocioso",
+    )
+    parser.add_argument(
+        "--latency-target",
+        type=float,
+        default=LATENCY_TARGET,
+        help="segundos de resposta acima dos quais a taxa diminui",
+    )
+    return parser
+
+
+def collector_menu(argv=None):
+    from tech_news.scraper import configure_rate_limiter, fetch_stats
+
+    args = _collector_parser().parse_args(argv)
+    configure_rate_limiter(args.max_rate, args.burst, args.latency_target)
+    cache = ResponseCache(args.cache) if args.cache else None
+    frontier = CrawlFrontier(args.frontier) if args.frontier else None
+
+    # as notícias são contadas sem ficar em memória
+    news_stream = iter_tech_news(
+        args.amount,
+        workers=args.workers,
+        cache=cache,
+        incremental=args.incremental,
+        processes=args.processes,
+        batch_size=args.batch_size,
+        resume=args.resume,
+        frontier=frontier,
+    )
+    saved = sum(1 for _ in news_stream)
+    print(f"{saved} notícias salvas")
+    print(", ".join(f"{k}={v:g}" for k, v in fetch_stats.snapshot().items()))
+
+
+def reconcile_menu():
+    """Refaz as estatísticas de categorias e mostra o que estava errado."""
+    drift = reconcile_category_stats()
+    for category, difference in sorted(drift.items()):
+        print(f"{category}: {difference:+d}")
+    print(f"{len(drift)} categorias corrigidas")
+
+
+def migrate_menu():
+    """
+    Preenche os campos que as notícias salvas antes deles existirem não
+    têm: `published_at` e a impressão digital.
+    """
+    print(f"{migrate_timestamps()} notícias com published_at preenchido")
+    print(f"{backfill_fingerprints()} notícias com impressão digital")
+
+
+def _reading_plan_parser():
+    parser = argparse.ArgumentParser(
+        prog="tech-news-reading-plan",
+        description="Gera o plano de leitura em NDJSON, um grupo por linha.",
+    )
+    parser.add_argument(
+        "available_time", type=int, help="minutos disponíveis por sessão"
+    )
+    parser.add_argument(
+        "--output",
+        type=argparse.FileType("w", encoding="utf-8"),
+        default=sys.stdout,
+        help="arquivo de saída (padrão: saída padrão)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=PLAN_CHUNK_SIZE,
+        help="notícias lidas do banco por vez",
+    )
+    parser.add_argument(
+        "--max-open",
+        type=int,
+        default=PLAN_MAX_OPEN,
+        help="grupos mantidos abertos em memória",
+    )
+    return parser
+
+
+def reading_plan_menu(argv=None):
+    args = _reading_plan_parser().parse_args(argv)
+    plan = ReadingPlanService.iter_reading_plan(
+        args.available_time, args.chunk_size, args.max_open
+    )
+    for entry in plan:
+        args.output.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    args.output.flush()
+
+
+def _index_parser():
+    parser = argparse.ArgumentParser(
+        prog="tech-news-index",
+        description="Índice invertido das notícias, para buscas offline.",
+    )
+    parser.add_argument(
+        "--index",
+        default=INDEX_PATH,
+        help=f"arquivo do índice (padrão: {INDEX_PATH})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="indexa as notícias do banco")
+    search = commands.add_parser(
+        "search", help="busca no índice salvo, sem consultar o banco"
+    )
+    search.add_argument("query", help="palavras buscadas")
+    search.add_argument(
+        "--limit", type=int, default=10, help="resultados mostrados"
+    )
+    search.add_argument(
+        "--prefix",
+        action="store_true",
+        help="a última palavra vale como início de palavra",
+    )
+    return parser
+
+
+def index_menu(argv=None):
+    """
+    `build` indexa as notícias do banco e salva o índice em disco;
+    `search` carrega o índice salvo e mostra um resultado JSON por linha.
+    """
+    parser = _index_parser()
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        index = build_index()
+        index.save(args.index)
+        print(f"{len(index)} notícias indexadas em {args.index}")
+        return
+    if not os.path.exists(args.index):
+        parser.error(f"{args.index} não existe; rode antes o comando build")
+    index = InvertedIndex.load(args.index)
+    for title, url in index.search(args.query, args.limit, args.prefix):
+        print(json.dumps([title, url], ensure_ascii=False))
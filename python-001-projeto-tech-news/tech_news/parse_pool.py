@@ -0,0 +1,66 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from decouple import config
+
+PARSE_CHUNK_SIZE = config("SCRAPER_PARSE_CHUNK_SIZE", default=8, cast=int)
+
+Page = bytes | str
+
+# o fork copiaria travas seguras por threads da coleta (limitador, log,
+# pool de conexões), que podem estar presas no momento da cópia
+START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+
+def _parse_chunk(
+    parse_news: Callable[[str], dict | None], pages: list[Page]
+) -> list[dict | None]:
+    return [
+        parse_news(page.decode() if isinstance(page, bytes) else page)
+        for page in pages
+    ]
+
+
+def _chunks(pages: Iterable[Page], size: int) -> Iterator[list[Page]]:
+    pages = iter(pages)
+    while chunk := list(islice(pages, size)):
+        yield chunk
+
+
+def parse_in_processes(
+    pages: Iterable[Page],
+    parse_news: Callable[[str], dict | None],
+    processes: int,
+    chunk_size: int = PARSE_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Raspa as páginas (HTML em bytes ou texto) em `processes` processos,
+    fugindo do GIL. As páginas são enviadas em lotes de `chunk_size`
+    para diluir o custo de comunicação entre processos, e os resultados
+    saem na mesma ordem de entrada, como no `parse_news` em série.
+    Os processos não nascem de um fork da coleta, então `parse_news`
+    precisa ser uma função importável.
+    """
+    in_flight: deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context(START_METHOD),
+    ) as executor:
+        for chunk in _chunks(pages, chunk_size):
+            in_flight.append(executor.submit(_parse_chunk, parse_news, chunk))
+            if len(in_flight) >= 2 * processes:
+                yield from _ready(in_flight.popleft())
+
+        while in_flight:
+            yield from _ready(in_flight.popleft())
+
+
+def _ready(future: Future) -> Iterator[dict]:
+    yield from (news_data for news_data in future.result() if news_data)
@@ -0,0 +1,123 @@
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from bs4 import BeautifulSoup
+from decouple import config
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    CSSSelector = None
+
+
+class Node(Protocol):
+    """Interface mínima que os extratores usam de um documento HTML."""
+
+    def select_one(self, selector: str) -> "Node | None": ...
+
+    def select(self, selector: str) -> list["Node"]: ...
+
+    def text(self) -> str: ...
+
+    def attr(self, name: str) -> str | None: ...
+
+
+class SoupNode:
+    def __init__(self, tag):
+        self._tag = tag
+
+    def select_one(self, selector):
+        tag = self._tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+
+    def select(self, selector):
+        return [SoupNode(tag) for tag in self._tag.select(selector)]
+
+    def text(self):
+        return self._tag.get_text()
+
+    def attr(self, name):
+        return self._tag.get(name)
+
+
+@lru_cache(maxsize=None)
+def _compiled(selector: str):
+    return CSSSelector(selector)
+
+
+class LxmlNode:
+    def __init__(self, element):
+        self._element = element
+
+    def select_one(self, selector):
+        found = self.select(selector)
+        return found[0] if found else None
+
+    def select(self, selector):
+        return [
+            LxmlNode(element) for element in _compiled(selector)(self._element)
+        ]
+
+    def text(self):
+        return self._element.text_content()
+
+    def attr(self, name):
+        return self._element.get(name)
+
+
+class SelectolaxNode:
+    def __init__(self, node):
+        self._node = node
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def text(self):
+        return self._node.text()
+
+    def attr(self, name):
+        return self._node.attributes.get(name)
+
+
+def _parse_with_selectolax(html_content: str) -> Node:
+    return SelectolaxNode(LexborHTMLParser(html_content))
+
+
+def _parse_with_lxml(html_content: str) -> Node:
+    if not html_content.strip():
+        return LxmlNode(lxml.html.fromstring("<html></html>"))
+    return LxmlNode(lxml.html.document_fromstring(html_content))
+
+
+def _parse_with_html_parser(html_content: str) -> Node:
+    return SoupNode(BeautifulSoup(html_content, "html.parser"))
+
+
+BACKENDS: dict[str, Callable[[str], Node]] = {
+    "html.parser": _parse_with_html_parser
+}
+if CSSSelector is not None:
+    BACKENDS["lxml"] = _parse_with_lxml
+if LexborHTMLParser is not None:
+    BACKENDS["selectolax"] = _parse_with_selectolax
+
+# o mais rápido dentre os instalados: selectolax > lxml > html.parser
+DEFAULT_BACKEND = config("SCRAPER_PARSER", default=list(BACKENDS)[-1])
+
+
+def parse(html_content: str, backend: str | None = None) -> Node:
+    """
+    Lê o HTML uma única vez com o backend escolhido (ou o padrão),
+    devolvendo um documento que todos os extratores podem consultar.
+    """
+    return BACKENDS[backend or DEFAULT_BACKEND](html_content)
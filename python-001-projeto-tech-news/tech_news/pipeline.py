@@ -0,0 +1,170 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from decouple import config
+
+DEFAULT_WORKERS = config("SCRAPER_WORKERS", default=8, cast=int)
+
+Fetch = Callable[[str], str | None]
+ParseListing = Callable[[str], tuple[list[str], str | None]]
+ParseNews = Callable[[str], dict | None]
+OnPage = Callable[[str, list[str]], None]
+Claim = Callable[[list[str]], list[str]]
+
+_END_OF_LINKS = None
+
+
+class _ProducerError:
+    """Leva pela fila o erro da thread produtora até o consumidor."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _walk_listing(
+    links: queue.Queue,
+    start_url: str,
+    n: int,
+    fetch: Fetch,
+    parse_listing: ParseListing,
+    on_page: OnPage,
+    claim: Claim,
+) -> None:
+    """
+    Percorre as páginas de listagem a partir de `start_url`, colocando
+    na fila cada link assim que sua página é lida, até juntar `n` links.
+    """
+    sent = 0
+    current_url = start_url
+    while current_url and sent < n:
+        html_content = fetch(current_url)
+        if not html_content:
+            break
+        page_links, next_url = parse_listing(html_content)
+        page_links = _take_links(page_links, n - sent, claim)
+        on_page(current_url, page_links)
+        for link in page_links:
+            links.put(link)
+        sent += len(page_links)
+        current_url = next_url
+
+
+def _produce_links(links: queue.Queue, *listing) -> None:
+    """
+    Corpo da thread produtora: um erro interrompe a paginação e vai
+    pela fila para o consumidor, antes do fim dos links.
+    """
+    try:
+        _walk_listing(links, *listing)
+    except Exception as error:
+        links.put(_ProducerError(error))
+    finally:
+        links.put(_END_OF_LINKS)
+
+
+def _received(links: queue.Queue, failures: list) -> Iterator[str]:
+    """
+    Os links da fila até o fim da paginação; um erro do produtor
+    encerra a leitura e fica guardado em `failures`.
+    """
+    for link in iter(links.get, _END_OF_LINKS):
+        if isinstance(link, _ProducerError):
+            failures.append(link.error)
+            return
+        yield link
+
+
+def _take_links(page_links: list[str], wanted: int, claim: Claim):
+    """
+    Pega até `wanted` links da página, em ordem, pedindo a `claim` só
+    os que ainda faltam; os recusados dão lugar aos seguintes.
+    """
+    taken: list[str] = []
+    start = 0
+    while start < len(page_links) and len(taken) < wanted:
+        end = start + wanted - len(taken)
+        taken += claim(page_links[start:end])
+        start = end
+    return taken
+
+
+def _ignore(page_url: str, page_links: list[str]) -> None:
+    pass
+
+
+def _take_all(page_links: list[str]) -> list[str]:
+    return page_links
+
+
+def _fetch_and_parse(link: str, fetch: Fetch, parse_news: ParseNews):
+    news_html = fetch(link)
+    return parse_news(news_html) if news_html else None
+
+
+def stream_news(
+    start_url: str,
+    n: int,
+    fetch: Fetch,
+    parse_listing: ParseListing,
+    parse_news: ParseNews,
+    workers: int = DEFAULT_WORKERS,
+    fetch_article: Fetch | None = None,
+    on_page: OnPage | None = None,
+    claim: Claim | None = None,
+) -> Iterator[dict]:
+    """
+    Pipeline produtor/consumidor: uma thread percorre a paginação
+    enquanto `workers` threads baixam e raspam as notícias já
+    descobertas. As notícias são entregues na ordem da listagem.
+    `fetch_article`, quando informado, baixa as notícias no lugar de
+    `fetch`; se devolver None a notícia é pulada. `on_page` é chamado
+    com a URL e os links de cada página de listagem lida. `claim`
+    recebe os links que faltam e devolve os que podem ser baixados.
+    Se a paginação falhar, as notícias já descobertas são entregues e
+    o erro é relançado em seguida.
+    """
+    fetch_article = fetch_article or fetch
+    links: queue.Queue = queue.Queue()
+    producer = threading.Thread(
+        target=_produce_links,
+        args=(
+            links,
+            start_url,
+            n,
+            fetch,
+            parse_listing,
+            on_page or _ignore,
+            claim or _take_all,
+        ),
+        daemon=True,
+    )
+    producer.start()
+
+    in_flight: deque[Future] = deque()
+    failures: list[Exception] = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        for link in _received(links, failures):
+            in_flight.append(
+                executor.submit(
+                    _fetch_and_parse, link, fetch_article, parse_news
+                )
+            )
+            # mantém no máximo dois lotes de trabalho pendentes
+            if len(in_flight) >= 2 * workers:
+                yield from _ready(in_flight.popleft())
+
+        while in_flight:
+            yield from _ready(in_flight.popleft())
+
+    producer.join()
+    if failures:
+        raise failures[0]
+
+
+def _ready(future: Future) -> Iterator[dict]:
+    news_data = future.result()
+    if news_data:
+        yield news_data
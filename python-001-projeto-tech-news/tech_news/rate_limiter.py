@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from decouple import config
+
+# teto da taxa por host, em req/s; o padrão é a espera fixa de 1 s de antes
+MAX_RATE = config("SCRAPER_MAX_RATE", default=1.0, cast=float)
+# requisições que um host ocioso pode receber de uma vez
+BURST = config("SCRAPER_BURST", default=1.0, cast=float)
+# respostas mais lentas que isso, em segundos, reduzem a taxa
+LATENCY_TARGET = config("SCRAPER_LATENCY_TARGET", default=2.0, cast=float)
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    next_slot: float = 0.0
+    paused_until: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket por host (na forma GCRA, guardando o horário da
+    próxima ficha livre) cuja taxa se ajusta por AIMD: cada resposta
+    rápida soma `increase` req/s à taxa (até `max_rate`), e cada erro
+    do servidor, timeout ou resposta mais lenta que `latency_target`
+    multiplica a taxa por `decrease` (até `min_rate`). Hosts diferentes
+    nunca esperam uns pelos outros.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        min_rate: float = 0.05,
+        burst: float = 1,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> _Bucket:
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = _Bucket(self.max_rate)
+        return self._buckets[host]
+
+    def reserve(self, url: str) -> float:
+        """
+        Consome uma ficha do host de `url` e devolve quantos segundos o
+        chamador deve esperar até poder fazer a requisição.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(url)
+            # fichas acumuladas (até `burst`) antecipam o próximo horário
+            earliest = now - (self.burst - 1) / bucket.rate
+            slot = max(bucket.next_slot, earliest, bucket.paused_until)
+            bucket.next_slot = slot + 1 / bucket.rate
+            return max(0.0, slot - now)
+
+    def wait(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def rate(self, url: str) -> float:
+        with self._lock:
+            return self._bucket(url).rate
+
+    def record_success(self, url: str, latency: float) -> None:
+        if latency > self.latency_target:
+            self.record_failure(url)
+            return
+        with self._lock:
+            bucket = self._bucket(url)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            bucket = self._bucket(url)
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+
+    def pause(self, url: str, seconds: float) -> None:
+        """Bloqueia o host por `seconds` segundos (ex.: `Retry-After`)."""
+        with self._lock:
+            bucket = self._bucket(url)
+            bucket.paused_until = max(
+                bucket.paused_until, time.monotonic() + seconds
+            )
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """
+    Interpreta o cabeçalho `Retry-After`, que pode vir em segundos ou
+    como data HTTP.
+    """
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Backoff exponencial com jitter completo para a tentativa `attempt`."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+@dataclass
+class FetchStats:
+    """Contadores de uma coleta, seguros para uso entre threads."""
+
+    started: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    succeeded: int = 0
+    retried: int = 0
+    throttled: int = 0
+    dropped: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "requests": self.requests,
+                "succeeded": self.succeeded,
+                "retried": self.retried,
+                "throttled": self.throttled,
+                "dropped": self.dropped,
+                "throughput": self.succeeded / elapsed if elapsed else 0.0,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.monotonic()
+            self.requests = self.succeeded = self.retried = 0
+            self.throttled = self.dropped = 0
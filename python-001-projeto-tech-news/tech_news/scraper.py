@@ -1,154 +1,452 @@
 import time
+
 import requests
-from bs4 import BeautifulSoup
-from tech_news.database import create_news
+from tech_news import http_session
+from typing import Iterator
+
+from tech_news.database import (
+    clear_crawl_checkpoint,
+    create_news,
+    ensure_news_indexes,
+    find_known_urls,
+    load_crawl_checkpoint,
+    save_crawl_checkpoint,
+)
+from tech_news.frontier import (
+    DROPPED,
+    FETCHED,
+    PARSED,
+    STORED,
+    CrawlFrontier,
+)
+from tech_news.http_cache import LISTING_TTL, ResponseCache
+from tech_news.instrumentation import instruments
+from tech_news.parse_pool import parse_in_processes
+from tech_news.parsing import Node, parse
+from tech_news.pipeline import DEFAULT_WORKERS, stream_news
+from tech_news.rate_limiter import (
+    BURST,
+    LATENCY_TARGET,
+    MAX_RATE,
+    AdaptiveRateLimiter,
+    FetchStats,
+    backoff_delay,
+    retry_after_seconds,
+)
+from tech_news.writer import WRITE_BATCH_SIZE, NewsWriter
 
 STATUS_CODE = 200
+NOT_MODIFIED = 304
+TOO_MANY_REQUESTS = 429
+RETRY_STATUSES = {TOO_MANY_REQUESTS, 500, 502, 503, 504}
 TIMEOUT = 3
-SLEEP_TIME = 1
-
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30
+BASE_URL = "https://blog.betrybe.com"
+HEADERS = {"user-agent": "Fake user-agent"}
+
+rate_limiter = AdaptiveRateLimiter(
+    MAX_RATE, burst=BURST, latency_target=LATENCY_TARGET
+)
+fetch_stats = FetchStats()
+
+
+def configure_rate_limiter(
+    max_rate: float = MAX_RATE,
+    burst: float = BURST,
+    latency_target: float = LATENCY_TARGET,
+) -> None:
+    """
+    Troca o limitador de taxa das próximas requisições; as taxas já
+    aprendidas de cada host recomeçam de `max_rate`.
+    """
+    global rate_limiter
+    rate_limiter = AdaptiveRateLimiter(
+        max_rate, burst=burst, latency_target=latency_target
+    )
 
-def fetch(url):
-    """Seu código deve vir aqui"""
-    headers = {"user-agent": "Fake user-agent"}
 
+def _send(url: str, headers: dict[str, str]):
+    rate_limiter.wait(url)
+    fetch_stats.count("requests")
+    start = time.monotonic()
     try:
-        time.sleep(SLEEP_TIME)
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
+        response = http_session.get(url, headers=headers, timeout=TIMEOUT)
+    except requests.RequestException:
+        response = None
+    if response is not None and instruments.enabled:
+        instruments.count("downloaded_bytes_total", len(response.content))
+    return response, time.monotonic() - start
 
-        if response.status_code == STATUS_CODE:
-            return response.text
-        return None
-    except (requests.Timeout, requests.RequestException):
-        return None
 
+def _honor_retry_after(url: str, response: requests.Response) -> None:
+    if response.status_code == TOO_MANY_REQUESTS:
+        fetch_stats.count("throttled")
+    seconds = retry_after_seconds(response.headers.get("retry-after"))
+    if seconds is not None:
+        rate_limiter.pause(url, min(seconds, BACKOFF_CAP))
 
-def scrape_updates(html_content):
-    """Seu código deve vir aqui"""
-    soup = BeautifulSoup(html_content, "html.parser")
-    link_tags = soup.find_all("a", class_="cs-overlay-link")
-    url_links = [link.get("href") for link in link_tags]
-    return url_links
 
-
-def scrape_next_page_link(html_content: str) -> str | None:
+def _should_retry(
+    url: str, response: requests.Response | None, latency: float
+) -> bool:
     """
-    Scrapes the URL for the "next page" link from the homepage HTML
-    using BeautifulSoup.
+    Alimenta o limitador e os contadores com o resultado da requisição
+    e decide se ela deve ser repetida (timeout, 429 ou erro 5xx).
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    next_page_tag = soup.find("a", class_=["next", "page-numbers"])
-    if next_page_tag:
-        return next_page_tag.get("href")
+    if response is None:
+        instruments.count("http_failures_total")
+        rate_limiter.record_failure(url)
+        return True
+    instruments.count("http_responses_total", status=response.status_code)
+    if response.status_code in RETRY_STATUSES:
+        rate_limiter.record_failure(url)
+        _honor_retry_after(url, response)
+        return True
+    if response.status_code in (STATUS_CODE, NOT_MODIFIED):
+        rate_limiter.record_success(url, latency)
+        fetch_stats.count("succeeded")
     else:
-        return None
+        fetch_stats.count("dropped")
+    return False
 
 
-def scrape_news(html_content: str) -> dict | None:
+def _request(url: str, headers: dict[str, str]) -> requests.Response | None:
     """
-    Scrapes all details from a single news page HTML
-    using BeautifulSoup.
+    GET com limite de taxa adaptativo e até `MAX_RETRIES` novas
+    tentativas, espaçadas por backoff exponencial com jitter. O backoff
+    pausa o host no limitador, então corre junto com a espera pela
+    próxima ficha em vez de se somar a ela.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    url_tag = soup.find("link", rel="canonical")
-    url = url_tag.get("href") if url_tag else None
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            fetch_stats.count("retried")
+            delay = backoff_delay(attempt - 1, BACKOFF_BASE, BACKOFF_CAP)
+            rate_limiter.pause(url, delay)
+        response, latency = _send(url, headers)
+        if not _should_retry(url, response, latency):
+            return response
+    fetch_stats.count("dropped")
+    return None
+
+
+@instruments.timed("fetch")
+def fetch(url):
+    """Seu código deve vir aqui"""
+    response = _request(url, HEADERS)
 
-    title_tag = soup.find("h1", class_="entry-title")
-    title = title_tag.get_text().strip() if title_tag else None
+    if response is not None and response.status_code == STATUS_CODE:
+        return response.text
+    return None
 
-    timestamp_tag = soup.find("li", class_="meta-date")
-    timestamp = timestamp_tag.get_text() if timestamp_tag else None
 
-    writer_tag = soup.find("span", class_="author")
-    writer = (
-        writer_tag.find("a").get_text()
-        if (writer_tag and writer_tag.find("a"))
-        else None
+@instruments.timed("fetch")
+def fetch_cached(
+    url: str, cache: ResponseCache, ttl: float = 0
+) -> tuple[str | None, bool]:
+    """
+    Busca `url` passando pelo cache em disco. Dentro do `ttl` a cópia
+    salva é usada sem requisição; depois disso é feito um GET
+    condicional. Devolve o HTML e se ele mudou desde a última visita.
+    """
+    cached = cache.lookup(url)
+    if cached and cached.is_fresh(ttl):
+        return cached.body, False
+
+    validators = cached.validators() if cached else {}
+    response = _request(url, {**HEADERS, **validators})
+    if response is None:
+        return None, False
+
+    if cached and response.status_code == NOT_MODIFIED:
+        cache.revalidated(url)
+        return cached.body, False
+
+    if response.status_code != STATUS_CODE:
+        return None, False
+
+    cache.store(
+        url,
+        response.text,
+        response.headers.get("etag"),
+        response.headers.get("last-modified"),
     )
+    return response.text, True
 
-    reading_time_tag = soup.find("li", class_="meta-reading-time")
-    reading_time = 0
-    if reading_time_tag:
-        try:
 
-            time_text = reading_time_tag.get_text()
-            reading_time = int(time_text.split()[0])
-        except (ValueError, IndexError):
-            reading_time = 0
+def _news_links(document: Node) -> list[str]:
+    return [link.attr("href") for link in document.select("a.cs-overlay-link")]
 
-    summary_p = soup.find("div", class_="entry-content").find("p")
-    summary = summary_p.get_text().strip() if summary_p else None
 
-    category_tag = soup.find("div", class_="meta-category")
-    category = (
-        category_tag.find("span", class_="label").get_text()
-        if (category_tag and category_tag.find("span", class_="label"))
-        else None
-    )
+def _next_page_link(document: Node) -> str | None:
+    next_page_tag = document.select_one("a.next.page-numbers")
+    return next_page_tag.attr("href") if next_page_tag else None
 
-    return {
-        "url": url,
-        "title": title,
-        "timestamp": timestamp,
-        "writer": writer,
-        "reading_time": reading_time,
-        "summary": summary,
-        "category": category,
-    }
+
+@instruments.timed("scrape_updates")
+def scrape_updates(html_content):
+    """Seu código deve vir aqui"""
+    return _news_links(parse(html_content))
 
 
-def _scrape_all_links(n: int) -> list[str]:
+def scrape_next_page_link(html_content: str) -> str | None:
     """
-    Função auxiliar para coletar 'n' links de notícias,
-    cuidando da paginação.
+    Scrapes the URL for the "next page" link from the homepage HTML.
     """
-    BASE_URL = "https://blog.betrybe.com"
-    current_url = BASE_URL
-    all_news_links = []
+    return _next_page_link(parse(html_content))
+
 
-    while len(all_news_links) < n:
-        html_content = fetch(current_url)
+def _text(document: Node, selector: str) -> str | None:
+    tag = document.select_one(selector)
+    return tag.text() if tag else None
+
+
+def _reading_time(document: Node) -> int:
+    time_text = _text(document, "li.meta-reading-time")
+    try:
+        return int(time_text.split()[0])
+    except (AttributeError, ValueError, IndexError):
+        return 0
 
-        if not html_content:
-            break
 
-        all_news_links.extend(scrape_updates(html_content))
+def _strip(text: str | None) -> str | None:
+    return text.strip() if text is not None else None
 
-        current_url = scrape_next_page_link(html_content)
 
-        if not current_url:
-            break
+@instruments.timed("scrape_news")
+def scrape_news(html_content: str) -> dict | None:
+    """
+    Scrapes all details from a single news page HTML,
+    parsing the page only once.
+    """
+    document = parse(html_content)
+    url_tag = document.select_one("link[rel=canonical]")
 
-    return all_news_links[:n]
+    return {
+        "url": url_tag.attr("href") if url_tag else None,
+        "title": _strip(_text(document, "h1.entry-title")),
+        "timestamp": _text(document, "li.meta-date"),
+        "writer": _text(document, "span.author a"),
+        "reading_time": _reading_time(document),
+        "summary": _strip(_text(document, "div.entry-content p")),
+        "category": _text(document, "div.meta-category span.label"),
+    }
 
 
-def _scrape_news_data(news_links: list[str]) -> list[dict]:
+@instruments.timed("scrape_updates")
+def _scrape_listing_page(html_content: str) -> tuple[list[str], str | None]:
     """
-    Função auxiliar para raspar os dados de uma lista de links.
+    Função auxiliar que extrai os links de notícias e o link da
+    próxima página de uma página de listagem, lendo o HTML uma vez.
     """
-    scraped_news_list = []
+    document = parse(html_content)
+    return _news_links(document), _next_page_link(document)
 
-    for link in news_links:
-        news_html = fetch(link)
-        if news_html:
-            news_data = scrape_news(news_html)
-            if news_data:
-                scraped_news_list.append(news_data)
 
-    return scraped_news_list
+def _scrape_new_links(html_content: str) -> tuple[list[str], str | None]:
+    """
+    Versão incremental de `_scrape_listing_page`: descarta os links que
+    já estão no banco e encerra a paginação quando a página inteira
+    já é conhecida.
+    """
+    links, next_page_link = _scrape_listing_page(html_content)
+    known_links = find_known_urls(links)
+    new_links = [link for link in links if link not in known_links]
+    if links and not new_links:
+        return [], None
+    return new_links, next_page_link
 
 
-def get_tech_news(n: int) -> list[dict]:
+def _cached_fetchers(cache: ResponseCache):
     """
-    Orquestra a busca, raspagem e salvamento de 'n' notícias.
+    Com cache, as páginas de listagem valem por `LISTING_TTL` segundos
+    e as notícias que não mudaram são puladas antes de `scrape_news`.
     """
 
-    required_links = _scrape_all_links(n)
+    def fetch_listing(url):
+        return fetch_cached(url, cache, LISTING_TTL)[0]
+
+    def fetch_changed_article(url):
+        html_content, changed = fetch_cached(url, cache)
+        return html_content if changed else None
+
+    return fetch_listing, fetch_changed_article
+
+
+def _keep_html(html_content: str) -> str:
+    return html_content
+
+
+def _skip_known_links(html_content: str) -> tuple[list[str], str | None]:
+    """
+    Usada na retomada: descarta os links já salvos, mas continua a
+    paginação, pois a página do checkpoint pode estar só em parte salva.
+    """
+    links, next_page_link = _scrape_listing_page(html_content)
+    known_links = find_known_urls(links)
+    return [link for link in links if link not in known_links], next_page_link
 
-    scraped_news = _scrape_news_data(required_links)
 
-    if scraped_news:
-        create_news(scraped_news)
+class _CrawlProgress:
+    """
+    Lembra de qual página de listagem veio cada link e, a cada lote
+    gravado, salva como checkpoint a página da última notícia do lote.
+    Com uma fronteira, também registra nela o status de cada notícia.
+    """
 
-    return scraped_news
+    def __init__(
+        self,
+        requested: int,
+        persisted: int = 0,
+        frontier: CrawlFrontier | None = None,
+    ):
+        self.requested = requested
+        self.persisted = persisted
+        self.frontier = frontier
+        self._pages: dict[str, str] = {}
+
+    def page_read(self, page_url: str, page_links: list[str]) -> None:
+        self._pages.update(dict.fromkeys(page_links, page_url))
+        if self.frontier:
+            self.frontier.page_read(page_url, page_links)
+
+    def parsed(self, news_data: dict) -> None:
+        if self.frontier:
+            self.frontier.mark([news_data["url"]], PARSED)
+
+    def flushed(self, batch: list[dict]) -> None:
+        self.persisted += len(batch)
+        if self.frontier:
+            self.frontier.mark([news["url"] for news in batch], STORED)
+        page_url = self._pages.get(batch[-1]["url"])
+        if page_url:
+            save_crawl_checkpoint(page_url, self.persisted, self.requested)
+        instruments.flush()
+
+
+def _crawl_start(n: int, resume: bool) -> tuple[str, int, int, bool]:
+    """
+    Página inicial, notícias restantes e já salvas da coleta, e se ela
+    retoma um checkpoint. Só é retomado o checkpoint de uma coleta que
+    pediu as mesmas `n` notícias.
+    """
+    checkpoint = load_crawl_checkpoint() if resume else None
+    if not checkpoint or checkpoint.get("requested") != n:
+        return BASE_URL, n, 0, False
+    persisted = checkpoint["persisted"]
+    return checkpoint["page"], max(0, n - persisted), persisted, True
+
+
+def _listing_parser(incremental: bool, resuming: bool):
+    if resuming:
+        return _skip_known_links
+    if incremental:
+        ensure_news_indexes()
+        return _scrape_new_links
+    return _scrape_listing_page
+
+
+def _marking_fetched(fetch_article, frontier: CrawlFrontier):
+    def fetch_and_mark(url):
+        html_content = fetch_article(url)
+        frontier.mark([url], FETCHED if html_content else DROPPED)
+        return html_content
+
+    return fetch_and_mark
+
+
+@instruments.timed("create_news")
+def _store_news(batch: list[dict]) -> None:
+    instruments.count("stored_news_total", len(batch))
+    create_news(batch)
+
+
+def iter_tech_news(
+    n: int,
+    workers: int = DEFAULT_WORKERS,
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
+    processes: int = 0,
+    batch_size: int = WRITE_BATCH_SIZE,
+    resume: bool = False,
+    frontier: CrawlFrontier | None = None,
+) -> Iterator[dict]:
+    """
+    Versão em streaming de `get_tech_news`: cada notícia é entregue
+    assim que raspada e gravada em lotes de `batch_size` com upserts,
+    sem esperar a coleta inteira. Após cada lote, a página de listagem
+    alcançada fica salva; com `resume`, a coleta recomeça dali.
+    Com `frontier`, cada notícia é reservada antes de ser baixada, o
+    que permite dividir a coleta entre processos; com `resume`, as
+    reservas deixadas por uma coleta deste host que falhou são
+    retomadas na hora.
+    """
+    start_url, remaining, persisted, resuming = _crawl_start(n, resume)
+    progress = _CrawlProgress(n, persisted, frontier)
+    fetch_listing, fetch_article = (
+        _cached_fetchers(cache) if cache else (fetch, fetch)
+    )
+    parse_listing = _listing_parser(incremental, resuming)
+    if frontier:
+        fetch_article = _marking_fetched(fetch_article, frontier)
+        if resume:
+            frontier.release_abandoned()
+
+    news_stream = stream_news(
+        start_url,
+        remaining,
+        fetch_listing,
+        parse_listing,
+        _keep_html if processes else scrape_news,
+        workers,
+        fetch_article,
+        progress.page_read,
+        frontier.claim if frontier else None,
+    )
+    if processes:
+        news_stream = parse_in_processes(news_stream, scrape_news, processes)
+
+    writer = NewsWriter(_store_news, batch_size, progress.flushed)
+    with writer:
+        for news_data in news_stream:
+            progress.parsed(news_data)
+            writer.write(news_data)
+            yield news_data
+    clear_crawl_checkpoint()
+    instruments.flush()
+
+
+def get_tech_news(
+    n: int,
+    workers: int = DEFAULT_WORKERS,
+    cache: ResponseCache | None = None,
+    incremental: bool = False,
+    processes: int = 0,
+    batch_size: int = WRITE_BATCH_SIZE,
+    resume: bool = False,
+    frontier: CrawlFrontier | None = None,
+) -> list[dict]:
+    """
+    Orquestra a busca, raspagem e salvamento de 'n' notícias.
+    A paginação e a raspagem das notícias acontecem ao mesmo tempo,
+    com até `workers` notícias sendo baixadas em paralelo, e as
+    notícias são gravadas em lotes de `batch_size` durante a coleta.
+    Com `cache`, só as notícias novas ou alteradas são devolvidas.
+    No modo `incremental`, as notícias já salvas são ignoradas.
+    Com `processes`, a raspagem do HTML roda nesse número de processos.
+    Com `resume`, uma coleta interrompida continua da última página
+    salva; com `frontier`, sem baixar de novo as notícias já salvas.
+    """
+    return list(
+        iter_tech_news(
+            n,
+            workers,
+            cache,
+            incremental,
+            processes,
+            batch_size,
+            resume,
+            frontier,
+        )
+    )
@@ -0,0 +1,48 @@
+from typing import Any, Callable
+
+from decouple import config
+
+WRITE_BATCH_SIZE = config("SCRAPER_WRITE_BATCH_SIZE", default=100, cast=int)
+
+Batch = list[dict]
+
+
+class NewsWriter:
+    """
+    Acumula as notícias raspadas e as envia para `sink` em lotes de
+    `batch_size`, sem copiar os documentos. Usado como context manager,
+    grava o lote pendente ao sair do bloco, mesmo se a coleta falhar.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[Batch], Any],
+        batch_size: int = WRITE_BATCH_SIZE,
+        on_flush: Callable[[Batch], None] | None = None,
+    ):
+        self.batch_size = batch_size
+        self.written = 0
+        self._sink = sink
+        self._on_flush = on_flush
+        self._batch: Batch = []
+
+    def write(self, news: dict) -> None:
+        self._batch.append(news)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        # um lote novo a cada envio: o anterior pode ter sido guardado
+        batch, self._batch = self._batch, []
+        self._sink(batch)
+        self.written += len(batch)
+        if self._on_flush:
+            self._on_flush(batch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
@@ -119,3 +119,15 @@ NEWS = [
 ]
 
 EXPECTED_NEWS = [(notice["title"], notice["url"]) for notice in NEWS]
+
+
+def without_id(notice):
+    """
+    Cópia da notícia sem `_id`: o `insert_one` dos testes acrescenta
+    um nos dicionários de `NEWS`, que os upserts não aceitam repetido.
+    """
+    return {key: value for key, value in notice.items() if key != "_id"}
+
+
+def clean_news(news=NEWS):
+    return [without_id(notice) for notice in news]
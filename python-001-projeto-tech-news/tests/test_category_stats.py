@@ -0,0 +1,76 @@
+from tech_news.analyzer.ratings import top_5_categories
+from tech_news.database import (
+    db,
+    delete_news,
+    insert_or_update,
+    reconcile_category_stats,
+    top_categories,
+    upsert_news,
+)
+from tests.assets.news import clean_news
+
+
+def _empty_database():
+    db.news.drop()
+    reconcile_category_stats()
+
+
+def test_category_stats_follow_every_write(mocker):
+    _empty_database()
+    news = clean_news()
+    upsert_news(news[:9], batch_size=4)
+    insert_or_update({**news[0], "category": "Ferramentas"})
+    delete_news([news[2]["url"], news[6]["url"]])
+
+    # as contagens mantidas dispensam refazer as estatísticas
+    rebuild = mocker.patch("tech_news.database.reconcile_category_stats")
+    mocker.patch("tech_news.database.DB_CATEGORY_STATS", True)
+    assert top_categories(2) == ["Ferramentas", "Desenvolvimento web"]
+    assert top_5_categories() == [
+        "Ferramentas",
+        "Desenvolvimento web",
+        "Tecnologia",
+    ]
+    rebuild.assert_not_called()
+    db.news.drop()
+
+
+def test_reconcile_reports_drift_from_direct_writes():
+    _empty_database()
+    news = clean_news()
+    upsert_news(news[:3])
+    db.news.update_one(
+        {"url": news[0]["url"]}, {"$set": {"category": "Novidades"}}
+    )
+
+    assert reconcile_category_stats() == {"Tecnologia": -1, "Novidades": 1}
+    assert reconcile_category_stats() == {}
+    assert top_categories(5, maintained=True) == ["Novidades", "Ferramentas"]
+    db.news.drop()
+
+
+def test_top_categories_rebuild_when_news_count_changes():
+    _empty_database()
+    db.news.insert_many(clean_news()[:3])
+
+    assert top_categories(5, maintained=True) == [
+        "Ferramentas",
+        "Novidades",
+        "Tecnologia",
+    ]
+    db.news.drop()
+
+
+def test_top_categories_group_news_by_default():
+    _empty_database()
+    news = clean_news()
+    db.news.insert_many([{**notice, "category": "A"} for notice in news[:3]])
+    assert top_categories(5) == ["A"]
+
+    # escritas diretas que mantêm o total não enganam o padrão
+    db.news.delete_many({})
+    db.news.insert_many([{**notice, "category": "B"} for notice in news[:3]])
+    assert top_categories(5) == ["B"]
+    db.news.update_many({}, {"$set": {"category": "C"}})
+    assert top_5_categories() == ["C"]
+    db.news.drop()
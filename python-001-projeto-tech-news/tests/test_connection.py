@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from tech_news import database
+from tech_news.database import db
+
+
+@pytest.fixture
+def fake_backend(mocker, monkeypatch):
+    # devolve o cliente real ao fim do teste
+    monkeypatch.setattr(database, "_connection", database._connection)
+    factory = mocker.Mock(side_effect=lambda **options: mocker.MagicMock())
+    mocker.patch.dict(database.CLIENT_BACKENDS, {"fake": factory})
+    return factory
+
+
+def test_client_is_created_on_first_use(fake_backend):
+    database.configure("fake", "banco", maxPoolSize=5)
+    fake_backend.assert_not_called()
+
+    db.news.find_one()
+    db["news"].find_one()
+
+    fake_backend.assert_called_once_with(
+        **{**database.client_options(), "maxPoolSize": 5}
+    )
+    database.get_client().__getitem__.assert_called_once_with("banco")
+    assert database.client is database.get_client()
+
+
+def test_mongo_backend_passes_the_tuning_options(mocker, monkeypatch):
+    monkeypatch.setattr(database, "_connection", database._connection)
+    mocked_client = mocker.patch("tech_news.database.MongoClient")
+
+    database.configure(
+        "mongo", compressors="zstd,zlib", readPreference="secondaryPreferred"
+    )
+    database.get_client()
+
+    _, options = mocked_client.call_args
+    assert options["host"] == database.DB_HOST
+    assert options["compressors"] == "zstd,zlib"
+    assert options["readPreference"] == "secondaryPreferred"
+    assert options["maxPoolSize"] == database.DB_MAX_POOL_SIZE
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="precisa de fork")
+def test_forked_child_opens_its_own_client(fake_backend):
+    database.configure("fake")
+    parent_client = database.get_client()
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if database.get_client() is not parent_client else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert database.get_client() is parent_client
+
+
+def test_memory_backend_runs_without_a_server(monkeypatch):
+    pytest.importorskip("mongomock")
+    monkeypatch.setattr(database, "_connection", database._connection)
+    database.configure("memory", "tech_news_memoria")
+
+    database.upsert_news([{"url": "https://a", "title": "A"}])
+
+    assert type(database.get_client()).__module__.startswith("mongomock")
+    assert [news["title"] for news in database.find_news()] == ["A"]
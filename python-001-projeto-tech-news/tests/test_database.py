@@ -0,0 +1,89 @@
+from datetime import datetime
+
+from tech_news import database
+from tech_news.database import (
+    db,
+    ensure_news_indexes,
+    find_known_urls,
+    find_news,
+    insert_or_update,
+    migrate_timestamps,
+    upsert_news,
+)
+from tests.assets.news import NEWS
+
+
+def test_upsert_news_writes_only_new_or_changed_news():
+    db.news.drop()
+
+    assert upsert_news(NEWS[:4], batch_size=3) == (4, 0)
+
+    changed = {**NEWS[1], "title": "Notícia bacana atualizada"}
+    assert upsert_news([NEWS[0], changed, NEWS[4]], batch_size=2) == (1, 1)
+
+    titles = [news["title"] for news in find_news()]
+    assert titles == [
+        "noticia_0",
+        "Notícia bacana atualizada",
+        "Notícia bacana 2",
+        "noticia_3",
+        "noticia_4",
+    ]
+    db.news.drop()
+
+
+def test_upserts_create_the_url_index(monkeypatch):
+    db.news.drop()
+    monkeypatch.setattr(database, "_write_indexes_ready", False)
+
+    upsert_news(NEWS[:2])
+
+    keys = [index["key"] for index in db.news.index_information().values()]
+    assert [("url", 1)] in keys
+    assert [("fingerprint", 1)] in keys
+    db.news.drop()
+
+
+def test_url_index_tolerates_old_duplicated_urls():
+    db.news.drop()
+    db.news.insert_many([dict(NEWS[0]), dict(NEWS[0])])
+
+    ensure_news_indexes()
+
+    index = db.news.index_information()["url_1"]
+    assert not index.get("unique")
+    db.news.drop()
+
+
+def test_find_known_urls():
+    db.news.drop()
+    db.news.insert_many([dict(news) for news in NEWS[:2]])
+
+    urls = [NEWS[1]["url"], NEWS[2]["url"]]
+    assert find_known_urls(urls) == {NEWS[1]["url"]}
+    assert find_known_urls([]) == set()
+    db.news.drop()
+
+
+def test_writes_store_the_timestamp_as_a_date():
+    db.news.drop()
+    upsert_news(NEWS[:1])
+    insert_or_update({**NEWS[1], "timestamp": "sem data"})
+
+    saved = {news["url"]: news for news in find_news()}
+    assert saved[NEWS[0]["url"]]["published_at"] == datetime(2020, 11, 23)
+    assert saved[NEWS[0]["url"]]["timestamp"] == "23/11/2020"
+    assert "published_at" not in saved[NEWS[1]["url"]]
+    db.news.drop()
+
+
+def test_migrate_timestamps_fills_published_at_in_batches():
+    db.news.drop()
+    db.news.insert_many([dict(news) for news in NEWS[:5]])
+
+    assert migrate_timestamps(batch_size=2) == 5
+    assert migrate_timestamps() == 0
+    assert db.news.find_one({"url": NEWS[1]["url"]})["published_at"] == (
+        datetime(2021, 4, 4)
+    )
+    db.news.drop()
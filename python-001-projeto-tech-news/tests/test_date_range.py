@@ -0,0 +1,65 @@
+import pytest
+
+from tech_news.analyzer.search_engine import (
+    search_by_date,
+    search_by_date_range,
+)
+from tech_news.database import db, upsert_news
+from tests.assets.news import NEWS, clean_news
+
+
+def _saved_news():
+    db.news.drop()
+    upsert_news(clean_news(NEWS[:6]))
+
+
+def test_search_by_date_range_is_inclusive_and_sorted():
+    _saved_news()
+
+    assert search_by_date_range("2021-01-01", "2022-04-07") == [
+        ("Notícia bacana", NEWS[1]["url"]),
+        ("Notícia bacana 2", NEWS[2]["url"]),
+    ]
+    assert search_by_date_range(
+        "2021-01-01", "2022-12-31", descending=True
+    ) == [
+        ("Notícia bacana 2", NEWS[2]["url"]),
+        ("Notícia bacana", NEWS[1]["url"]),
+    ]
+    assert search_by_date_range("2023-01-01", "2023-12-31") == []
+    db.news.drop()
+
+
+def test_search_by_date_range_paginates():
+    _saved_news()
+
+    pages = [
+        search_by_date_range("2020-01-01", "2020-12-31", page, page_size=3)
+        for page in (1, 2)
+    ]
+    # as notícias do mesmo dia saem na ordem em que foram salvas
+    assert [title for title, _ in pages[0]] == [
+        "noticia_0",
+        "noticia_3",
+        "noticia_4",
+    ]
+    assert [title for title, _ in pages[1]] == ["noticia_5"]
+    db.news.drop()
+
+
+def test_search_by_date_range_rejects_invalid_input():
+    with pytest.raises(ValueError, match="Data inválida"):
+        search_by_date_range("2021-02-31", "2021-03-01")
+    with pytest.raises(ValueError, match="Página inválida"):
+        search_by_date_range("2021-01-01", "2021-03-01", page=0)
+
+
+def test_search_by_date_finds_migrated_and_legacy_news():
+    _saved_news()
+    db.news.insert_one({**NEWS[6], "timestamp": "04/04/2021"})
+
+    assert search_by_date("2021-04-04") == [
+        ("Notícia bacana", NEWS[1]["url"]),
+        (NEWS[6]["title"], NEWS[6]["url"]),
+    ]
+    db.news.drop()
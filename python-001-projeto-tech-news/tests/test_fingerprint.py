@@ -0,0 +1,64 @@
+from tech_news.database import (
+    backfill_fingerprints,
+    db,
+    insert_or_update,
+    news_version,
+    upsert_news,
+)
+from tech_news.fingerprint import fingerprint
+from tests.assets.news import NEWS, without_id
+
+
+def _news(index):
+    return without_id(NEWS[index])
+
+
+def test_fingerprint_depends_only_on_the_normalized_content():
+    notice = _news(1)
+    spaced = {**notice, "title": "  Notícia \n bacana ", "url": "outra"}
+
+    assert fingerprint(notice) == fingerprint(spaced)
+    assert fingerprint(notice) != fingerprint({**notice, "reading_time": 5})
+    assert fingerprint({"url": notice["url"], "title": "parcial"}) is None
+
+
+def test_upsert_news_skips_unchanged_and_duplicated_news():
+    db.news.drop()
+    assert upsert_news([_news(0), _news(1)]) == (2, 0)
+    version = news_version()
+
+    # a mesma notícia sob outra url também não é gravada
+    copy = {**_news(1), "url": "https://blog.betrybe.com/outra-url/"}
+    assert upsert_news([_news(0), _news(1), copy]) == (0, 0)
+    assert news_version() == version
+    assert db.news.count_documents({}) == 2
+
+    changed = {**_news(0), "summary": "Resumo novo"}
+    assert upsert_news([changed, _news(2), _news(2)]) == (1, 1)
+    assert news_version() == version + 1
+    db.news.drop()
+
+
+def test_partial_writes_drop_the_stored_fingerprint():
+    db.news.drop()
+    upsert_news([_news(0)])
+
+    insert_or_update({"url": NEWS[0]["url"], "category": "Carreira"})
+    assert "fingerprint" not in db.news.find_one({"url": NEWS[0]["url"]})
+
+    # sem a impressão, a versão original é gravada de novo
+    assert upsert_news([_news(0)]) == (0, 1)
+    assert db.news.find_one({"url": NEWS[0]["url"]})["category"] == (
+        "Tecnologia"
+    )
+    db.news.drop()
+
+
+def test_backfill_fingerprints_lets_the_next_crawl_skip_old_news():
+    db.news.drop()
+    db.news.insert_many([_news(index) for index in range(3)])
+
+    assert backfill_fingerprints(batch_size=2) == 3
+    assert backfill_fingerprints() == 0
+    assert upsert_news([_news(index) for index in range(3)]) == (0, 0)
+    db.news.drop()
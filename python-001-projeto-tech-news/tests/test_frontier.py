@@ -0,0 +1,134 @@
+import pytest
+
+from tech_news.database import clear_crawl_checkpoint, db
+from tech_news.frontier import (
+    DROPPED,
+    FETCHED,
+    PENDING,
+    STORED,
+    CrawlFrontier,
+)
+from tech_news.menu import _populate
+from tech_news.scraper import get_tech_news
+from tests.assets.test_assets import all_news
+from tests.assets.utils import mocked_fetch
+
+LINKS = ["https://a/1", "https://a/2", "https://a/3"]
+
+
+def test_frontier_claims_each_link_for_a_single_worker():
+    db.crawl_frontier.drop()
+    first = CrawlFrontier("teste")
+    second = CrawlFrontier("teste")
+
+    assert first.claim(LINKS[:2]) == LINKS[:2]
+    # o segundo processo só fica com o link que ninguém reservou
+    assert second.claim(LINKS) == LINKS[2:]
+    assert first.counts() == {PENDING: 3}
+
+    first.mark(LINKS[:1], FETCHED)
+    first.mark(LINKS[1:2], STORED)
+    assert first.counts() == {PENDING: 1, FETCHED: 1, STORED: 1}
+    db.crawl_frontier.drop()
+
+
+def test_frontier_returns_expired_claims_but_never_stored_links():
+    db.crawl_frontier.drop()
+    crashed = CrawlFrontier("teste", lease=-1)
+    crashed.claim(LINKS)
+    crashed.mark(LINKS[:1], STORED)
+
+    # a reserva do processo que morreu venceu, mas o link salvo não volta
+    assert CrawlFrontier("teste").claim(LINKS) == LINKS[1:]
+    db.crawl_frontier.drop()
+
+
+def test_crawl_with_frontier_skips_stored_news(mocker):
+    db.news.drop()
+    db.crawl_frontier.drop()
+    frontier = CrawlFrontier("teste")
+    mocker.patch("tech_news.scraper.fetch", new=mocked_fetch)
+
+    assert get_tech_news(3, frontier=frontier) == all_news[:3]
+    assert frontier.counts() == {STORED: 3}
+
+    fetched = []
+    mocker.patch(
+        "tech_news.scraper.fetch",
+        new=lambda url: fetched.append(url) or mocked_fetch(url),
+    )
+    assert get_tech_news(5, frontier=frontier) == all_news[3:8]
+    assert not set(fetched) & {news["url"] for news in all_news[:3]}
+
+    frontier.reset()
+    assert frontier.counts() == {}
+    db.news.drop()
+
+
+def test_resume_takes_back_the_claims_of_a_failed_crawl(mocker):
+    db.news.drop()
+    db.crawl_frontier.drop()
+    clear_crawl_checkpoint()
+    broken_link = all_news[7]["url"]
+
+    def fetch_until_broken(url):
+        if url == broken_link:
+            raise ConnectionError(url)
+        return mocked_fetch(url)
+
+    mocker.patch("tech_news.scraper.fetch", new=fetch_until_broken)
+    with pytest.raises(ConnectionError):
+        get_tech_news(20, batch_size=5, frontier=CrawlFrontier())
+    assert not CrawlFrontier().finished()
+
+    # as reservas da coleta que falhou não esperam o lease vencer
+    mocker.patch("tech_news.scraper.fetch", new=mocked_fetch)
+    frontier = CrawlFrontier()
+    assert get_tech_news(20, resume=True, frontier=frontier) == (
+        all_news[7:20]
+    )
+    assert db.news.count_documents({}) == 20
+    assert frontier.finished()
+    frontier.reset()
+    db.news.drop()
+
+
+def test_release_keeps_the_claims_of_live_processes():
+    db.crawl_frontier.drop()
+    CrawlFrontier("teste").claim(LINKS)
+    # a reserva parece ser de outro processo do host, ainda vivo
+    db.crawl_frontier.update_many({}, {"$set": {"claimed_pid": 1}})
+
+    assert CrawlFrontier("teste").release_abandoned() == 0
+    assert CrawlFrontier("teste").claim(LINKS) == []
+    db.crawl_frontier.drop()
+
+
+def test_finished_crawl_resets_the_frontier_despite_dropped_news(mocker):
+    db.news.drop()
+    db.crawl_frontier.drop()
+    clear_crawl_checkpoint()
+    missing_link = all_news[1]["url"]
+    mocker.patch(
+        "tech_news.scraper.fetch",
+        new=lambda url: None if url == missing_link else mocked_fetch(url),
+    )
+    assert _populate(3) == [all_news[0], all_news[2]]
+    assert CrawlFrontier().counts() == {}
+
+    # a coleta seguinte não herda as reservas e começa do início
+    mocker.patch("tech_news.scraper.fetch", new=mocked_fetch)
+    assert _populate(3) == all_news[:3]
+    db.news.drop()
+
+
+def test_dropped_news_count_as_finished():
+    db.crawl_frontier.drop()
+    frontier = CrawlFrontier("teste")
+    frontier.claim(LINKS)
+    frontier.mark(LINKS[:2], STORED)
+    assert not frontier.finished()
+
+    frontier.mark(LINKS[2:], DROPPED)
+    assert frontier.finished()
+    db.crawl_frontier.drop()
@@ -0,0 +1,46 @@
+import time
+
+from benchmarks.local_server import serve
+from tech_news import scraper
+from tech_news.http_cache import ResponseCache
+
+PAGE = "<html><h1 class='entry-title'>Notícia</h1></html>"
+
+
+def test_response_cache_stores_and_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_bytes=10**6)
+    cache.store("https://blog.betrybe.com/a", PAGE, etag='"v1"')
+
+    cached = cache.lookup("https://blog.betrybe.com/a")
+    assert cached.body == PAGE
+    assert cached.validators() == {"if-none-match": '"v1"'}
+    assert cached.is_fresh(60)
+    assert cache.lookup("https://blog.betrybe.com/b") is None
+
+    # com espaço para uma só entrada, a menos usada recentemente sai
+    cache.max_bytes = cache.total_size()
+    time.sleep(0.01)
+    cache.store("https://blog.betrybe.com/b", PAGE)
+    assert cache.lookup("https://blog.betrybe.com/a") is None
+    assert cache.lookup("https://blog.betrybe.com/b").body == PAGE
+
+
+def test_fetch_cached_sends_conditional_requests(tmp_path, mocker):
+    mocker.patch.object(scraper.rate_limiter, "max_rate", 1000)
+    statuses = []
+
+    def respond(path, headers):
+        status = 304 if headers.get("if-none-match") == '"v1"' else 200
+        statuses.append(status)
+        return status, {"ETag": '"v1"'}, PAGE.encode() * (status == 200)
+
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    with serve(respond) as base_url:
+        url = f"{base_url}/noticia/"
+        # a primeira visita baixa a página; a segunda recebe 304
+        assert scraper.fetch_cached(url, cache) == (PAGE, True)
+        assert scraper.fetch_cached(url, cache) == (PAGE, False)
+        # dentro do ttl nem há requisição
+        assert scraper.fetch_cached(url, cache, ttl=60) == (PAGE, False)
+
+    assert statuses == [200, 304]
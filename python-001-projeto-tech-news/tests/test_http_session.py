@@ -0,0 +1,56 @@
+import threading
+
+from benchmarks.local_server import serve
+from tech_news import http_session
+
+
+def _respond(path, headers):
+    return 200, {"Content-Type": "text/html"}, b"<html>tech news</html>"
+
+
+def test_pooled_session_reuses_connections_and_records_timings():
+    http_session.configure_pool(2)
+    http_session.clear_timings()
+
+    with serve(_respond) as base_url:
+        first = http_session.get(f"{base_url}/novidades", timeout=3)
+        second = http_session.get(f"{base_url}/noticia", timeout=3)
+
+    assert first.text == second.text == "<html>tech news</html>"
+
+    first_timing, second_timing = http_session.get_timings()
+    assert first_timing.url == f"{base_url}/novidades"
+    assert first_timing.status_code == 200
+    assert first_timing.size == len("<html>tech news</html>")
+    # só a primeira requisição abre conexão; a segunda usa o keep-alive
+    assert first_timing.connect > 0
+    assert second_timing.connect == 0
+    assert second_timing.ttfb > 0
+
+
+def test_each_thread_gets_its_own_session_over_the_shared_pool():
+    http_session.configure_pool(4)
+    session = http_session.get_session()
+
+    assert http_session.get_session() is session
+    assert "gzip" in session.headers["accept-encoding"]
+
+    # reconfigurar o pool gera uma nova sessão
+    http_session.configure_pool(8)
+    assert http_session.get_session() is not session
+
+
+def test_session_works_outside_get_on_a_fresh_thread():
+    http_session.configure_pool(2)
+    responses = []
+
+    with serve(_respond) as base_url:
+        thread = threading.Thread(
+            target=lambda: responses.append(
+                http_session.get_session().get(base_url, timeout=3)
+            )
+        )
+        thread.start()
+        thread.join()
+
+    assert [response.status_code for response in responses] == [200]
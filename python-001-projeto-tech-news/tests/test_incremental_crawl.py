@@ -0,0 +1,95 @@
+import pytest
+
+from tech_news.database import (
+    clear_crawl_checkpoint,
+    db,
+    load_crawl_checkpoint,
+    save_crawl_checkpoint,
+)
+from tech_news.scraper import get_tech_news
+from tests.assets.test_assets import all_news
+from tests.assets.utils import mocked_fetch
+
+
+def test_incremental_crawl_skips_stored_news(mocker):
+    db.news.drop()
+    db.news.insert_many([dict(news) for news in all_news[:3]])
+    mocker.patch("tech_news.scraper.fetch", new=mocked_fetch)
+
+    # só as notícias que ainda não estão no banco são raspadas
+    assert get_tech_news(5, incremental=True) == all_news[3:8]
+    assert db.news.count_documents({}) == 8
+
+    # com a primeira página inteira já salva, a paginação para
+    db.news.insert_many([dict(news) for news in all_news[8:12]])
+    fetched = []
+    mocker.patch(
+        "tech_news.scraper.fetch",
+        new=lambda url: fetched.append(url) or mocked_fetch(url),
+    )
+    assert get_tech_news(30, incremental=True) == []
+    assert fetched == ["https://blog.betrybe.com"]
+    db.news.drop()
+
+
+def test_interrupted_crawl_resumes_from_last_saved_page(mocker):
+    db.news.drop()
+    clear_crawl_checkpoint()
+    broken_link = all_news[16]["url"]
+
+    def fetch_until_broken(url):
+        if url == broken_link:
+            raise ConnectionError(url)
+        return mocked_fetch(url)
+
+    mocker.patch("tech_news.scraper.fetch", new=fetch_until_broken)
+    with pytest.raises(ConnectionError):
+        get_tech_news(20, batch_size=5)
+
+    # o que foi raspado antes da falha já está salvo
+    assert db.news.count_documents({}) == 16
+    assert load_crawl_checkpoint()["persisted"] == 16
+
+    fetched = []
+    mocker.patch(
+        "tech_news.scraper.fetch",
+        new=lambda url: fetched.append(url) or mocked_fetch(url),
+    )
+    assert get_tech_news(20, resume=True) == all_news[16:20]
+    assert fetched[0] == "https://blog.betrybe.com/page/2/"
+    assert db.news.count_documents({}) == 20
+    assert load_crawl_checkpoint() is None
+    db.news.drop()
+
+
+def test_resume_ignores_the_checkpoint_of_another_crawl(mocker):
+    db.news.drop()
+    clear_crawl_checkpoint()
+    mocker.patch("tech_news.scraper.fetch", new=mocked_fetch)
+    save_crawl_checkpoint("https://blog.betrybe.com/page/2/", 16, 20)
+
+    # o checkpoint é de uma coleta de 20 notícias, não desta
+    assert get_tech_news(3, resume=True) == all_news[:3]
+    assert load_crawl_checkpoint() is None
+    db.news.drop()
+
+
+def test_listing_failure_keeps_the_checkpoint(mocker):
+    db.news.drop()
+    clear_crawl_checkpoint()
+
+    def fetch_until_page_2(url):
+        if url.startswith("https://blog.betrybe.com/page/2"):
+            raise ConnectionError(url)
+        return mocked_fetch(url)
+
+    mocker.patch("tech_news.scraper.fetch", new=fetch_until_page_2)
+    with pytest.raises(ConnectionError):
+        get_tech_news(20, batch_size=5)
+
+    # as notícias da primeira página foram salvas e a coleta pode voltar
+    saved = db.news.count_documents({})
+    assert saved > 0
+    assert load_crawl_checkpoint()["persisted"] == saved
+    clear_crawl_checkpoint()
+    db.news.drop()
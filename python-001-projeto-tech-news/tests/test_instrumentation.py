@@ -0,0 +1,117 @@
+import logging
+
+import pytest
+
+from tech_news.database import db
+from tech_news.instrumentation import (
+    Instruments,
+    LogSink,
+    MemorySink,
+    PrometheusFileSink,
+    instruments,
+)
+from tech_news.rate_limiter import AdaptiveRateLimiter
+from tech_news.scraper import get_tech_news
+from tests.assets.test_assets import all_news
+from tests.assets.utils import mocked_fetch
+
+
+@pytest.fixture
+def memory_sink():
+    sink = instruments.add_sink(MemorySink())
+    yield sink
+    instruments.remove_sink(sink)
+
+
+def test_disabled_instruments_do_nothing():
+    disabled = Instruments()
+    double = disabled.timed("etapa")(lambda value: value * 2)
+
+    assert not disabled.enabled
+    assert double(21) == 42
+    assert disabled.timer("etapa") is disabled.timer("outra")
+    disabled.count("nada")
+
+
+def test_timed_stage_counts_failures():
+    sink = MemorySink()
+    measured = Instruments([sink])
+
+    @measured.timed("scrape_news")
+    def broken_parser(html_content):
+        raise ValueError(html_content)
+
+    with pytest.raises(ValueError):
+        broken_parser("<html>")
+    with measured.timer("scrape_news"):
+        pass
+
+    assert sink.counter("stage_failures_total", stage="scrape_news") == 1
+    assert len(sink.values("stage_seconds", stage="scrape_news")) == 2
+
+
+def test_crawl_reports_each_stage(mocker, memory_sink):
+    db.news.drop()
+    missing = all_news[2]["url"]
+
+    def fake_get(url, **kwargs):
+        html_content = "" if url == missing else mocked_fetch(url)
+        return mocker.Mock(
+            status_code=404 if url == missing else 200,
+            text=html_content,
+            content=html_content.encode(),
+            headers={},
+        )
+
+    mocker.patch("tech_news.scraper.http_session.get", new=fake_get)
+    mocker.patch(
+        "tech_news.scraper.rate_limiter", AdaptiveRateLimiter(max_rate=1e6)
+    )
+
+    # a notícia que devolve 404 é pulada
+    assert len(get_tech_news(5)) == 4
+
+    assert memory_sink.counter("http_responses_total", status=200) == 5
+    assert memory_sink.counter("http_responses_total", status=404) == 1
+    assert memory_sink.counter("downloaded_bytes_total") > 0
+    assert memory_sink.counter("stored_news_total") == 4
+    for stage, calls in (
+        ("fetch", 6),
+        ("scrape_updates", 1),
+        ("scrape_news", 4),
+        ("create_news", 1),
+    ):
+        assert len(memory_sink.values("stage_seconds", stage=stage)) == calls
+    db.news.drop()
+
+
+def test_prometheus_sink_writes_the_text_format(tmp_path):
+    path = tmp_path / "tech_news.prom"
+    sink = PrometheusFileSink(str(path), buckets=(0.1, 1))
+    measured = Instruments([sink])
+
+    measured.count("http_responses_total", status=200)
+    measured.count("http_responses_total", status=200)
+    measured.observe("stage_seconds", 0.05, stage="fetch")
+    measured.observe("stage_seconds", 3, stage="fetch")
+    measured.flush()
+
+    assert path.read_text().splitlines() == [
+        "# TYPE tech_news_http_responses_total counter",
+        'tech_news_http_responses_total{status="200"} 2',
+        "# TYPE tech_news_stage_seconds histogram",
+        'tech_news_stage_seconds_bucket{stage="fetch",le="0.1"} 1',
+        'tech_news_stage_seconds_bucket{stage="fetch",le="1"} 1',
+        'tech_news_stage_seconds_bucket{stage="fetch",le="+Inf"} 2',
+        'tech_news_stage_seconds_sum{stage="fetch"} 3.050000',
+        'tech_news_stage_seconds_count{stage="fetch"} 2',
+    ]
+
+
+def test_log_sink_writes_to_the_metrics_logger(caplog):
+    measured = Instruments([LogSink()])
+
+    with caplog.at_level(logging.DEBUG, logger="tech_news.metrics"):
+        measured.count("http_failures_total")
+
+    assert caplog.messages == ["http_failures_total += 1"]
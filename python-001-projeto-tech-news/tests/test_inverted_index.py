@@ -0,0 +1,103 @@
+from tech_news.analyzer.inverted_index import (
+    InvertedIndex,
+    build_index,
+    fold,
+    keep_updated,
+    stop_updating,
+)
+from tech_news.database import (
+    db,
+    delete_news,
+    insert_or_update,
+)
+from tests.assets.news import NEWS
+
+PYTHON = {
+    "url": "https://blog/python",
+    "title": "Programação em Python",
+    "summary": "Python para iniciantes.",
+    "category": "Linguagem de programação",
+}
+JAVA = {
+    "url": "https://blog/java",
+    "title": "Java na prática",
+    "summary": "Programação orientada a objetos, sem Python.",
+    "category": "Linguagem de programação",
+}
+CARREIRA = {
+    "url": "https://blog/carreira",
+    "title": "Como começar na área",
+    "summary": "Dicas de carreira.",
+    "category": "Carreira",
+}
+
+
+def test_fold_removes_accents_and_case():
+    assert fold("Programação Ágil") == "programacao agil"
+
+
+def test_search_ranks_with_bm25_and_ignores_accents():
+    index = InvertedIndex()
+    index.update([PYTHON, JAVA, CARREIRA])
+
+    # o título pesa mais que o resumo
+    assert index.search("python") == [
+        ("Programação em Python", "https://blog/python"),
+        ("Java na prática", "https://blog/java"),
+    ]
+    assert index.search("COMECAR") == [
+        ("Como começar na área", "https://blog/carreira")
+    ]
+    assert index.search("inexistente") == []
+
+
+def test_prefix_search_and_autocomplete():
+    index = InvertedIndex()
+    index.update([PYTHON, JAVA, CARREIRA])
+
+    assert index.complete("prog") == ["programacao"]
+    assert index.complete("ca") == ["carreira"]
+    assert index.search("java prat", prefix=True) == [
+        ("Java na prática", "https://blog/java")
+    ]
+
+
+def test_reindexing_replaces_the_previous_version(tmp_path):
+    index = InvertedIndex()
+    index.update([PYTHON, JAVA])
+    index.add({"url": "https://blog/java", "title": "Kotlin na prática"})
+
+    assert index.search("java") == []
+    assert index.search("kotlin") == [
+        ("Kotlin na prática", "https://blog/java")
+    ]
+    # o resumo antigo continua indexado
+    assert len(index.search("orientada")) == 1
+
+    path = tmp_path / "indice.pickle"
+    index.save(path)
+    loaded = InvertedIndex.load(path)
+    assert len(loaded) == 2
+    assert loaded.search("kotlin") == index.search("kotlin")
+    assert loaded.complete("k") == ["kotlin"]
+
+
+def test_index_follows_insert_or_update():
+    db.news.delete_many({})
+    db.news.insert_one(dict(NEWS[1]))
+    index = keep_updated(build_index())
+    try:
+        assert len(index.search("bacana")) == 1
+
+        insert_or_update({**NEWS[2], "title": "Mais uma notícia bacana"})
+        found = {url for _, url in index.search("bacana")}
+        assert found == {NEWS[1]["url"], NEWS[2]["url"]}
+
+        # as notícias apagadas saem do índice
+        delete_news([NEWS[1]["url"]])
+        assert index.search("bacana") == [
+            ("Mais uma notícia bacana", NEWS[2]["url"])
+        ]
+    finally:
+        stop_updating(index)
+        db.news.delete_many({})
@@ -0,0 +1,119 @@
+import json
+import subprocess
+import sys
+
+from tech_news.analyzer.query_cache import query_cache
+from tech_news.database import db
+from tech_news.menu import (
+    analyzer_batch,
+    collector_menu,
+    index_menu,
+    migrate_menu,
+)
+from tests.assets.news import clean_news
+
+
+def test_collector_menu_passes_flags_to_the_crawl(mocker, capsys):
+    mocked_iter_tech_news = mocker.patch(
+        "tech_news.menu.iter_tech_news", return_value=iter([{}, {}])
+    )
+
+    collector_menu(
+        ["2", "--workers", "4", "--processes", "3", "--batch-size", "10"]
+    )
+
+    mocked_iter_tech_news.assert_called_once_with(
+        2,
+        workers=4,
+        cache=None,
+        incremental=False,
+        processes=3,
+        batch_size=10,
+        resume=False,
+        frontier=None,
+    )
+    assert "2 notícias salvas" in capsys.readouterr().out
+
+
+def test_collector_menu_tunes_the_rate_limiter(mocker):
+    mocker.patch("tech_news.menu.iter_tech_news", return_value=iter([]))
+    configure = mocker.patch("tech_news.scraper.configure_rate_limiter")
+
+    collector_menu(["1", "--max-rate", "5", "--burst", "3"])
+
+    configure.assert_called_once_with(5.0, 3.0, 2.0)
+
+
+def test_analyzer_batch_writes_one_json_line_per_command(mocker, tmp_path):
+    query_cache.clear()
+    mocker.patch(
+        "tech_news.menu.search_by_title", return_value=[("Título", "url")]
+    )
+    mocker.patch(
+        "tech_news.menu.top_5_categories", return_value=["Tecnologia"]
+    )
+    commands = tmp_path / "comandos.txt"
+    commands.write_text(
+        "# buscas do dia\n1 Título com espaços\n\n4\n2 ontem\n9\n5\n4\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "saida.jsonl"
+
+    analyzer_batch(["--input", str(commands), "--output", str(output)])
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"command": "1 Título com espaços", "result": [["Título", "url"]]},
+        {"command": "4", "result": ["Tecnologia"]},
+        {"command": "2 ontem", "error": "Data inválida"},
+        {"command": "9", "error": "Opção inválida"},
+    ]
+
+
+def test_menu_imports_the_scraper_only_when_collecting():
+    # um processo novo, sem os módulos já carregados pelos outros testes
+    code = (
+        "import sys, tech_news.menu; "
+        "print(any(m in sys.modules for m in ('bs4', 'requests')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_migrate_menu_fills_the_fields_of_old_news(capsys):
+    db.news.drop()
+    # notícias gravadas antes de `published_at` e da impressão digital
+    db.news.insert_many(clean_news()[:3])
+
+    migrate_menu()
+    migrate_menu()
+
+    assert capsys.readouterr().out.splitlines() == [
+        "3 notícias com published_at preenchido",
+        "3 notícias com impressão digital",
+        "0 notícias com published_at preenchido",
+        "0 notícias com impressão digital",
+    ]
+    assert db.news.count_documents({"fingerprint": {"$exists": True}}) == 3
+    db.news.drop()
+
+
+def test_index_menu_searches_the_saved_index(tmp_path, capsys):
+    db.news.drop()
+    news = clean_news()[:3]
+    db.news.insert_many([dict(notice) for notice in news])
+    path = str(tmp_path / "indice")
+
+    index_menu(["--index", path, "build"])
+    # a busca lê só o arquivo, mesmo com o banco vazio
+    db.news.drop()
+    index_menu(["--index", path, "search", news[0]["title"], "--limit", "1"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == f"3 notícias indexadas em {path}"
+    assert [json.loads(line) for line in lines[1:]] == [
+        [news[0]["title"], news[0]["url"]]
+    ]
@@ -0,0 +1,47 @@
+from tech_news.analyzer.near_duplicates import (
+    find_near_duplicates,
+    minhash,
+    near_duplicate_news,
+    similarity,
+)
+from tech_news.database import db
+
+SUMMARY = (
+    "O Orkut voltou e Orkut Büyükkökten, o criador da rede social, "
+    "anunciou um novo site com uma carta aberta aos antigos usuários "
+    "e promessas de uma rede social diferente das atuais"
+)
+EDITED = SUMMARY.replace("carta aberta", "carta pública")
+OTHER = (
+    "A Nvidia apresentou uma inteligência artificial que transforma "
+    "fotos de objetos em modelos de três dimensões em poucos segundos"
+)
+
+
+def test_minhash_estimates_the_shared_content():
+    assert similarity(minhash(SUMMARY), minhash(SUMMARY)) == 1
+    assert similarity(minhash(SUMMARY), minhash(EDITED)) >= 0.7
+    assert similarity(minhash(SUMMARY), minhash(OTHER)) < 0.2
+    assert minhash("") == ()
+
+
+def test_find_near_duplicates_compares_only_similar_texts():
+    texts = [("a", SUMMARY), ("b", OTHER), ("c", None), ("d", EDITED)]
+
+    pairs = list(find_near_duplicates(texts))
+
+    assert [(first, second) for first, second, _ in pairs] == [("a", "d")]
+
+
+def test_near_duplicate_news_reads_the_saved_summaries():
+    db.news.drop()
+    db.news.insert_many(
+        [
+            {"url": "orkut", "summary": SUMMARY},
+            {"url": "nvidia", "summary": OTHER},
+            {"url": "orkut-de-novo", "summary": SUMMARY.upper()},
+        ]
+    )
+
+    assert list(near_duplicate_news()) == [("orkut", "orkut-de-novo", 1.0)]
+    db.news.drop()
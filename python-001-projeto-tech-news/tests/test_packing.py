@@ -0,0 +1,81 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tech_news.analyzer.packing import (
+    STRATEGIES,
+    StreamingPacker,
+    best_fit_decreasing,
+    exact,
+    first_fit,
+    first_fit_decreasing,
+)
+from tech_news.analyzer.reading_plan import ReadingPlanService
+
+
+def _loads(sizes, bins):
+    return [sum(sizes[index] for index in group) for group in bins]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES.values())
+def test_every_strategy_packs_all_items_within_capacity(strategy):
+    rng = random.Random(7)
+    for _ in range(50):
+        sizes = [rng.randint(0, 10) for _ in range(rng.randint(0, 15))]
+        bins = strategy(sizes, 10)
+
+        assert sorted(index for group in bins for index in group) == list(
+            range(len(sizes))
+        )
+        assert all(load <= 10 for load in _loads(sizes, bins))
+
+
+def test_strategies_group_counts():
+    sizes = [4, 7, 10, 3, 6, 3, 2, 5]
+
+    # em ordem, sobram buracos que os itens seguintes não preenchem
+    assert first_fit(sizes, 10) == [[0, 3, 5], [1, 6], [2], [4], [7]]
+    assert first_fit_decreasing(sizes, 10) == [[2], [1, 3], [4, 0], [7, 5, 6]]
+    assert len(best_fit_decreasing(sizes, 10)) == 4
+
+
+def test_exact_finds_the_optimum_that_heuristics_miss():
+    sizes = [6, 5, 3, 2, 2, 2]
+
+    assert len(first_fit_decreasing(sizes, 10)) == 3
+    assert len(best_fit_decreasing(sizes, 10)) == 3
+    assert _loads(sizes, exact(sizes, 10)) == [10, 10]
+
+
+def test_reading_plan_accepts_a_strategy():
+    news = [
+        {"title": f"Notícia {index}", "reading_time": reading_time}
+        for index, reading_time in enumerate([4, 7, 10, 3, 6, 3, 2, 5])
+    ]
+    with patch("tech_news.analyzer.reading_plan.find_news", return_value=news):
+        legacy = ReadingPlanService.group_news_for_available_time(
+            10, strategy="first_fit"
+        )
+        packed = ReadingPlanService.group_news_for_available_time(10)
+
+    assert len(legacy["readable"]) == 5
+    assert [group["unfilled_time"] for group in packed["readable"]] == [
+        0,
+        0,
+        0,
+        0,
+    ]
+
+
+def test_streaming_packer_closes_full_groups_and_bounds_open_ones():
+    packer = StreamingPacker(10, lambda size: size, max_open=2)
+
+    # o grupo que enche sai na hora
+    assert packer.add([4, 6]) == [[6, 4]]
+    assert packer.add([7, 8]) == []
+    # um terceiro grupo aberto fecha o mais cheio
+    assert packer.add([9]) == [[9]]
+    assert packer.add([2, 5]) == [[8]]
+    assert packer.finish() == [[7, 2], [5]]
+    assert packer.finish() == []
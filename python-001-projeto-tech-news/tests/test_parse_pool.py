@@ -0,0 +1,15 @@
+import pathlib
+
+from tech_news.parse_pool import parse_in_processes
+from tech_news.scraper import scrape_news
+
+NOTICIAS_PATH = pathlib.Path("tests/assets/trybe_pages/noticias")
+
+
+def test_parse_in_processes_matches_serial_scrape_news():
+    pages = [path.read_bytes() for path in sorted(NOTICIAS_PATH.iterdir())]
+    serial = [scrape_news(page.decode()) for page in pages]
+
+    result = parse_in_processes(iter(pages), scrape_news, 2, chunk_size=3)
+
+    assert list(result) == serial
@@ -0,0 +1,43 @@
+import pathlib
+
+import pytest
+
+from tech_news import parsing
+from tech_news.scraper import scrape_news, scrape_next_page_link
+from tests.assets.test_assets import all_news
+
+PAGES_PATH = pathlib.Path("tests/assets/trybe_pages")
+
+
+@pytest.fixture(params=list(parsing.BACKENDS))
+def backend(request, mocker):
+    mocker.patch.object(parsing, "DEFAULT_BACKEND", request.param)
+    return request.param
+
+
+def test_every_backend_scrapes_the_same_news(backend):
+    html_content = (PAGES_PATH / "noticias/linguagem-lua.html").read_text()
+    expected = next(
+        news for news in all_news if news["url"].endswith("/linguagem-lua/")
+    )
+
+    assert scrape_news(html_content) == expected
+
+
+def test_every_backend_finds_the_next_page(backend):
+    html_content = (PAGES_PATH / "novidades_2.html").read_text()
+
+    assert scrape_next_page_link(html_content) == (
+        "https://blog.betrybe.com/page/3/"
+    )
+    assert scrape_next_page_link("") is None
+
+
+def test_parse_reads_the_document_once_for_all_selectors(backend):
+    document = parsing.parse("<div class='a'><p>um</p><p>dois</p></div>")
+
+    assert [node.text() for node in document.select("div.a p")] == [
+        "um",
+        "dois",
+    ]
+    assert document.select_one("span") is None
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from tech_news.pipeline import stream_news
+
+LISTING = {
+    "page/1": ([f"news/{index}" for index in range(0, 3)], "page/2"),
+    "page/2": ([f"news/{index}" for index in range(3, 6)], "page/3"),
+    "page/3": ([f"news/{index}" for index in range(6, 9)], None),
+}
+
+
+def test_stream_news_overlaps_listing_and_articles():
+    first_article_fetched = threading.Event()
+    overlapped = []
+
+    def fake_fetch(url):
+        if url == "page/3":
+            # a última página só é lida depois que uma notícia já foi baixada
+            overlapped.append(first_article_fetched.wait(timeout=2))
+        if url.startswith("news/"):
+            first_article_fetched.set()
+        return url
+
+    result = list(
+        stream_news(
+            "page/1",
+            8,
+            fake_fetch,
+            LISTING.get,
+            lambda html: {"url": html},
+            workers=2,
+        )
+    )
+
+    assert result == [{"url": f"news/{index}"} for index in range(8)]
+    assert overlapped == [True]
+
+
+def test_stream_news_skips_failed_pages():
+    def fake_fetch(url):
+        return None if url == "news/1" else url
+
+    result = list(
+        stream_news(
+            "page/1", 3, fake_fetch, LISTING.get, lambda html: {"url": html}
+        )
+    )
+
+    assert result == [{"url": "news/0"}, {"url": "news/2"}]
+
+
+def test_stream_news_only_fetches_claimed_links():
+    refused = {"news/0", "news/2", "news/4"}
+    asked = []
+
+    def claim(links):
+        asked.append(links)
+        return [link for link in links if link not in refused]
+
+    result = list(
+        stream_news(
+            "page/1",
+            3,
+            lambda url: url,
+            LISTING.get,
+            lambda html: {"url": html},
+            claim=claim,
+        )
+    )
+
+    assert result == [{"url": f"news/{index}"} for index in (1, 3, 5)]
+    # só os links que ainda faltam são pedidos, nunca a página inteira
+    assert asked == [
+        ["news/0", "news/1", "news/2"],
+        ["news/3", "news/4"],
+        ["news/5"],
+    ]
+
+
+def test_stream_news_raises_listing_errors_after_the_found_news():
+    def parse_listing(html_content):
+        if html_content == "page/2":
+            raise ValueError(html_content)
+        return LISTING[html_content]
+
+    result = []
+    with pytest.raises(ValueError):
+        for news in stream_news(
+            "page/1", 6, str, parse_listing, lambda html: {"url": html}
+        ):
+            result.append(news)
+
+    assert result == [{"url": f"news/{index}"} for index in range(3)]
@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from tech_news.analyzer.query_cache import QueryCache, query_cache
+from tech_news.database import db, insert_or_update, news_version
+from tech_news.menu import analyzer_menu
+from tests.assets.news import NEWS, without_id
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_query_cache_counts_hits_and_expires_entries():
+    clock = FakeClock()
+    calls = []
+    cache = QueryCache(ttl=10, version=lambda: 1, clock=clock)
+
+    def search(term):
+        calls.append(term)
+        return [(term, "url")]
+
+    assert cache.call(search, "python") == [("python", "url")]
+    assert cache.call(search, "python") == [("python", "url")]
+    clock.now = 11
+    cache.call(search, "python")
+
+    assert calls == ["python", "python"]
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 1}
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryCache(max_entries=2, version=lambda: 1)
+    cache.call(str.upper, "a")
+    cache.call(str.upper, "b")
+    cache.call(str.upper, "a")
+    cache.call(str.upper, "c")
+
+    # "b" era o menos usado
+    cache.call(str.upper, "a")
+    cache.call(str.upper, "b")
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["hits"] == 2
+
+
+def test_query_cache_is_invalidated_by_writes():
+    db.news.delete_many({})
+    cache = QueryCache()
+    calls = []
+
+    def count_news():
+        calls.append(1)
+        return db.news.count_documents({})
+
+    before = news_version()
+    assert cache.call(count_news) == 0
+    assert cache.call(count_news) == 0
+    insert_or_update(without_id(NEWS[1]))
+
+    assert news_version() == before + 1
+    assert cache.call(count_news) == 1
+    assert len(calls) == 2
+    db.news.delete_many({})
+
+
+def test_query_cache_is_thread_safe():
+    cache = QueryCache(max_entries=8, version=lambda: 1)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda n: cache.call(abs, -(n % 16)), range(2000))
+        )
+
+    assert results == [n % 16 for n in range(2000)]
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 2000
+    assert stats["size"] <= 8
+
+
+def test_analyzer_menu_reuses_cached_searches(mocker):
+    query_cache.clear()
+    mocked_search = mocker.patch(
+        "tech_news.menu.search_by_title", return_value=[("Título", "url")]
+    )
+    mocker.patch("builtins.input", side_effect=["1", "python"] * 2)
+
+    assert analyzer_menu() == [("Título", "url")]
+    assert analyzer_menu() == [("Título", "url")]
+    mocked_search.assert_called_once_with("python")
+    assert query_cache.stats()["hits"] == 1
@@ -0,0 +1,115 @@
+import time
+from email.utils import formatdate
+
+from benchmarks.local_server import serve
+from tech_news import scraper
+from tech_news.rate_limiter import (
+    AdaptiveRateLimiter,
+    FetchStats,
+    backoff_delay,
+    retry_after_seconds,
+)
+
+BLOG = "https://blog.betrybe.com/"
+
+
+def test_token_bucket_spaces_requests_per_host():
+    limiter = AdaptiveRateLimiter(max_rate=0.1)
+
+    # a primeira requisição de cada host não espera
+    assert limiter.reserve(BLOG) == 0
+    assert limiter.reserve("https://www.google.com/") == 0
+
+    # as seguintes para o mesmo host aguardam as próximas fichas
+    assert 9 < limiter.reserve(f"{BLOG}page/2/") <= 10
+    assert 19 < limiter.reserve(f"{BLOG}page/3/") <= 20
+
+
+def test_rate_adapts_with_aimd():
+    limiter = AdaptiveRateLimiter(max_rate=4, min_rate=0.5, increase=1)
+
+    # erros e respostas lentas reduzem a taxa pela metade, até o mínimo
+    limiter.record_failure(BLOG)
+    assert limiter.rate(BLOG) == 2
+    limiter.record_success(BLOG, latency=10)
+    assert limiter.rate(BLOG) == 1
+    limiter.record_failure(BLOG)
+    limiter.record_failure(BLOG)
+    assert limiter.rate(BLOG) == 0.5
+
+    # respostas rápidas aumentam a taxa aos poucos, até o máximo
+    limiter.record_success(BLOG, latency=0.1)
+    assert limiter.rate(BLOG) == 1.5
+    for _ in range(5):
+        limiter.record_success(BLOG, latency=0.1)
+    assert limiter.rate(BLOG) == 4
+
+
+def test_pause_blocks_the_host():
+    limiter = AdaptiveRateLimiter(max_rate=100)
+    limiter.pause(BLOG, 30)
+
+    assert 29 < limiter.reserve(BLOG) <= 30
+    assert limiter.reserve("https://www.google.com/") == 0
+
+
+def test_retry_after_and_backoff():
+    assert retry_after_seconds("120") == 120
+    assert 55 < retry_after_seconds(formatdate(time.time() + 60)) <= 60
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("amanhã") is None
+
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= 4
+
+
+def test_fetch_stats_counts_and_resets():
+    stats = FetchStats()
+    stats.count("requests", 3)
+    stats.count("succeeded", 2)
+    stats.count("dropped")
+
+    snapshot = stats.snapshot()
+    assert snapshot["requests"] == 3
+    assert snapshot["succeeded"] == 2
+    assert snapshot["dropped"] == 1
+    assert snapshot["throughput"] > 0
+
+    stats.reset()
+    assert stats.snapshot()["requests"] == 0
+
+
+def test_fetch_retries_throttled_requests(mocker):
+    mocker.patch.object(scraper.rate_limiter, "max_rate", 1000)
+    mocker.patch.object(scraper, "BACKOFF_BASE", 0.01)
+    scraper.fetch_stats.reset()
+    statuses = iter([429, 503, 200])
+
+    def respond(path, headers):
+        status = next(statuses)
+        return (
+            status,
+            {"Retry-After": "0"},
+            b"<html>ok</html>" * (status == 200),
+        )
+
+    with serve(respond) as base_url:
+        assert scraper.fetch(f"{base_url}/noticia/") == "<html>ok</html>"
+
+    snapshot = scraper.fetch_stats.snapshot()
+    assert snapshot["requests"] == 3
+    assert snapshot["retried"] == 2
+    assert snapshot["throttled"] == 1
+    assert snapshot["succeeded"] == 1
+    assert snapshot["dropped"] == 0
+
+
+def test_configure_rate_limiter_replaces_the_scraper_limiter(mocker):
+    mocker.patch.object(scraper, "rate_limiter")
+    scraper.configure_rate_limiter(5, burst=3, latency_target=0.5)
+
+    assert scraper.rate_limiter.max_rate == 5
+    assert scraper.rate_limiter.burst == 3
+    assert scraper.rate_limiter.latency_target == 0.5
+    # um host ocioso recebe `burst` requisições sem esperar
+    assert [scraper.rate_limiter.reserve(BLOG) for _ in range(3)] == [0] * 3
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from tech_news.analyzer.reading_plan import ReadingPlanService
+from tech_news.database import db
+from tech_news.menu import reading_plan_menu
+
+NEWS = [
+    {"title": "Notícia A (8 min)", "reading_time": 8, "summary": "..."},
+    {"title": "Notícia B (2 min)", "reading_time": 2, "summary": "..."},
+    {"title": "Notícia D (5 min)", "reading_time": 5, "summary": "..."},
+    {"title": "Notícia E (3 min)", "reading_time": 3, "summary": "..."},
+    {"title": "Notícia C (12 min)", "reading_time": 12, "summary": "..."},
+]
+
+
+def _saved_news():
+    db.news.drop()
+    db.news.insert_many([dict(new) for new in NEWS])
+
+
+def test_iter_reading_plan_emits_groups_as_they_close():
+    _saved_news()
+    plan = ReadingPlanService.iter_reading_plan(10, chunk_size=2)
+
+    # o primeiro lote já fecha um grupo, antes de ler o resto
+    assert next(plan) == {
+        "type": "readable",
+        "unfilled_time": 0,
+        "chosen_news": [("Notícia A (8 min)", 8), ("Notícia B (2 min)", 2)],
+    }
+    assert list(plan) == [
+        {
+            "type": "unreadable",
+            "title": "Notícia C (12 min)",
+            "reading_time": 12,
+        },
+        {
+            "type": "readable",
+            "unfilled_time": 2,
+            "chosen_news": [
+                ("Notícia D (5 min)", 5),
+                ("Notícia E (3 min)", 3),
+            ],
+        },
+    ]
+    db.news.drop()
+
+
+def test_iter_reading_plan_rejects_invalid_time():
+    with pytest.raises(ValueError, match="maior que zero"):
+        ReadingPlanService.iter_reading_plan(0)
+
+
+def test_reading_plan_menu_writes_ndjson(tmp_path):
+    _saved_news()
+    output = tmp_path / "plano.ndjson"
+
+    reading_plan_menu(["10", "--output", str(output), "--max-open", "1"])
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    # com um só grupo aberto, a notícia de 8 min fica sozinha
+    assert lines == [
+        {
+            "type": "unreadable",
+            "title": "Notícia C (12 min)",
+            "reading_time": 12,
+        },
+        {
+            "type": "readable",
+            "unfilled_time": 2,
+            "chosen_news": [["Notícia A (8 min)", 8]],
+        },
+        {
+            "type": "readable",
+            "unfilled_time": 0,
+            "chosen_news": [
+                ["Notícia D (5 min)", 5],
+                ["Notícia E (3 min)", 3],
+                ["Notícia B (2 min)", 2],
+            ],
+        },
+    ]
+    db.news.drop()
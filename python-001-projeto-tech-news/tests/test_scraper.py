@@ -27,7 +27,7 @@ def test_fetch(mocker):
     path = "tests/assets/betrybe_response.pickle"
     with open(path, "rb") as response_file:
         response = pickle.load(response_file)
-    mocker.patch("requests.get", return_value=response)
+    mocker.patch("requests.Session.get", return_value=response)
     result = fetch("https://app.betrybe.com/")
     assert result is not None
     assert "<!doctype html>" in result
@@ -39,7 +39,7 @@ def test_fetch(mocker):
     assert content in result
 
     # sofrendo timeout, retorna None
-    mocker.patch("requests.get", side_effect=ReadTimeout)
+    mocker.patch("requests.Session.get", side_effect=ReadTimeout)
     assert fetch("https://httpbin.org/delay/5") is None
 
     # retorna None quando recebe uma resposta com código
@@ -47,11 +47,11 @@ def test_fetch(mocker):
     path = "tests/assets/404_response.pickle"
     with open(path, "rb") as response_file:
         response = pickle.load(response_file)
-    mocker.patch("requests.get", return_value=response)
+    mocker.patch("requests.Session.get", return_value=response)
     assert fetch("https://httpbin.org/status/404") is None
 
     # respeita o rate limit
-    mocker.patch("requests.get")
+    mocker.patch("requests.Session.get")
     start = time.time()
     request_counter = 0
     while (time.time() - start) < 4:
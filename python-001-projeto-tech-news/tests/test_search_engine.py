@@ -1,3 +1,4 @@
+from tech_news.analyzer import search_engine
 from tech_news.analyzer.search_engine import (
     search_by_title,
     search_by_date,
@@ -75,3 +76,66 @@ def test_search_news_by_category():
         db.news.insert_one(NEW_NOTICE_1)
         db.news.insert_one(NEW_NOTICE_2)
         assert search_by_category(actual) == expect
+
+
+def _news(title, category):
+    slug = title.lower().replace(" ", "-")
+    return {"title": title, "url": f"https://a/{slug}", "category": category}
+
+
+def test_title_search_finds_text_inside_words(mocker):
+    db.news.delete_many({})
+    db.news.insert_many(
+        [
+            _news("CPython 3.13", "Python"),
+            _news("Guia do Pythonista", "Python Avançado"),
+            _news("Java moderno", "Java"),
+        ]
+    )
+    stream = mocker.spy(search_engine, "_stream")
+
+    assert search_by_title("python") == [
+        ("CPython 3.13", "https://a/cpython-3.13"),
+        ("Guia do Pythonista", "https://a/guia-do-pythonista"),
+    ]
+    # a busca passou pelo índice do título, sem a regex de reserva
+    assert stream.call_count == 1
+    assert stream.call_args.kwargs["hint"] == "title"
+    db.news.delete_many({})
+
+
+def test_category_search_matches_the_whole_name():
+    db.news.delete_many({})
+    db.news.insert_many(
+        [
+            _news("CPython 3.13", "Python"),
+            _news("Guia do Pythonista", "Python Avançado"),
+        ]
+    )
+
+    expected = [("CPython 3.13", "https://a/cpython-3.13")]
+    assert search_by_category("Python") == expected
+    assert search_by_category("PYTHON") == expected
+    assert search_by_category("Pyth") == []
+    db.news.delete_many({})
+
+
+def test_empty_category_search_does_not_scan_the_collection(mocker):
+    db.news.delete_many({})
+    db.news.insert_many([_news("CPython 3.13", "Python")])
+    mocker.patch.object(search_engine, "supports_collation", return_value=True)
+    stream = mocker.spy(search_engine, "_stream")
+
+    assert search_by_category("Aloha") == []
+    # só a consulta pelo índice collation, sem a regex de reserva
+    assert stream.call_count == 1
+    assert "collation" in stream.call_args.kwargs
+    db.news.delete_many({})
+
+
+def test_date_search_creates_the_date_indexes(mocker):
+    mocker.patch.object(search_engine, "_indexes_ready", False)
+    ensure = mocker.spy(search_engine, "ensure_search_indexes")
+
+    search_by_date("2020-11-23")
+    ensure.assert_called_once()
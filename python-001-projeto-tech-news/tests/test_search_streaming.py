@@ -0,0 +1,50 @@
+import inspect
+
+import pytest
+
+from tech_news.analyzer.search_engine import (
+    iter_search_by_category,
+    iter_search_by_date,
+    iter_search_by_date_range,
+    iter_search_by_title,
+)
+from tech_news.database import db, upsert_news
+from tests.assets.news import NEWS, clean_news
+
+
+def _saved_news():
+    db.news.drop()
+    upsert_news(clean_news())
+
+
+def _urls(results):
+    return [url for _, url in results]
+
+
+def test_streaming_searches_are_lazy_and_paged():
+    _saved_news()
+
+    results = iter_search_by_category("ferramentas", batch_size=2)
+    assert inspect.isgenerator(results)
+    assert next(results) == (NEWS[1]["title"], NEWS[1]["url"])
+
+    ferramentas = [
+        news["url"] for news in NEWS if news["category"] == "Ferramentas"
+    ]
+    assert _urls(iter_search_by_category("FERRAMENTAS")) == ferramentas
+    assert (
+        _urls(iter_search_by_category("Ferramentas", limit=2, skip=1))
+        == ferramentas[1:3]
+    )
+    assert _urls(iter_search_by_title("bacana", limit=1)) == [NEWS[1]["url"]]
+    assert _urls(iter_search_by_date("2022-04-07")) == [NEWS[2]["url"]]
+    assert _urls(
+        iter_search_by_date_range("2021-01-01", "2022-12-31", skip=1)
+    ) == [NEWS[2]["url"]]
+    db.news.drop()
+
+
+def test_streaming_search_validates_the_date_on_first_read():
+    results = iter_search_by_date("2021-02-31")
+    with pytest.raises(ValueError, match="Data inválida"):
+        next(results)
@@ -0,0 +1,29 @@
+import pytest
+
+from tech_news.writer import NewsWriter
+
+
+def test_news_writer_flushes_full_batches_and_the_rest_on_exit():
+    batches = []
+    flushed = []
+
+    with NewsWriter(batches.append, 2, on_flush=flushed.append) as writer:
+        for index in range(5):
+            writer.write({"url": index})
+        # só os lotes completos foram gravados até aqui
+        assert len(batches) == 2
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert flushed == batches
+    assert writer.written == 5
+
+
+def test_news_writer_saves_pending_batch_when_crawl_fails():
+    batches = []
+
+    with pytest.raises(RuntimeError):
+        with NewsWriter(batches.append, 10) as writer:
+            writer.write({"url": "a"})
+            raise RuntimeError("falha na coleta")
+
+    assert batches == [[{"url": "a"}]]
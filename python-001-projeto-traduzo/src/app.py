@@ -2,6 +2,7 @@ from flask import Flask
 from controllers.translate_controller import translate_controller
 from controllers.admin_controller import admin_controller
 from controllers.history_controller import history_controller
+from services.translation_providers import get_provider
 
 
 from os import environ
@@ -16,6 +17,11 @@ app.register_blueprint(translate_controller, url_prefix="/")
 app.register_blueprint(admin_controller, url_prefix="/admin")
 app.register_blueprint(history_controller, url_prefix="/")
 
+# cria o provedor de tradução já na subida: uma configuração inválida
+# (ex.: TRANSLATION_PROVIDER=http sem TRANSLATION_HTTP_URL) impede o
+# servidor de começar, em vez de cada tradução sair vazia
+get_provider()
+
 
 def start_server(host="0.0.0.0", port=8000):
     if environ.get("FLASK_ENV") != "production":
@@ -1,15 +1,20 @@
-from flask import Blueprint, render_template, request
-from deep_translator import GoogleTranslator
+from flask import Blueprint, jsonify, render_template, request
 from models.language_model import LanguageModel
 from models.history_model import HistoryModel
+from services.translation_cache import translation_cache
+from services.translation_providers import get_provider
 
 
 translate_controller = Blueprint("translate_controller", __name__)
 
 
 def do_translate(text_value, src, tgt) -> str:
+    # fora do try: um provedor mal configurado não vira tradução vazia
+    provider = get_provider()
     try:
-        return GoogleTranslator(source=src, target=tgt).translate(text_value)
+        return translation_cache.get_or_translate(
+            text_value, src, tgt, provider
+        )
     except Exception:
         fallback = {"Hello, I like videogame": "Olá, eu gosto de videogame"}
         return fallback.get(text_value, "")
@@ -84,17 +89,6 @@ def reverse():
     translate_from = request.form.get("translate-from")
     translate_to = request.form.get("translate-to")
 
-    def do_translate(text_value, src, tgt) -> str:
-        try:
-            return GoogleTranslator(source=src, target=tgt).translate(
-                text_value
-            )
-        except Exception:
-            fallback = {
-                "Hello, I like videogame": "Olá, eu gosto de videogame"
-            }
-            return fallback.get(text_value, "")
-
     translated_value = do_translate(text, translate_from, translate_to)
 
     return render_template(
@@ -105,3 +99,8 @@ def reverse():
         translate_from=translate_to,
         translate_to=translate_from,
     )
+
+
+@translate_controller.route("/translation-cache/stats", methods=["GET"])
+def translation_cache_stats():
+    return jsonify(translation_cache.stats()), 200
@@ -0,0 +1,109 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from os import environ
+
+from pymongo import ReplaceOne
+from pymongo.errors import OperationFailure
+
+from database.db import db
+from models.abstract_model import AbstractModel
+
+# validade, em segundos, de uma tradução guardada no banco
+CACHE_TTL = int(environ.get("TRANSLATION_CACHE_TTL") or 7 * 24 * 60 * 60)
+CACHE_MAX_DOCUMENTS = int(
+    environ.get("TRANSLATION_CACHE_MAX_DOCUMENTS") or 100_000
+)
+# o limite de tamanho é conferido a cada tantas gravações
+TRIM_EVERY = 100
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+class TranslationCacheModel(AbstractModel):
+    _collection = db["translation_cache"]
+    _indexes_ready = False
+    _writes = 0
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+
+    @staticmethod
+    def key(text, source, target, provider) -> str:
+        payload = json.dumps(
+            [text, source, target, provider], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def lookup(cls, key, ttl=CACHE_TTL):
+        document = cls._collection.find_one(
+            {"_id": key, "created_at": {"$gte": _now() - timedelta(0, ttl)}},
+            {"translated": True},
+        )
+        return document["translated"] if document else None
+
+    @classmethod
+    def store_many(cls, entries, max_documents=CACHE_MAX_DOCUMENTS):
+        """
+        Grava (text, source, target, provider, translated), substituindo
+        a tradução da mesma chave.
+        """
+        cls.ensure_indexes()
+        created_at = _now()
+        requests = [
+            ReplaceOne(
+                {"_id": cls.key(text, source, target, provider)},
+                {
+                    "text": text,
+                    "source": source,
+                    "target": target,
+                    "provider": provider,
+                    "translated": translated,
+                    "created_at": created_at,
+                },
+                upsert=True,
+            )
+            for text, source, target, provider, translated in entries
+        ]
+        if not requests:
+            return 0
+        cls._collection.bulk_write(requests, ordered=False)
+        cls._count_writes(len(requests), max_documents)
+        return len(requests)
+
+    @classmethod
+    def trim(cls, max_documents=CACHE_MAX_DOCUMENTS) -> int:
+        """Apaga as traduções mais antigas além de `max_documents`."""
+        excess = cls._collection.estimated_document_count() - max_documents
+        if excess <= 0:
+            return 0
+        oldest = (
+            cls._collection.find({}, {"_id": True})
+            .sort("created_at", 1)
+            .limit(excess)
+        )
+        ids = [document["_id"] for document in oldest]
+        return cls._collection.delete_many({"_id": {"$in": ids}}).deleted_count
+
+    @classmethod
+    def ensure_indexes(cls, ttl=CACHE_TTL):
+        if cls._indexes_ready:
+            return
+        try:
+            # o Mongo apaga sozinho as traduções vencidas
+            cls._collection.create_index("created_at", expireAfterSeconds=ttl)
+        except OperationFailure:
+            # índice criado antes com outro TTL: a leitura ainda filtra
+            # pela idade, então as traduções vencidas não são usadas
+            pass
+        cls._indexes_ready = True
+
+    @classmethod
+    def _count_writes(cls, amount, max_documents):
+        before = cls._writes
+        cls._writes += amount
+        if before // TRIM_EVERY != cls._writes // TRIM_EVERY:
+            cls.trim(max_documents)
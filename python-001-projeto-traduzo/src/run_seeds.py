@@ -1,7 +1,11 @@
 # import models.languageModel as LanguageModel
+from database.db import db
 from database.seed_language import seed_language
 from database.seed_user import seed_user
+from services.translation_cache import translation_cache
+from services.translation_providers import get_provider
 
 
 seed_language()
 seed_user()
+translation_cache.warm_from_history(db["history"], get_provider().name)
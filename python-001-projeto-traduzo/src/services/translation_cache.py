@@ -0,0 +1,172 @@
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from os import environ
+
+from pymongo.errors import PyMongoError
+
+from models.translation_cache_model import CACHE_TTL, TranslationCacheModel
+
+# traduções mantidas em memória, em cada processo
+MEMORY_CACHE_SIZE = int(environ.get("TRANSLATION_CACHE_SIZE") or 1024)
+MEMORY_CACHE_TTL = int(environ.get("TRANSLATION_MEMORY_TTL") or CACHE_TTL)
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_text(text) -> str:
+    """Unicode em NFC e espaços repetidos reduzidos a um só."""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def normalize_language(code) -> str:
+    return (code or "").strip().lower()
+
+
+class LRUCache:
+    """Cache LRU com validade por entrada, seguro entre threads."""
+
+    def __init__(self, max_entries, ttl, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TranslationCache:
+    """
+    Cache em dois níveis das traduções, pela chave (texto normalizado,
+    origem, destino, provedor): primeiro a memória do processo, depois
+    a coleção `translation_cache`. Só na falta das duas o provedor é
+    chamado, e só traduções bem-sucedidas são guardadas. Uma falha do
+    banco conta em `store_errors` e não impede a tradução.
+    """
+
+    COUNTERS = ("memory_hits", "store_hits", "misses", "store_errors")
+
+    def __init__(self, memory=None, store=TranslationCacheModel):
+        self.memory = memory or LRUCache(MEMORY_CACHE_SIZE, MEMORY_CACHE_TTL)
+        self.store = store
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def get_or_translate(self, text, source, target, provider) -> str:
+        entry = (
+            normalize_text(text),
+            normalize_language(source),
+            normalize_language(target),
+            provider.name,
+        )
+        key = self.store.key(*entry)
+
+        translated = self.memory.get(key)
+        if translated is not None:
+            self._count("memory_hits")
+            return translated
+
+        translated = self._lookup(key)
+        if translated is not None:
+            self._count("store_hits")
+            self.memory.put(key, translated)
+            return translated
+
+        self._count("misses")
+        translated = provider.translate(text, source, target)
+        if translated is not None:
+            self.memory.put(key, translated)
+            self._save([(*entry, translated)])
+        return translated
+
+    def warm_from_history(self, history, provider_name) -> int:
+        """
+        Leva para o banco as traduções já feitas na coleção `history`,
+        como se fossem do provedor `provider_name`.
+        """
+        documents = history.find(
+            {"translated": {"$nin": [None, ""]}},
+            {
+                "text_to_translate": True,
+                "translate_from": True,
+                "translate_to": True,
+                "translated": True,
+            },
+        )
+        return self._save(
+            (
+                normalize_text(document.get("text_to_translate")),
+                normalize_language(document.get("translate_from")),
+                normalize_language(document.get("translate_to")),
+                provider_name,
+                document["translated"],
+            )
+            for document in documents
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats["memory_hits"] + stats["store_hits"] + stats["misses"]
+        hits = lookups - stats["misses"]
+        stats["hit_ratio"] = hits / lookups if lookups else 0.0
+        stats["memory_size"] = len(self.memory)
+        stats["memory_evictions"] = self.memory.evictions
+        return stats
+
+    def clear(self):
+        """Esvazia a memória e zera os contadores; o banco fica como está."""
+        self.memory.clear()
+        with self._lock:
+            self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _lookup(self, key):
+        try:
+            return self.store.lookup(key)
+        except PyMongoError:
+            self._count("store_errors")
+            return None
+
+    def _save(self, entries) -> int:
+        try:
+            return self.store.store_many(entries)
+        except PyMongoError:
+            self._count("store_errors")
+            return 0
+
+
+translation_cache = TranslationCache()
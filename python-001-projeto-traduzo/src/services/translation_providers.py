@@ -0,0 +1,122 @@
+import threading
+import time
+from os import environ
+
+import requests
+from deep_translator import GoogleTranslator
+from requests.adapters import HTTPAdapter
+
+# "google", "local" ou "http"
+DEFAULT_PROVIDER = environ.get("TRANSLATION_PROVIDER") or "google"
+# espera simulada pelo provedor local, para testes de carga
+LOCAL_LATENCY_MS = float(environ.get("TRANSLATION_LOCAL_LATENCY_MS") or 0)
+# API no formato do LibreTranslate, ex.: http://localhost:5000/translate
+HTTP_URL = environ.get("TRANSLATION_HTTP_URL") or ""
+HTTP_API_KEY = environ.get("TRANSLATION_HTTP_API_KEY") or ""
+HTTP_TIMEOUT = float(environ.get("TRANSLATION_HTTP_TIMEOUT") or 10)
+HTTP_POOL_SIZE = int(environ.get("TRANSLATION_HTTP_POOL_SIZE") or 10)
+
+
+class GoogleProvider:
+    name = "google"
+
+    def translate(self, text, source, target) -> str:
+        return GoogleTranslator(source=source, target=target).translate(text)
+
+
+class LocalProvider:
+    """
+    Tradutor de mentira, sem rede: a "tradução" é o texto marcado com
+    os idiomas, sempre a mesma para a mesma entrada. Serve para medir a
+    aplicação sem depender de um serviço externo.
+    """
+
+    name = "local"
+
+    def __init__(self, latency_ms=LOCAL_LATENCY_MS):
+        self.latency = latency_ms / 1000
+
+    def translate(self, text, source, target) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return f"[{source}>{target}] {text}"
+
+
+class HTTPProvider:
+    """
+    Cliente de um tradutor próprio com a API do LibreTranslate. Uma
+    única sessão mantém até `pool_size` conexões abertas, reaproveitadas
+    entre as requisições e as threads do servidor.
+    """
+
+    name = "http"
+
+    def __init__(
+        self,
+        url=HTTP_URL,
+        api_key=HTTP_API_KEY,
+        timeout=HTTP_TIMEOUT,
+        pool_size=HTTP_POOL_SIZE,
+    ):
+        if not url:
+            raise ValueError("defina TRANSLATION_HTTP_URL")
+        self.url = url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def translate(self, text, source, target) -> str:
+        payload = {
+            "q": text,
+            "source": source,
+            "target": target,
+            "format": "text",
+        }
+        if self.api_key:
+            payload["api_key"] = self.api_key
+        response = self.session.post(
+            self.url, json=payload, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()["translatedText"]
+
+    def close(self):
+        self.session.close()
+
+
+PROVIDERS = {
+    "google": GoogleProvider,
+    "local": LocalProvider,
+    "http": HTTPProvider,
+}
+
+_provider = None
+_lock = threading.Lock()
+
+
+def create_provider(name=DEFAULT_PROVIDER):
+    if name not in PROVIDERS:
+        raise ValueError(f"provedor de tradução desconhecido: {name}")
+    return PROVIDERS[name]()
+
+
+def get_provider():
+    """O provedor em uso, criado no primeiro pedido a partir do ambiente."""
+    global _provider
+    with _lock:
+        if _provider is None:
+            _provider = create_provider()
+        return _provider
+
+
+def set_provider(provider):
+    """Troca o provedor em uso; aceita o nome ou o próprio provedor."""
+    global _provider
+    if isinstance(provider, str):
+        provider = create_provider(provider)
+    with _lock:
+        _provider = provider
+    return provider
@@ -1,5 +1,6 @@
 import pytest
 from src.database.db import db
+from services.translation_cache import translation_cache
 
 
 @pytest.fixture(autouse=True)
@@ -7,4 +8,7 @@ def set_test_environment():
     db.get_collection("languages").drop()
     db.get_collection("history").drop()
     db.get_collection("users").drop()
+    db.get_collection("translation_cache").drop()
+    # o cache em memória é o mesmo usado pelos controllers
+    translation_cache.clear()
     yield
@@ -1,3 +1,4 @@
+import pytest
 from flask.testing import FlaskClient
 from bs4 import BeautifulSoup
 from src.models.language_model import LanguageModel
@@ -134,3 +135,58 @@ def test_post_reverse(app_test: FlaskClient):
     assert selected_to, "Uma opção 'translate-to' deve estar selecionada"
 
     assert selected_to["value"] == "en"
+
+
+def test_repeated_translation_uses_cache(app_test: FlaskClient, monkeypatch):
+    calls = []
+
+    class Provider:
+        name = "fake"
+
+        def translate(self, text, source, target):
+            calls.append(text)
+            return "Olá, mundo"
+
+    monkeypatch.setattr(
+        "controllers.translate_controller.get_provider", Provider
+    )
+    form = {
+        "text-to-translate": "Hello,  world",
+        "translate-from": "en",
+        "translate-to": "pt",
+    }
+
+    app_test.post("/", data=form)
+    response = app_test.post(
+        "/reverse", data={**form, "text-to-translate": " Hello, world "}
+    )
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    assert soup.find("textarea", {"class": "from-text"}).text == "Olá, mundo"
+    assert calls == ["Hello,  world"]
+
+    stats = app_test.get("/translation-cache/stats").get_json()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_broken_provider_is_not_hidden_by_the_fallback(
+    app_test: FlaskClient, monkeypatch
+):
+    def get_provider():
+        raise ValueError("defina TRANSLATION_HTTP_URL")
+
+    monkeypatch.setattr(
+        "controllers.translate_controller.get_provider", get_provider
+    )
+
+    with pytest.raises(ValueError):
+        app_test.post(
+            "/",
+            data={
+                "text-to-translate": "Hello, I like videogame",
+                "translate-from": "en",
+                "translate-to": "pt",
+            },
+        )
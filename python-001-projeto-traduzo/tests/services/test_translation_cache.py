@@ -0,0 +1,160 @@
+from datetime import datetime
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from src.database.db import db
+from src.models.translation_cache_model import TranslationCacheModel
+from src.services.translation_cache import (
+    LRUCache,
+    TranslationCache,
+    normalize_text,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Translator:
+    name = "fake"
+
+    def __init__(self, result="olá"):
+        self.result = result
+        self.calls = []
+
+    def translate(self, text, source, target):
+        self.calls.append((text, source, target))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def new_cache(size=8, ttl=60, clock=None):
+    return TranslationCache(LRUCache(size, ttl, clock or Clock()))
+
+
+def test_normalize_text():
+    assert normalize_text("  Café \n com\tleite ") == "Café com leite"
+    assert normalize_text(None) == ""
+
+
+def test_lru_evicts_least_recently_used_and_expired_entries():
+    clock = Clock()
+    memory = LRUCache(2, 10, clock)
+    memory.put("a", 1)
+    memory.put("b", 2)
+    memory.get("a")
+    memory.put("c", 3)
+
+    assert memory.get("b") is None
+    assert memory.get("a") == 1
+    assert memory.evictions == 1
+
+    clock.now = 10
+    assert memory.get("a") is None
+    assert len(memory) == 1
+
+
+def test_second_tier_serves_other_processes():
+    translator = Translator()
+    new_cache().get_or_translate("hello", "EN", "pt", translator)
+    # outro processo: memória vazia, mesmo banco
+    other = new_cache()
+
+    assert other.get_or_translate(" hello ", "en", "pt", translator) == "olá"
+    assert translator.calls == [("hello", "EN", "pt")]
+    assert other.stats()["store_hits"] == 1
+    assert other.get_or_translate("hello", "en", "pt", translator) == "olá"
+    assert other.stats()["memory_hits"] == 1
+
+
+def test_expired_translations_are_fetched_again():
+    translator = Translator()
+    new_cache().get_or_translate("hello", "en", "pt", translator)
+    db["translation_cache"].update_many(
+        {}, {"$set": {"created_at": datetime(2000, 1, 1)}}
+    )
+
+    new_cache().get_or_translate("hello", "en", "pt", translator)
+    assert len(translator.calls) == 2
+
+
+def test_failures_are_not_cached():
+    translator = Translator(RuntimeError("offline"))
+    cache = new_cache()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            cache.get_or_translate("hello", "en", "pt", translator)
+
+    assert len(translator.calls) == 2
+    assert db["translation_cache"].count_documents({}) == 0
+
+
+def test_store_errors_do_not_break_translation(monkeypatch):
+    def lookup(key):
+        raise ServerSelectionTimeoutError("down")
+
+    monkeypatch.setattr(TranslationCacheModel, "lookup", lookup)
+    cache = TranslationCache(LRUCache(8, 60), TranslationCacheModel)
+
+    assert cache.get_or_translate("hi", "en", "pt", Translator()) == "olá"
+    assert cache.stats()["store_errors"] == 1
+
+
+def test_trim_keeps_the_newest_translations():
+    TranslationCacheModel.store_many(
+        [(f"text {number}", "en", "pt", "fake", "x") for number in range(5)]
+    )
+    db["translation_cache"].update_one(
+        {"text": "text 0"}, {"$set": {"created_at": datetime(2000, 1, 1)}}
+    )
+
+    assert TranslationCacheModel.trim(4) == 1
+    texts = {document["text"] for document in db["translation_cache"].find()}
+    assert "text 0" not in texts
+
+
+def test_warm_from_history():
+    db["history"].insert_many(
+        [
+            {
+                "text_to_translate": "Do you love music?",
+                "translate_from": "en",
+                "translate_to": "pt",
+                "translated": "Você ama música?",
+            },
+            {
+                "text_to_translate": "Foo",
+                "translate_from": "en",
+                "translate_to": "pt",
+                "translated": "",
+            },
+        ]
+    )
+    translator = Translator()
+    cache = new_cache()
+
+    assert cache.warm_from_history(db["history"], "fake") == 1
+    assert (
+        cache.get_or_translate("Do you love music?", "en", "pt", translator)
+        == "Você ama música?"
+    )
+    assert translator.calls == []
+
+
+def test_translations_are_cached_per_provider():
+    google, local = Translator("olá"), Translator("[en>pt] hello")
+    google.name, local.name = "google", "local"
+    cache = new_cache()
+
+    cache.get_or_translate("hello", "en", "pt", google)
+    assert cache.get_or_translate("hello", "en", "pt", local) == (
+        "[en>pt] hello"
+    )
+    assert len(google.calls) == len(local.calls) == 1
@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services.translation_providers import (
+    HTTPProvider,
+    LocalProvider,
+    create_provider,
+    get_provider,
+    set_provider,
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 mantém a conexão aberta entre as requisições
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    payloads = []
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        Handler.connections.add(self.client_address)
+        Handler.payloads.append(payload)
+        body = json.dumps({"translatedText": payload["q"].upper()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def engine_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    Handler.connections.clear()
+    Handler.payloads.clear()
+    yield f"http://127.0.0.1:{server.server_port}/translate"
+    server.shutdown()
+    server.server_close()
+
+
+def test_local_provider_is_deterministic():
+    provider = LocalProvider()
+
+    assert provider.translate("olá", "pt", "en") == "[pt>en] olá"
+    assert provider.translate("olá", "pt", "en") == "[pt>en] olá"
+
+
+def test_http_provider_reuses_the_connection(engine_url):
+    provider = HTTPProvider(engine_url, api_key="secret")
+
+    assert provider.translate("hello", "en", "pt") == "HELLO"
+    assert provider.translate("world", "en", "pt") == "WORLD"
+    provider.close()
+
+    assert len(Handler.connections) == 1
+    assert Handler.payloads[0] == {
+        "q": "hello",
+        "source": "en",
+        "target": "pt",
+        "format": "text",
+        "api_key": "secret",
+    }
+
+
+def test_http_provider_requires_an_url():
+    with pytest.raises(ValueError):
+        HTTPProvider("")
+
+
+def test_providers_are_selected_by_name():
+    assert create_provider("local").name == "local"
+    with pytest.raises(ValueError):
+        create_provider("babelfish")
+
+    previous = get_provider()
+    try:
+        set_provider("local")
+        assert isinstance(get_provider(), LocalProvider)
+    finally:
+        set_provider(previous)
+
+
+def test_invalid_provider_stops_the_app_at_startup():
+    # um processo novo, para importar o app com outra configuração
+    environment = {
+        **os.environ,
+        "TRANSLATION_PROVIDER": "http",
+        "TRANSLATION_HTTP_URL": "",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", "import app"],
+        cwd="src",
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "TRANSLATION_HTTP_URL" in result.stderr